@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Record HTML fixtures for the offline benchmarks
+Downloads listing pages and organization pages from huggingface.co into
+benchmarks/fixtures/ so the benchmark corpus can be refreshed when the site
+layout changes. Run occasionally - the benchmarks themselves never hit the network.
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+import requests
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+HF_BASE = "https://huggingface.co"
+DEFAULT_PAGES = [0, 1047, 6614]
+DEFAULT_ORGS = ["huggingface", "meta-llama"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Record HuggingFace pages as benchmark fixtures')
+    parser.add_argument('--pages', type=str, default=','.join(str(page) for page in DEFAULT_PAGES),
+                        help='Comma-separated listing page numbers')
+    parser.add_argument('--orgs', type=str, default=','.join(DEFAULT_ORGS),
+                        help='Comma-separated organization slugs')
+    parser.add_argument('--delay', type=float, default=1.0, help='Seconds between requests')
+    
+    args = parser.parse_args()
+    
+    session = requests.Session()
+    session.headers.update({
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+        'Accept-Language': 'en-US,en;q=0.5',
+    })
+    
+    targets = [(f"{HF_BASE}/organizations?p={page}", f"organizations_p{page}.html")
+               for page in args.pages.split(',') if page]
+    targets += [(f"{HF_BASE}/{org}", f"org_{org}.html") for org in args.orgs.split(',') if org]
+    
+    FIXTURES_DIR.mkdir(exist_ok=True)
+    for url, filename in targets:
+        response = session.get(url, timeout=60)
+        response.raise_for_status()
+        (FIXTURES_DIR / filename).write_text(response.text, encoding='utf-8')
+        print(f"Saved {url} -> {filename} ({len(response.text)} bytes)")
+        time.sleep(args.delay)
+
+
+if __name__ == "__main__":
+    main()
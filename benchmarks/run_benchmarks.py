@@ -0,0 +1,506 @@
+#!/usr/bin/env python3
+"""
+Offline Benchmark Suite
+Measures throughput and memory of the scrapers' hot paths on saved HTML
+fixtures (no network access):
+- Phase 1 listing page parsing: HuggingFaceOrgScraper.parse_page against the
+  whole-page anchor scan it replaced
+- Phase 2 organization page extraction (extract_organization_details with a
+  fake session serving the fixtures)
+- Phase 2 link categorization: the host-table LinkClassifier against the
+  per-pattern regex scan it replaced
+- Phase 2 checkpoint save/load, CSV output and link-table post-processing at
+  1k, 10k and 300k rows
+- Phase 2 resident state (dataframe, checkpoint records, status index) after
+  resuming a fully scraped 323k-organization run
+- Startup: wall time of fresh interpreters running cli.py commands and
+  importing each entry-point module
+
+Results are written as JSON to benchmarks/results/ so runs can be compared:
+    python benchmarks/run_benchmarks.py
+    python benchmarks/run_benchmarks.py --sizes 1000,10000
+    python benchmarks/run_benchmarks.py --compare OLD.json NEW.json
+"""
+
+import argparse
+import gc
+import json
+import logging
+import os
+import platform
+import re
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+BENCH_DIR = Path(__file__).resolve().parent
+REPO_ROOT = BENCH_DIR.parent
+FIXTURES_DIR = BENCH_DIR / "fixtures"
+RESULTS_DIR = BENCH_DIR / "results"
+DEFAULT_SIZES = [1000, 10000, 300000]
+MEMORY_ROWS = 323000  # organizations on huggingface.co at the time of writing
+
+sys.path.insert(0, str(REPO_ROOT))
+
+
+class FakeResponse:
+    """Minimal stand-in for requests.Response serving fixture HTML."""
+
+    def __init__(self, text: str, status_code: int = 200):
+        self.text = text
+        self.content = text.encode('utf-8')
+        self.status_code = status_code
+
+    def raise_for_status(self):
+        pass
+
+
+def load_fixtures(prefix: str) -> Dict[str, str]:
+    """Fixture HTML by file stem for files starting with prefix."""
+    return {path.stem: path.read_text(encoding='utf-8') for path in sorted(FIXTURES_DIR.glob(f"{prefix}*.html"))}
+
+
+def measure(name: str, fn: Callable[[], int], min_time: float, params: Optional[Dict] = None) -> Dict:
+    """
+    Time fn repeatedly for at least min_time seconds, then run it once more
+    under tracemalloc for peak memory.
+
+    Args:
+        name: Benchmark name
+        fn: Callable doing one batch of work and returning the number of operations
+        min_time: Minimum timed duration in seconds
+        params: Benchmark parameters recorded with the result
+
+    Returns:
+        Result record
+    """
+    ops = 0
+    runs = 0
+    start = time.perf_counter()
+    while True:
+        ops += fn()
+        runs += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    result = {
+        'name': name,
+        'params': params or {},
+        'runs': runs,
+        'ops': ops,
+        'seconds': elapsed,
+        'seconds_per_run': elapsed / runs,
+        'ops_per_second': ops / elapsed,
+        'peak_memory_mb': peak / 1e6,
+    }
+    print(f"  {name:<22} {json.dumps(params or {}):<22} {result['ops_per_second']:>12.1f} ops/s "
+          f"{result['seconds_per_run'] * 1000:>10.2f} ms/run {result['peak_memory_mb']:>9.1f} MB peak")
+    return result
+
+
+# Listing page exclusions and name clean-up used by Phase 1 before parse_cards, kept as the baseline
+LEGACY_EXCLUDED_PATHS = ['/models', '/datasets', '/spaces', '/docs', '/pricing', '/terms-of-service', '/privacy',
+                         '/users', '/login', '/join', '/settings', '/new', '/organizations']
+
+
+def legacy_parse_listing(html: str, base_url: str = "https://huggingface.co") -> List[tuple]:
+    """Whole-page parse, every <a> checked, names regex-stripped from the card text."""
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, 'lxml')
+    organizations = []
+    for link in soup.find_all('a', href=True):
+        href = link.get('href', '')
+        if (href.startswith('/') and href.count('/') == 1 and len(href) > 1 and not href.startswith('/#')
+                and href not in LEGACY_EXCLUDED_PATHS):
+            link_text = link.get_text(strip=True)
+            if 'follower' in link_text.lower():
+                org_name = link_text.split('•')[0].strip()
+                org_name = re.sub(r'\d+\.?\d*k?\s*models?', '', org_name, flags=re.IGNORECASE).strip()
+                org_name = re.sub(r'\d+\.?\d*k?\s*followers?', '', org_name, flags=re.IGNORECASE).strip()
+                org_name = re.sub(r'(Team|Enterprise|Company|Non-Profit|Community|University|company|non-profit|'
+                                  r'community|university|\+\s*)+$', '', org_name, flags=re.IGNORECASE).strip()
+                org_name = re.sub(r"'s profile picture.*$", '', org_name, flags=re.IGNORECASE).strip()
+                org_name = org_name.rstrip('+ ').strip()
+                org_url = f"{base_url}{href}"
+                if (org_name, org_url) not in organizations:
+                    organizations.append((org_name, org_url))
+    return organizations
+
+
+def bench_listing_parse(min_time: float) -> List[Dict]:
+    """Phase 1 listing page parsing, pages per second (ops/s counts pages)."""
+    from hf_org_scraper import HuggingFaceOrgScraper
+
+    scraper = HuggingFaceOrgScraper()
+    pages = list(load_fixtures("organizations_").values())
+    params = {'pages': len(pages), 'cards': sum(len(scraper.parse_cards(html)) for html in pages)}
+
+    def run_legacy():
+        for html in pages:
+            legacy_parse_listing(html)
+        return len(pages)
+
+    def run():
+        for html in pages:
+            scraper.parse_page(html)
+        return len(pages)
+
+    return [
+        measure('listing_parse_legacy', run_legacy, min_time, params),
+        measure('listing_parse', run, min_time, params),
+    ]
+
+
+def make_phase2_scraper(rows: int, org_pages: Dict[str, str]):
+    """Phase 2 scraper over a synthetic input CSV of the given size."""
+    import pandas as pd
+    from phase2_detail_scraper import Phase2OrganizationScraper
+    from runtime_settings import DEFAULT_SETTINGS
+
+    slugs = [stem.replace('org_', '', 1) for stem in org_pages]
+    urls = [f"https://huggingface.co/{slugs[i % len(slugs)]}" for i in range(rows)]
+    pd.DataFrame({
+        'organization_name': [f"Organization {i}" for i in range(rows)],
+        'organization_url': urls,
+        'page_number': [i // 50 for i in range(rows)],
+    }).to_csv(f"input_{rows}.csv", index=False)
+
+    scraper = Phase2OrganizationScraper(f"input_{rows}.csv", f"output/detailed_{rows}.csv",
+                                        f"output/checkpoint_{rows}.json",
+                                        settings=DEFAULT_SETTINGS._replace(request_delay=0))  # no request pacing
+    html_by_url = {f"https://huggingface.co/{slug}": html for slug, html in zip(slugs, org_pages.values())}
+    scraper.session.get = lambda url, timeout=None: FakeResponse(html_by_url[url])
+    return scraper
+
+
+def bench_org_extract(min_time: float) -> List[Dict]:
+    """Phase 2 organization page parse + extraction, orgs per second."""
+    org_pages = load_fixtures("org_")
+    scraper = make_phase2_scraper(len(org_pages), org_pages)
+    urls = scraper.organizations_df['organization_url'].tolist()
+
+    def run():
+        for url in urls:
+            scraper.extract_organization_details(url)
+        return len(urls)
+
+    return [measure('org_extract', run, min_time, {'pages': len(urls)})]
+
+
+# Link patterns and scan used by Phase 2 before link_classifier.py, kept as the baseline
+LEGACY_LINK_PATTERNS = {
+    'github': [r'github\.com', r'gitlab\.com'],
+    'website': [r'https?://[a-zA-Z0-9\-\.]+\.[a-zA-Z]{2,}(?![^"\']*(?:huggingface|github|twitter|linkedin|facebook|instagram|youtube))'],
+    'social_media': [r'twitter\.com', r'x\.com', r'linkedin\.com', r'facebook\.com', r'instagram\.com', r'youtube\.com'],
+}
+
+
+def legacy_extract_links(soup, base_url: str = "https://huggingface.co") -> Dict[str, List[str]]:
+    """Regex-per-pattern link scan (one find_all per pattern)."""
+    results = {}
+    for link_type, pattern_list in LEGACY_LINK_PATTERNS.items():
+        found_links = []
+        for pattern in pattern_list:
+            for link in soup.find_all('a', href=re.compile(pattern, re.I)):
+                href = link.get('href', '')
+                if href and href.strip() and href not in found_links:
+                    if href.startswith('/'):
+                        href = base_url + href
+                    found_links.append(href)
+        results[link_type] = found_links or ['Null']
+    return results
+
+
+def bench_link_classify(min_time: float) -> List[Dict]:
+    """Phase 2 link categorization on parsed organization pages, pages per second."""
+    from bs4 import BeautifulSoup
+    from link_classifier import LinkClassifier
+
+    org_pages = load_fixtures("org_")
+    scraper = make_phase2_scraper(len(org_pages), org_pages)
+    soups = [BeautifulSoup(html, 'html.parser') for html in org_pages.values()]
+    hrefs = [[a.get('href') for a in soup.find_all('a', href=True)] for soup in soups]
+    params = {'pages': len(soups), 'links': sum(len(page) for page in hrefs)}
+
+    def run_legacy():
+        for soup in soups:
+            legacy_extract_links(soup)
+        return len(soups)
+
+    def run_classifier():
+        for soup in soups:
+            scraper.extract_links(soup)
+        return len(soups)
+
+    def run_classify_cold():
+        # New classifier per page: no cached URLs, host lookups only
+        for page in hrefs:
+            LinkClassifier().categorize(page)
+        return len(hrefs)
+
+    return [
+        measure('links_regex', run_legacy, min_time, params),
+        measure('links_classifier', run_classifier, min_time, params),
+        measure('links_classify_cold', run_classify_cold, min_time, params),
+    ]
+
+
+def bench_persistence(sizes: List[int], min_time: float) -> List[Dict]:
+    """Phase 2 checkpoint save/load, CSV output and link table at each dataset size."""
+    from link_table import build_link_table
+
+    org_pages = load_fixtures("org_")
+    results = []
+
+    for rows in sizes:
+        scraper = make_phase2_scraper(rows, org_pages)
+
+        # Fill the dataframe and checkpoint as if every row had been scraped
+        samples = [scraper.extract_organization_details(url) for url in
+                   scraper.organizations_df['organization_url'].iloc[:len(org_pages)]]
+        for column in samples[0]:
+            scraper.organizations_df[column] = [samples[i % len(samples)][column] for i in range(rows)]
+        scraper.checkpoint_data = {
+            'last_processed_index': rows - 1,
+            'processed_organizations': [{'index': i, **samples[i % len(samples)]} for i in range(rows)],
+        }
+
+        def save_checkpoint():
+            scraper.write_checkpoint()
+            return rows
+
+        def load_checkpoint():
+            scraper.load_checkpoint()
+            return rows
+
+        def save_csv():
+            scraper.save_progress()
+            return rows
+
+        def link_table():
+            return len(build_link_table(scraper.organizations_df, scraper.link_classifier))
+
+        params = {'rows': rows}
+        results.append(measure('checkpoint_save', save_checkpoint, min_time, params))
+        results[-1]['file_mb'] = os.path.getsize(scraper.checkpoint_file) / 1e6
+        results.append(measure('checkpoint_load', load_checkpoint, min_time, params))
+        results.append(measure('csv_save', save_csv, min_time, params))
+        results[-1]['file_mb'] = os.path.getsize(scraper.output_csv_path) / 1e6
+        results.append(measure('link_table', link_table, min_time, params))
+
+    return results
+
+
+def bench_memory(rows: int) -> List[Dict]:
+    """
+    Memory held by a Phase 2 scraper resumed from a checkpoint covering every row:
+    total traced allocations after construction, and what each piece of state
+    frees when dropped.
+    """
+    import pandas as pd
+    from phase2_detail_scraper import Phase2OrganizationScraper
+    from runtime_settings import DEFAULT_SETTINGS
+
+    org_pages = load_fixtures("org_")
+    sample_scraper = make_phase2_scraper(len(org_pages), org_pages)
+    samples = [sample_scraper.extract_organization_details(url)
+               for url in sample_scraper.organizations_df['organization_url']]
+    del sample_scraper
+
+    slugs = [stem.replace('org_', '', 1) for stem in org_pages]
+    pd.DataFrame({
+        'organization_name': [f"Organization {i}" for i in range(rows)],
+        'organization_url': [f"https://huggingface.co/{slugs[i % len(slugs)]}-{i}" for i in range(rows)],
+        'page_number': [i // 50 for i in range(rows)],
+    }).to_csv(f"memory_input_{rows}.csv", index=False)
+    with open(f"output/memory_checkpoint_{rows}.json", 'w') as f:
+        json.dump({'last_processed_index': rows - 1,
+                   'processed_organizations': [{'index': i, **samples[i % len(samples)]} for i in range(rows)]}, f)
+
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    scraper = Phase2OrganizationScraper(f"memory_input_{rows}.csv", f"output/memory_detailed_{rows}.csv",
+                                        f"output/memory_checkpoint_{rows}.json")
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    retained, peak = tracemalloc.get_traced_memory()
+
+    components = {}
+    for name in ('checkpoint_data', 'status_index', 'organizations_df'):
+        before = tracemalloc.get_traced_memory()[0]
+        delattr(scraper, name)
+        gc.collect()
+        components[name] = (before - tracemalloc.get_traced_memory()[0]) / 1e6
+    tracemalloc.stop()
+
+    result = {
+        'name': 'phase2_state',
+        'params': {'rows': rows},
+        'runs': 1,
+        'ops': rows,
+        'seconds': elapsed,
+        'seconds_per_run': elapsed,
+        'ops_per_second': rows / elapsed,
+        'peak_memory_mb': peak / 1e6,
+        'retained_mb': retained / 1e6,
+        'components_mb': components,
+    }
+    print(f"  {'phase2_state':<22} {json.dumps(result['params']):<22} {result['retained_mb']:>9.1f} MB retained "
+          f"{result['peak_memory_mb']:>9.1f} MB peak {elapsed:>7.1f} s resume | "
+          + ', '.join(f"{name}={mb:.1f}MB" for name, mb in components.items()))
+    return [result]
+
+
+# (name, python arguments) timed from a fresh interpreter in the startup group
+STARTUP_COMMANDS = [
+    ('startup_cli_help', ['cli.py', '--help']),
+    ('startup_cli_status', ['cli.py', 'status']),
+    ('startup_bare_python', ['-c', 'pass']),
+    ('import_hf_org_scraper', ['-c', 'import hf_org_scraper']),
+    ('import_phase2_scraper', ['-c', 'import phase2_detail_scraper']),
+    ('import_huggingface_scraper', ['-c', 'import huggingface_scraper']),
+    ('import_run_phase2', ['-c', 'import run_phase2']),
+]
+
+
+def bench_startup(min_time: float) -> List[Dict]:
+    """Process start-to-exit time for CLI commands and entry-point imports (runs/s = starts/s)."""
+    env = dict(os.environ, PYTHONPATH=str(REPO_ROOT), PYTHONDONTWRITEBYTECODE='1')
+    results = []
+    for name, arguments in STARTUP_COMMANDS:
+        command = [sys.executable] + [str(REPO_ROOT / arg) if arg.endswith('.py') else arg for arg in arguments]
+
+        def run():
+            subprocess.run(command, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+            return 1
+
+        try:
+            run()  # warm the OS file cache and compile .pyc files once
+        except subprocess.CalledProcessError:
+            print(f"  {name:<22} skipped (command failed, missing dependency?)")
+            continue
+        results.append(measure(name, run, min_time, {'command': ' '.join(arguments)}))
+    return results
+
+
+def environment() -> Dict:
+    """Run metadata for comparing results."""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_ROOT,
+                                capture_output=True, text=True).stdout.strip()
+    except OSError:
+        commit = None
+
+    versions = {}
+    for module in ('bs4', 'lxml.etree', 'pandas'):
+        try:
+            versions[module] = getattr(__import__(module, fromlist=['_']), '__version__', None)
+        except ImportError:
+            versions[module] = None
+
+    return {
+        'timestamp': datetime.now().isoformat(),
+        'git_commit': commit,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'versions': versions,
+    }
+
+
+def compare(old_path: str, new_path: str):
+    """Print a side-by-side comparison of two result files."""
+    with open(old_path) as f:
+        old = json.load(f)
+    with open(new_path) as f:
+        new = json.load(f)
+
+    def key(result):
+        return result['name'], json.dumps(result['params'], sort_keys=True)
+
+    old_results = {key(result): result for result in old['results']}
+    print(f"{'benchmark':<22} {'params':<16} {'old ops/s':>12} {'new ops/s':>12} {'speedup':>8} "
+          f"{'old MB':>8} {'new MB':>8}")
+    for result in new['results']:
+        before = old_results.get(key(result))
+        if before is None:
+            continue
+        print(f"{result['name']:<22} {key(result)[1]:<16} {before['ops_per_second']:>12.1f} "
+              f"{result['ops_per_second']:>12.1f} {result['ops_per_second'] / before['ops_per_second']:>7.2f}x "
+              f"{before['peak_memory_mb']:>8.1f} {result['peak_memory_mb']:>8.1f}")
+        if 'retained_mb' in result and 'retained_mb' in before:
+            print(f"{'':<22} {'retained MB':<16} {before['retained_mb']:>12.1f} {result['retained_mb']:>12.1f} "
+                  + ' '.join(f"{name}: {before['components_mb'].get(name, 0):.1f} -> {mb:.1f}"
+                             for name, mb in result['components_mb'].items()))
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description='Run the offline scraper benchmarks')
+    parser.add_argument('--sizes', type=str, default=','.join(str(size) for size in DEFAULT_SIZES),
+                        help='Comma-separated row counts for persistence benchmarks (default: 1000,10000,300000)')
+    parser.add_argument('--memory-rows', type=int, default=MEMORY_ROWS,
+                        help=f'Organizations in the resident-memory benchmark (default: {MEMORY_ROWS})')
+    parser.add_argument('--min-time', type=float, default=1.0,
+                        help='Minimum seconds to time each benchmark (default: 1.0)')
+    parser.add_argument('--only', type=str, default=None,
+                        help='Comma-separated benchmark groups to run: '
+                             'listing,extract,links,persistence,memory,startup')
+    parser.add_argument('--output', type=str, default=None,
+                        help='Result file (default: benchmarks/results/bench_<timestamp>.json)')
+    parser.add_argument('--compare', nargs=2, metavar=('OLD', 'NEW'),
+                        help='Compare two result files instead of running')
+
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    sizes = [int(size) for size in args.sizes.split(',') if size]
+    groups = set(args.only.split(',')) if args.only else {'listing', 'extract', 'links', 'persistence', 'memory',
+                                                          'startup'}
+    output = Path(args.output).resolve() if args.output else \
+        RESULTS_DIR / f"bench_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+
+    # The scrapers write logs and output relative to the working directory;
+    # keep those out of the repository
+    workdir = tempfile.mkdtemp(prefix='webscrap_bench_')
+    os.chdir(workdir)
+    os.makedirs('output', exist_ok=True)
+    logging.disable(logging.WARNING)
+
+    print(f"Running benchmarks in {workdir}")
+    results = []
+    if 'listing' in groups:
+        results += bench_listing_parse(args.min_time)
+    if 'extract' in groups:
+        results += bench_org_extract(args.min_time)
+    if 'links' in groups:
+        results += bench_link_classify(args.min_time)
+    if 'persistence' in groups:
+        results += bench_persistence(sizes, args.min_time)
+    if 'memory' in groups:
+        results += bench_memory(args.memory_rows)
+    if 'startup' in groups:
+        results += bench_startup(args.min_time)
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump({'meta': environment(), 'results': results}, f, indent=2)
+    print(f"Results saved to: {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""
+Run-to-Run Change Feed
+Compares a scraper's output with the snapshot kept from its previous run and
+writes the difference as JSON lines, so consumers ingest the delta instead of
+reloading and diffing the whole CSV.
+
+Rows are matched with a hash join on organization_url. Each side gets a
+64-bit hash of its field values, so only rows whose hashes differ are
+compared field by field.
+
+Feed lines (output/changes/<name>_<timestamp>.jsonl, only written if something changed):
+    {"op": "added",    "organization_url": ..., "record": {field: value, ...}}
+    {"op": "removed",  "organization_url": ..., "record": {field: value, ...}}
+    {"op": "modified", "organization_url": ..., "changes": {field: [old, new], ...}}
+
+The snapshot is replaced only after the feed has been written. A crash in
+between means the next run reports the same changes again (at-least-once).
+"""
+
+import itertools
+import json
+import logging
+import os
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, Optional
+
+import pandas as pd
+
+from config import CHANGE_FEED_DIR, CHANGE_FEED_IGNORED_FIELDS
+from persistence_writer import durable_open
+
+KEY = 'organization_url'
+
+logger = logging.getLogger(__name__)
+
+
+def _normalize(df: pd.DataFrame, fields) -> pd.DataFrame:
+    """Key + fields as strings ('' for missing), one row per key (last occurrence wins)."""
+    df = df.reindex(columns=[KEY] + fields)
+    df = df[df[KEY].notna()].drop_duplicates(KEY, keep='last')
+    return df.astype(object).where(df.notna(), '').astype(str).set_index(KEY)
+
+
+def diff_frames(old_df: pd.DataFrame, new_df: pd.DataFrame,
+                ignore: Iterable[str] = ()) -> Iterator[Dict]:
+    """
+    Changes from old_df to new_df, keyed by organization_url.
+
+    Args:
+        old_df: Previous run's data
+        new_df: This run's data
+        ignore: Fields whose changes are not reported (e.g. scrape timestamps)
+
+    Yields:
+        Feed entries (see module docstring): added, then removed, then modified
+    """
+    ignore = set(ignore) | {KEY}
+    fields = [column for column in new_df.columns if column not in ignore]
+    fields += [column for column in old_df.columns if column not in ignore and column not in fields]
+    old, new = _normalize(old_df, fields), _normalize(new_df, fields)
+
+    # Hash join on the key: one row hash per side, compared in a single merge
+    joined = pd.merge(
+        pd.util.hash_pandas_object(old, index=False).rename('old_hash'),
+        pd.util.hash_pandas_object(new, index=False).rename('new_hash'),
+        left_index=True, right_index=True, how='outer')
+    added = joined.index[joined['old_hash'].isna()]
+    removed = joined.index[joined['new_hash'].isna()]
+    modified = joined.index[joined['old_hash'].notna() & joined['new_hash'].notna()
+                            & (joined['old_hash'] != joined['new_hash'])]
+
+    for op, side, keys in (('added', new, added), ('removed', old, removed)):
+        rows = side.loc[side.index.intersection(keys, sort=False)]
+        for url, record in zip(rows.index, rows.to_dict('records')):
+            yield {'op': op, KEY: url, 'record': record}
+
+    old_rows, new_rows = old.loc[modified], new.loc[modified]
+    differs = (old_rows != new_rows).to_numpy()
+    for position, url in enumerate(modified):
+        changed = differs[position].nonzero()[0]
+        yield {'op': 'modified', KEY: url,
+               'changes': {fields[i]: [old_rows.iat[position, i], new_rows.iat[position, i]] for i in changed}}
+
+
+class ChangeFeed:
+    """Snapshot + feed files for one scraper output (e.g. 'phase1', 'phase2')."""
+
+    def __init__(self, name: str, feed_dir: str = CHANGE_FEED_DIR,
+                 ignore: Iterable[str] = CHANGE_FEED_IGNORED_FIELDS, durability: str = 'atomic'):
+        """
+        Args:
+            name: Output name; files are <feed_dir>/<name>_snapshot.csv and <name>_<timestamp>.jsonl
+            feed_dir: Directory for snapshot and feed files
+            ignore: Fields whose changes are not reported
+            durability: How feed and snapshot files are written (see persistence_writer)
+        """
+        self.name = name
+        self.feed_dir = feed_dir
+        self.ignore = tuple(ignore)
+        self.durability = durability
+        self.snapshot_path = os.path.join(feed_dir, f"{name}_snapshot.csv")
+
+    def publish(self, df: pd.DataFrame) -> Optional[Dict[str, int]]:
+        """
+        Write the changes since the last published run and make df the new snapshot.
+
+        On the first run every organization is reported as added.
+
+        Args:
+            df: This run's complete output
+
+        Returns:
+            {'added': n, 'removed': n, 'modified': n, 'path': feed file}, or None if nothing changed
+        """
+        os.makedirs(self.feed_dir, exist_ok=True)
+        if os.path.exists(self.snapshot_path):
+            previous = pd.read_csv(self.snapshot_path, dtype=str, keep_default_na=False)
+        else:
+            previous = pd.DataFrame(columns=df.columns)
+
+        changes = diff_frames(previous, df, self.ignore)
+        first = next(changes, None)
+        if first is None:
+            logger.info(f"Change feed ({self.name}): no changes since the previous run")
+            return None
+
+        counts = {'added': 0, 'removed': 0, 'modified': 0}
+        feed_path = os.path.join(self.feed_dir, f"{self.name}_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}.jsonl")
+        with durable_open(feed_path, self.durability) as f:
+            for entry in itertools.chain([first], changes):
+                counts[entry['op']] += 1
+                f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+
+        with durable_open(self.snapshot_path, self.durability) as f:
+            df.to_csv(f, index=False)
+        logger.info(f"Change feed ({self.name}): {counts['added']} added, {counts['removed']} removed, "
+                    f"{counts['modified']} modified -> {feed_path}")
+        return {**counts, 'path': feed_path}
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+HuggingFace Scraper Command Line
+One entry point for the scrapers and tools. Each subcommand imports its
+module (and with it pandas, bs4, ...) only when it runs, so quick commands
+such as `status` start in well under a second.
+
+    python cli.py crawl [--start N --end N ...]      Phase 1: organization listing (hf_org_scraper.py)
+    python cli.py details [--refresh ...]             Phase 2: organization details (phase2_detail_scraper.py)
+    python cli.py status                              Progress of both phases and the work queue
+    python cli.py export links|index|shards [...]     Link table, search index, merge of sharded runs
+    python cli.py query "text" [--host ...]           Search the index built by `export index`
+    python cli.py bench [--only ...]                  Offline benchmarks (benchmarks/run_benchmarks.py)
+
+Arguments after the subcommand are passed to the underlying tool; use
+`python cli.py <command> --help` for its options.
+"""
+
+import argparse
+import csv
+import importlib
+import importlib.util
+import os
+import sys
+from typing import Callable, Dict, List, Optional, Tuple
+
+from config import CHECKPOINT_FILE, INPUT_CSV_PATH, LISTING_END_PAGE, OUTPUT_CSV_PATH, WORK_QUEUE_DB
+
+PHASE1_CHECKPOINT = "output/checkpoint.txt"
+BENCHMARKS_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmarks", "run_benchmarks.py")
+
+# Subcommand -> (module, function taking argv, leading arguments, help); module None = this file
+COMMANDS: Dict[str, Tuple[Optional[str], str, List[str], str]] = {
+    'crawl': ('hf_org_scraper', 'main', [], 'Phase 1: scrape the organization listing'),
+    'details': ('phase2_detail_scraper', 'main', [], 'Phase 2: scrape organization detail pages'),
+    'status': (None, 'status', [], 'Show progress of both phases and the work queue'),
+    'export': (None, 'export', [], 'Build the link table (links), search index (index) or merge shards (shards)'),
+    'query': ('org_index', 'main', ['query'], 'Search the organization index'),
+    'bench': (None, 'bench', [], 'Run the offline benchmarks'),
+}
+
+# export target -> (module, function taking argv, leading arguments)
+EXPORTS: Dict[str, Tuple[str, str, List[str]]] = {
+    'links': ('link_table', 'main', []),
+    'index': ('org_index', 'main', ['build']),
+    'shards': ('phase2_shards', 'main', []),
+}
+
+
+def status_bucket(status: str) -> str:
+    """scrape_status -> bucket, as status_index.status_bucket (which needs pandas)"""
+    if not status:
+        return 'pending'
+    if status == 'success':
+        return 'success'
+    return 'error' if status.startswith('error') else 'failed'
+
+
+def count_rows(path: str, column: Optional[str] = None) -> Tuple[int, Dict[str, int]]:
+    """
+    Stream a CSV once.
+
+    Returns:
+        (number of rows, {status bucket: count} of `column`, empty without a column)
+    """
+    rows, buckets = 0, {}
+    with open(path, newline='', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        position = header.index(column) if column in header else None
+        for row in reader:
+            rows += 1
+            if position is not None:
+                bucket = status_bucket(row[position] if position < len(row) else '')
+                buckets[bucket] = buckets.get(bucket, 0) + 1
+    return rows, buckets
+
+
+def status(argv: Optional[List[str]] = None):
+    """Progress summary read straight from the output files (no pandas)"""
+    parser = argparse.ArgumentParser(prog='cli.py status', description='Show scrape progress')
+    parser.add_argument('--queue-db', default=WORK_QUEUE_DB, help=f'Work queue database (default: {WORK_QUEUE_DB})')
+    args = parser.parse_args(argv)
+
+    print("Phase 1 (listing)")
+    if os.path.exists(PHASE1_CHECKPOINT):
+        with open(PHASE1_CHECKPOINT) as f:
+            last_page = f.read().strip()
+        if last_page.isdigit():
+            done = int(last_page) + 1
+            print(f"  last page:      {last_page} of {LISTING_END_PAGE} "
+                  f"({min(done / (LISTING_END_PAGE + 1), 1.0):.1%})")
+    if os.path.exists(INPUT_CSV_PATH):
+        rows, _ = count_rows(INPUT_CSV_PATH)
+        print(f"  organizations:  {rows} in {INPUT_CSV_PATH}")
+    else:
+        print(f"  not started ({INPUT_CSV_PATH} not found)")
+
+    print("Phase 2 (details)")
+    if os.path.exists(OUTPUT_CSV_PATH):
+        rows, buckets = count_rows(OUTPUT_CSV_PATH, 'scrape_status')
+        done = rows - buckets.get('pending', 0)
+        print(f"  organizations:  {rows} in {OUTPUT_CSV_PATH}")
+        print(f"  scraped:        {done} ({done / rows:.1%})" if rows else "  scraped:        0")
+        print("  status:         " + ', '.join(f"{bucket} {count}" for bucket, count in sorted(buckets.items())))
+    else:
+        print(f"  not started ({OUTPUT_CSV_PATH} not found)")
+    if os.path.exists(CHECKPOINT_FILE):
+        print(f"  checkpoint:     {CHECKPOINT_FILE} ({os.path.getsize(CHECKPOINT_FILE) / 1e6:.1f} MB)")
+
+    if os.path.exists(args.queue_db):
+        from work_queue import WorkQueue
+        queue = WorkQueue(args.queue_db)
+        print(f"Work queue ({args.queue_db})")
+        for name in queue.queues():
+            print(f"  {name:<15} " + ', '.join(f"{state} {count}" for state, count in queue.stats(name).items()))
+        queue.close()
+
+
+def export(argv: Optional[List[str]] = None):
+    """Dispatch `export <target> ...` to the exporting tool"""
+    if not argv or argv[0] not in EXPORTS:
+        print(f"usage: cli.py export {{{','.join(EXPORTS)}}} [options]  (e.g. cli.py export index --help)")
+        sys.exit(2)
+    module, function, leading = EXPORTS[argv[0]]
+    getattr(importlib.import_module(module), function)(leading + argv[1:])
+
+
+def bench(argv: Optional[List[str]] = None):
+    """Run benchmarks/run_benchmarks.py (not an importable package, so loaded by path)"""
+    spec = importlib.util.spec_from_file_location('run_benchmarks', BENCHMARKS_SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    module.main(argv)
+
+
+def resolve(command: str) -> Callable[[Optional[List[str]]], None]:
+    """Import a subcommand's module and return its entry function (taking argv)"""
+    module, function, leading, _ = COMMANDS[command]
+    if module is None:
+        entry = globals()[function]
+    else:
+        entry = getattr(importlib.import_module(module), function)
+    return lambda argv: entry(leading + list(argv or []))
+
+
+def main(argv: Optional[List[str]] = None):
+    """Parse the subcommand and hand the remaining arguments to it"""
+    parser = argparse.ArgumentParser(
+        prog='cli.py', description='HuggingFace organization scraper',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog='commands:\n' + '\n'.join(f"  {name:<10} {help_text}" for name, (_, _, _, help_text) in COMMANDS.items()))
+    parser.add_argument('command', choices=COMMANDS, metavar='command', help='Subcommand (see below)')
+    parser.add_argument('args', nargs=argparse.REMAINDER, help='Arguments for the subcommand')
+    args = parser.parse_args(argv)
+
+    resolve(args.command)(args.args)
+
+
+if __name__ == "__main__":
+    main()
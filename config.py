@@ -3,6 +3,8 @@ Google Sheets Integration Configuration
 Configure how the scraper syncs with Google Sheets
 """
 
+import os
+
 # ============================================================================
 # GOOGLE SHEETS CONFIGURATION
 # ============================================================================
@@ -19,13 +21,44 @@ GOOGLE_CREDENTIALS_PATH = "webscrapping-481404-c6ff8576cf4a.json"
 GOOGLE_SHEET_NAME = "HuggingFace Organizations Live"
 
 # Upload data to Google Sheets every N organizations scraped
-# Lower value = more frequent updates, higher = faster scraping
+# Uploads run on a background thread (result_sinks.py), so this only trades
+# API calls against how current the sheet is; it applies to every result sink
 UPLOAD_INTERVAL = 25  # Every 25 organizations
 
+# ============================================================================
+# RESULT SINKS (result_sinks.py)
+# ============================================================================
+
+# Where Phase 2 streams results besides its output CSV and checkpoint:
+#   "csv"    - append-only results log (output/phase2_results.csv)
+#   "sqlite" - one row per organization (output/phase2_results.db)
+#   "sheets" - the Google Sheet above (needs gspread and the credentials file)
+# None by default: results leave the machine only when asked for (--sink sheets)
+RESULT_SINKS = []
+
+# Upload pending results at least this often (seconds), even below UPLOAD_INTERVAL
+SINK_FLUSH_INTERVAL = 30
+
+# Organizations waiting for a slow sink before the writer thread waits for it
+SINK_MAX_PENDING = 5000
+
+# Fields ignored when deciding whether a re-scraped result differs from the uploaded one
+SINK_IGNORED_FIELDS = ('scrape_timestamp',)
+
 # ============================================================================
 # SCRAPING CONFIGURATION
 # ============================================================================
 
+# Site the scrapers talk to. Override with the HF_BASE_URL environment variable
+# (or --base-url) to point them at a local mock server (mock_hf_server.py)
+HF_BASE_URL = os.getenv("HF_BASE_URL", "https://huggingface.co").rstrip('/')
+# Origin of the organization URLs written to the Phase 1 CSV, whatever site was scraped
+CANONICAL_HF_BASE = "https://huggingface.co"
+
+# Phase 1 listing pages (p=0 .. p=6614, 6615 pages in total)
+LISTING_START_PAGE = 0
+LISTING_END_PAGE = 6614
+
 # Maximum retries for failed requests
 MAX_RETRIES = 3
 
@@ -36,8 +69,113 @@ RETRY_DELAYS = [30, 60, 180]  # 30s → 60s → 3min
 REQUEST_TIMEOUT = 60
 
 # Delay between requests (seconds) - be respectful!
+# With several concurrent fetches this is the spacing between request starts
 REQUEST_DELAY = 1
 
+# Organization pages Phase 2 fetches at once, and the upper limit for it
+SCRAPE_CONCURRENCY = 1
+MAX_CONCURRENCY = 32
+
+# Phase 2 re-reads the settings above from this JSON file while it runs, e.g.
+# {"concurrency": 4, "request_delay": 0.5}; keys left out keep their defaults.
+# The file is checked every CONTROL_POLL_INTERVAL seconds (SIGHUP: right away)
+RUNTIME_CONTROL_FILE = "output/phase2_control.json"
+CONTROL_POLL_INTERVAL = 5
+
+# Extra hosts for link classification (link_classifier.py). A host also matches
+# its subdomains. Format: "host": ("category", "platform"), where category is
+# "github" (code hosting), "social_media", "website" or "ignore" (dropped)
+LINK_PLATFORMS = {
+    # "bsky.app": ("social_media", "bluesky"),
+    # "codeberg.org": ("github", "codeberg"),
+}
+
+# Site chrome filter (site_chrome.py): links found on at least this fraction of
+# recently scraped pages (header/footer/banners) are dropped before link
+# classification. Learning starts after CHROME_MIN_PAGES pages, and an
+# observation counts half after CHROME_HALFLIFE_PAGES pages
+CHROME_LINK_THRESHOLD = 0.6
+CHROME_MIN_PAGES = 20
+CHROME_HALFLIFE_PAGES = 1000
+
+# ============================================================================
+# PERSISTENCE CONFIGURATION
+# ============================================================================
+
+# Phase 2 results are written by a background thread: the checkpoint and CSV
+# are rewritten after this many results or this many seconds, whichever first
+PERSIST_BATCH_SIZE = 10
+PERSIST_INTERVAL = 30
+
+# How checkpoint/CSV files are written:
+#   "none"   - overwrite in place (fastest; a crash mid-write can truncate the file)
+#   "atomic" - write a temp file and rename it over the old one
+#   "fsync"  - atomic, and fsync before the rename (survives power loss)
+PERSIST_DURABILITY = "atomic"
+
+# ============================================================================
+# MEMORY CONFIGURATION (memory_watchdog.py)
+# ============================================================================
+
+# Log resident memory (RSS) every N organizations
+MEMORY_LOG_EVERY = 1000
+
+# Pause taking new organizations while RSS is above this many MB, so queued
+# results can drain (0 = no ceiling); intake resumes after MEMORY_MAX_PAUSE
+# seconds even if RSS stays high
+MEMORY_CEILING_MB = 0
+MEMORY_MAX_PAUSE = 300
+
+# Garbage collector cadence: parse trees are torn down explicitly, so the
+# automatic collector can run less often (generation 0 threshold, CPython
+# default 700) plus a full collection every GC_COLLECT_EVERY organizations
+GC_GEN0_THRESHOLD = 10000
+GC_COLLECT_EVERY = 1000
+
+# ============================================================================
+# CHANGE FEED CONFIGURATION
+# ============================================================================
+
+# With --change-feed, each finished run writes the organizations added, removed
+# or modified since the previous run as JSON lines to this directory, next to
+# the snapshot the next run is compared against
+CHANGE_FEED_DIR = "output/changes"
+
+# Fields that change on every re-scrape and are not reported as modifications
+CHANGE_FEED_IGNORED_FIELDS = ('last_updated', 'scrape_timestamp')
+
+# ============================================================================
+# STALE REFRESH CONFIGURATION
+# ============================================================================
+
+# Re-scrape an organization once its data is older than this (days)
+REFRESH_TTL_DAYS = 30
+
+# How much activity shortens the TTL: ttl / (1 + weight * log10(1 + model_count))
+# 0 = same TTL for every organization
+REFRESH_ACTIVITY_WEIGHT = 1.0
+
+# Maximum number of refresh requests per calendar day
+REFRESH_DAILY_BUDGET = 5000
+
+# ============================================================================
+# WORK QUEUE CONFIGURATION (multi-process runs)
+# ============================================================================
+
+# SQLite work queue shared by all workers (put it on a shared filesystem for multi-node runs)
+WORK_QUEUE_DB = "output/work_queue.db"
+
+# Tasks leased per request and how long a lease lasts before it returns to the queue (seconds)
+# Leases are renewed after every finished task, so this only needs to cover one slow task
+WORK_QUEUE_BATCH_SIZE = 10
+WORK_QUEUE_LEASE_SECONDS = 900
+
+# Give up on a task after this many failed attempts or expired leases
+WORK_QUEUE_MAX_ATTEMPTS = 3
+
+# Seconds an idle worker waits before checking for expired leases again
+WORK_QUEUE_POLL_INTERVAL = 30
+
 # ============================================================================
 # OUTPUT CONFIGURATION
 # ============================================================================
@@ -58,6 +196,14 @@ CHECKPOINT_FILE = "output/phase2_checkpoint.json"
 # Log file location
 LOG_DIR = "output"
 
+# Fraction of successful organizations echoed to the log/console (failures are
+# always logged). Every result is still written to output/phase2_events_*.jsonl
+LOG_SUCCESS_SAMPLE_RATE = 0.05
+
+# Seconds between [STATS] lines (throughput, stage latencies, ETA); also
+# rewrites output/phase1_stats.json / output/phase2_stats.json
+STATS_REPORT_INTERVAL = 60
+
 # ============================================================================
 # SETUP INSTRUCTIONS
 # ============================================================================
@@ -65,21 +211,22 @@ LOG_DIR = "output"
 """
 To enable Google Sheets integration:
 
-1. Set GOOGLE_SHEETS_ENABLED = True above
+1. Run Phase 2 with --sink sheets (or add "sheets" to RESULT_SINKS above)
 
-2. Create Google Sheets credentials:
-   python -c "from src.google_sheets_uploader import setup_google_sheets_integration; setup_google_sheets_integration()"
+2. Install the client library:
+   pip install gspread
 
-3. Download credentials JSON from Google Cloud Console
-   - Save as 'google_credentials.json' in project root
+3. Create a service account in Google Cloud Console and download its credentials JSON
+   - Save it in the project root and point GOOGLE_CREDENTIALS_PATH at it
 
 4. Share your Google Sheet with the service account email
    - Email is in the credentials JSON file
 
 5. Update GOOGLE_SHEET_NAME if needed (default: "HuggingFace Organizations Live")
 
-6. Adjust UPLOAD_INTERVAL for frequency (lower = more updates, slower scraping)
+6. Adjust UPLOAD_INTERVAL for frequency (lower = more API calls, fresher sheet)
 
-7. Run the scraper - it will automatically sync to Google Sheets!
+7. Run the scraper - it will sync to Google Sheets in the background!
+   (or choose sinks per run: python phase2_detail_scraper.py --sink sheets,sqlite)
 
 """
@@ -0,0 +1,70 @@
+"""
+Extraction Result Cache
+Profile extraction results keyed by URL and extraction mode in a small SQLite
+file, so repeat runs reuse earlier results instead of fetching (and paying for
+LLM extraction) again. A result is only reused by the mode that produced it:
+a cheap local parse never stands in for an llm or hybrid extraction.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+DEFAULT_CACHE_FILE = "output/extraction_cache.db"
+
+
+class ExtractionCache:
+    """(URL, mode) -> extraction result, with the source that produced it ('local', 'llm' or 'hybrid')."""
+
+    def __init__(self, db_path: str = DEFAULT_CACHE_FILE):
+        """
+        Args:
+            db_path: SQLite file (created if missing)
+        """
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.db_path = db_path
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()  # one connection shared by worker threads
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS extractions (
+                url        TEXT NOT NULL,
+                mode       TEXT NOT NULL,
+                source     TEXT NOT NULL,
+                result     TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                PRIMARY KEY (url, mode)
+            )
+        """)
+        self.conn.commit()
+
+    def get(self, url: str, mode: str) -> Optional[Dict]:
+        """Cached result for a URL extracted in this mode, or None."""
+        with self._lock:
+            row = self.conn.execute("SELECT result FROM extractions WHERE url = ? AND mode = ?",
+                                    (url, mode)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, url: str, mode: str, result: Dict, source: str):
+        """Store (or replace) the result for a URL extracted in this mode."""
+        with self._lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO extractions (url, mode, source, result, created_at) VALUES (?, ?, ?, ?, ?)",
+                (url, mode, source, json.dumps(result, ensure_ascii=False), time.time()))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM extractions").fetchone()[0]
+
+    def close(self):
+        self.conn.close()
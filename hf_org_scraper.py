@@ -6,41 +6,72 @@ Saves checkpoints after each page to CSV
 
 import os
 import csv
+import re
 import time
 import logging
 import requests
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer, Tag
+from collections import namedtuple
 from pathlib import Path
 from typing import List, Tuple, Optional
 
+from config import (CANONICAL_HF_BASE, CHANGE_FEED_IGNORED_FIELDS, HF_BASE_URL, LISTING_END_PAGE, LISTING_START_PAGE,
+                    MEMORY_CEILING_MB, STATS_REPORT_INTERVAL, WORK_QUEUE_DB, WORK_QUEUE_BATCH_SIZE, WORK_QUEUE_LEASE_SECONDS,
+                    WORK_QUEUE_MAX_ATTEMPTS, WORK_QUEUE_POLL_INTERVAL)
+from memory_watchdog import MemoryWatchdog, parse_html, tune_gc
+from profiling import ScrapeProfiler
+from scrape_logging import setup_queue_logging
+from scrape_stats import ScrapeStats
+from work_queue import WorkQueue, default_worker_id
+
 # ============================================================================
 # CONFIGURATION
 # ============================================================================
 
-BASE_URL = "https://huggingface.co/organizations"
-HF_BASE = "https://huggingface.co"
+HF_BASE = HF_BASE_URL  # from config.py / HF_BASE_URL environment variable
+BASE_URL = f"{HF_BASE}/organizations"
 OUTPUT_DIR = Path("output")
 OUTPUT_CSV = OUTPUT_DIR / "huggingface_organizations.csv"
 CHECKPOINT_FILE = OUTPUT_DIR / "checkpoint.txt"
-START_PAGE = 0
-END_PAGE = 6614  # Updated based on actual page count (6615 pages total)
+STATS_FILE = OUTPUT_DIR / "phase1_stats.json"
+START_PAGE = LISTING_START_PAGE
+END_PAGE = LISTING_END_PAGE  # Updated based on actual page count (6615 pages total)
 DELAY_BETWEEN_PAGES = 1  # seconds between requests to be polite
 MAX_RETRIES = 3
 RETRY_DELAY = 5  # seconds to wait before retry
 RATE_LIMIT_WAIT = 30  # 30 seconds wait on 429 Too Many Requests
+PAGES_QUEUE = "phase1_pages"  # work queue name for listing pages
+
+# Listing page parsing: only <a href="/org-slug"> anchors are parsed
+ORG_HREF_PATTERN = re.compile(r'^/[^/?#]+$')
+CARD_ANCHORS = SoupStrainer('a', href=ORG_HREF_PATTERN)
+CARD_HEADINGS = ['h4', 'h3', 'h2']
+SITE_PATHS = frozenset({'/models', '/datasets', '/spaces', '/docs', '/pricing', '/terms-of-service', '/privacy',
+                        '/users', '/login', '/join', '/settings', '/new', '/organizations'})
+# "68 models", "1.2k followers", "1 follower"
+COUNT_PATTERN = re.compile(r'^([\d.,]+)\s*([km]?)\s*(model|follower)s?$', re.IGNORECASE)
+# Fallback when no element holds a count on its own: counts anywhere in the card text
+COUNT_TEXT_PATTERN = re.compile(r'(?<![\w.])(\d[\d.,]*)\s*([km]?)\s*(model|follower)s?\b', re.IGNORECASE)
+COUNT_SUFFIXES = {'': 1, 'k': 1000, 'm': 1000000}
+ORG_TYPES = frozenset({'company', 'university', 'non-profit', 'community', 'team', 'enterprise',
+                       'classroom', 'government'})
+
+# Organization card on a listing page
+OrgCard = namedtuple('OrgCard', ['name', 'url', 'org_type', 'model_count', 'follower_count'])
+
+
+def parse_count(number: str, suffix: str) -> int:
+    """'1.2', 'k' -> 1200"""
+    return round(float(number.replace(',', '')) * COUNT_SUFFIXES[suffix.lower()])
+
 
 # ============================================================================
 # LOGGING SETUP
 # ============================================================================
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('hf_scraper.log', encoding='utf-8'),
-        logging.StreamHandler()
-    ]
-)
+# Handlers are installed by main() (queue-backed: file/console writes happen on
+# a background thread, off the scraping loop)
+LOG_FILE = 'hf_scraper.log'
 logger = logging.getLogger(__name__)
 
 # ============================================================================
@@ -50,8 +81,24 @@ logger = logging.getLogger(__name__)
 class HuggingFaceOrgScraper:
     """Scraper for HuggingFace organizations pages."""
     
-    def __init__(self):
-        """Initialize the scraper."""
+    def __init__(self, base_url: str = HF_BASE, change_feed: bool = False,
+                 memory_ceiling_mb: float = MEMORY_CEILING_MB):
+        """
+        Initialize the scraper.
+        
+        Args:
+            base_url: Site to scrape (default: HF_BASE; a mock server for load tests).
+                      Only used for requests: stored URLs start with CANONICAL_HF_BASE
+            change_feed: After a complete run, write organizations added/removed/renamed
+                         since the previous one to output/changes (see change_feed)
+            memory_ceiling_mb: Pause before the next page while RSS is above this (0: never)
+        """
+        self.base_url = base_url.rstrip('/')
+        self.change_feed = None
+        if change_feed:
+            from change_feed import ChangeFeed  # pandas; only needed with --change-feed
+            # page_number shifts whenever organizations are added, so it is not a change
+            self.change_feed = ChangeFeed('phase1', ignore=CHANGE_FEED_IGNORED_FIELDS + ('page_number',))
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
@@ -62,6 +109,11 @@ class HuggingFaceOrgScraper:
         # Create output directory
         OUTPUT_DIR.mkdir(exist_ok=True)
         
+        # Per-stage timings and throughput/ETA reporting
+        self.stats = ScrapeStats('pages', str(STATS_FILE), STATS_REPORT_INTERVAL, logger)
+        # RSS logged per 1k organizations
+        self.watchdog = MemoryWatchdog('orgs', ceiling_mb=memory_ceiling_mb, log=logger)
+        
     def get_last_checkpoint(self) -> int:
         """Get the last successfully scraped page number from checkpoint file."""
         if CHECKPOINT_FILE.exists():
@@ -74,7 +126,7 @@ class HuggingFaceOrgScraper:
     
     def save_checkpoint(self, page_num: int):
         """Save the current page number as checkpoint."""
-        with open(CHECKPOINT_FILE, 'w') as f:
+        with self.stats.stage('checkpoint'), open(CHECKPOINT_FILE, 'w') as f:
             f.write(str(page_num))
     
     def init_csv(self, resume: bool = False):
@@ -87,11 +139,74 @@ class HuggingFaceOrgScraper:
     
     def append_to_csv(self, organizations: List[Tuple[str, str]], page_num: int):
         """Append organization data to CSV file."""
-        with open(OUTPUT_CSV, 'a', newline='', encoding='utf-8') as f:
+        with self.stats.stage('csv'), open(OUTPUT_CSV, 'a', newline='', encoding='utf-8') as f:
             writer = csv.writer(f)
             for name, url in organizations:
                 writer.writerow([name, url, page_num])
     
+    def parse_page(self, html: str) -> List[Tuple[str, str]]:
+        """
+        Parse organization cards from a listing page.
+        
+        Args:
+            html: Listing page HTML
+            
+        Returns:
+            List of tuples (organization_name, organization_url)
+        """
+        return [(card.name, card.url) for card in self.parse_cards(html)]
+    
+    def parse_cards(self, html: str) -> List[OrgCard]:
+        """
+        Structured organization cards of a listing page, in page order.
+        
+        Only anchors to single-segment paths (/org-slug) and their contents are
+        parsed. An anchor is a card if it shows a follower count; the name
+        comes from its heading and the type and counts from its spans.
+        
+        Args:
+            html: Listing page HTML
+            
+        Returns:
+            List of OrgCard (one per organization URL)
+        """
+        cards = []
+        seen = set()
+        with parse_html(html, 'lxml', parse_only=CARD_ANCHORS) as soup:
+            for anchor in soup.find_all('a', recursive=False):
+                card = self.parse_card(anchor)
+                if card is not None and card.url not in seen:
+                    seen.add(card.url)
+                    cards.append(card)
+        return cards
+    
+    def parse_card(self, anchor: Tag) -> Optional[OrgCard]:
+        """One card anchor -> OrgCard, or None if it is not an organization card."""
+        if anchor['href'] in SITE_PATHS:
+            return None
+        org_type, counts = '', {}
+        for span in anchor.find_all('span'):
+            text = span.get_text(strip=True)
+            match = COUNT_PATTERN.match(text)
+            if match:
+                number, suffix, kind = match.groups()
+                counts[kind.lower()] = parse_count(number, suffix)
+            elif not org_type and text.lower() in ORG_TYPES:
+                org_type = text.lower()
+        if 'follower' not in counts:
+            # Counts are not in spans of their own (markup changed): read them from the card text
+            for number, suffix, kind in COUNT_TEXT_PATTERN.findall(anchor.get_text(' ', strip=True)):
+                counts.setdefault(kind.lower(), parse_count(number, suffix))
+            if 'follower' not in counts:
+                return None
+            org_type = org_type or next((text.lower() for text in anchor.stripped_strings
+                                         if text.lower() in ORG_TYPES), '')
+        
+        heading = anchor.find(CARD_HEADINGS)
+        name = heading.get_text(strip=True) if heading else next(anchor.stripped_strings, '')
+        return OrgCard(name, f"{CANONICAL_HF_BASE}{anchor['href']}", org_type,
+                       counts.get('model', 0), counts['follower'])
+    
     def scrape_page(self, page_num: int) -> Optional[List[Tuple[str, str]]]:
         """
         Scrape a single page of organizations.
@@ -100,84 +215,45 @@ class HuggingFaceOrgScraper:
             page_num: Page number to scrape (0-indexed)
             
         Returns:
-            List of tuples (organization_name, organization_url) or None on failure
+            List of tuples (organization_name, organization_url), or None on failure
+            (including a page before END_PAGE without any organization cards)
         """
-        url = f"{BASE_URL}?p={page_num}"
+        url = f"{self.base_url}/organizations?p={page_num}"
         
         for attempt in range(MAX_RETRIES):
+            if attempt:
+                self.stats.count('retries')
             try:
-                response = self.session.get(url, timeout=30)
+                with self.stats.stage('fetch'):
+                    response = self.session.get(url, timeout=30)
+                self.stats.count('requests')
+                self.stats.count('bytes', len(response.content))
                 response.raise_for_status()
                 
-                soup = BeautifulSoup(response.text, 'lxml')
-                organizations = []
-                
-                # Find all organization links
-                # Organizations are in anchor tags that link to organization profiles
-                # Pattern: <a href="/org-name">Organization Name</a>
+                with self.stats.stage('parse'):
+                    organizations = self.parse_page(response.text)
                 
-                # Look for organization cards/links in the main content
-                # Based on the page structure, org links are direct links to /{org-slug}
-                for link in soup.find_all('a', href=True):
-                    href = link.get('href', '')
-                    
-                    # Filter for organization profile links
-                    # They follow pattern: /org-name (single path segment, not /models, /datasets, etc.)
-                    if (href.startswith('/') and 
-                        href.count('/') == 1 and 
-                        len(href) > 1 and
-                        not href.startswith('/#') and
-                        href not in ['/models', '/datasets', '/spaces', '/docs', '/pricing', 
-                                    '/terms-of-service', '/privacy', '/users', '/login',
-                                    '/join', '/settings', '/new', '/organizations']):
-                        
-                        # Check if it's an organization link by looking at the link content
-                        # Organization cards typically contain "followers" text
-                        link_text = link.get_text(strip=True)
-                        
-                        if 'follower' in link_text.lower():
-                            # Extract organization name (first part before additional info)
-                            # Format varies:
-                            # - "Org Name Team Company • X models • Y followers" 
-                            # - "Org NameTeam68 models • Y followers" (no bullet before models)
-                            import re
-                            
-                            # First split by bullet if present
-                            org_name = link_text.split('•')[0].strip()
-                            
-                            # Remove model count patterns like "68 models", "1.05k models"
-                            org_name = re.sub(r'\d+\.?\d*k?\s*models?', '', org_name, flags=re.IGNORECASE).strip()
-                            
-                            # Remove follower count patterns
-                            org_name = re.sub(r'\d+\.?\d*k?\s*followers?', '', org_name, flags=re.IGNORECASE).strip()
-                            
-                            # Clean up common suffixes and type labels
-                            # These labels appear without spaces sometimes
-                            org_name = re.sub(r'(Team|Enterprise|Company|Non-Profit|Community|University|company|non-profit|community|university|\+\s*)+$', '', org_name, flags=re.IGNORECASE).strip()
-                            
-                            # Also handle "'s profile picture" if present in text
-                            org_name = re.sub(r"'s profile picture.*$", '', org_name, flags=re.IGNORECASE).strip()
-                            
-                            # Remove any trailing special characters
-                            org_name = org_name.rstrip('+ ').strip()
-                            
-                            org_url = f"{HF_BASE}{href}"
-                            
-                            # Avoid duplicates within same page
-                            if (org_name, org_url) not in organizations:
-                                organizations.append((org_name, org_url))
+                if not organizations and page_num < END_PAGE:
+                    # Only pages past the end of the listing are empty; treat it as a failed page
+                    # so the checkpoint does not move past it
+                    self.stats.count('errors')
+                    logger.error(f"Page {page_num}: no organization cards found (listing markup changed, "
+                                 f"or the listing ends before page {END_PAGE})")
+                    return None
                 
                 logger.info(f"Page {page_num}: Found {len(organizations)} organizations")
                 return organizations
                 
             except requests.exceptions.HTTPError as e:
                 if e.response is not None and e.response.status_code == 429:
+                    self.stats.count('rate_limited')
                     # Rate limited - wait 3 minutes and retry
                     logger.warning(f"Rate limited (429) on page {page_num}. Waiting {RATE_LIMIT_WAIT} seconds (3 minutes) before retrying...")
                     time.sleep(RATE_LIMIT_WAIT)
                     # Don't count this as a failed attempt - retry immediately
                     continue
                 else:
+                    self.stats.count('errors')
                     logger.warning(f"Attempt {attempt + 1}/{MAX_RETRIES} failed for page {page_num}: {e}")
                     if attempt < MAX_RETRIES - 1:
                         time.sleep(RETRY_DELAY)
@@ -186,6 +262,7 @@ class HuggingFaceOrgScraper:
                         return None
                         
             except requests.exceptions.RequestException as e:
+                self.stats.count('errors')
                 logger.warning(f"Attempt {attempt + 1}/{MAX_RETRIES} failed for page {page_num}: {e}")
                 if attempt < MAX_RETRIES - 1:
                     time.sleep(RETRY_DELAY)
@@ -195,13 +272,15 @@ class HuggingFaceOrgScraper:
         
         return None
     
-    def run(self, start_page: Optional[int] = None, end_page: Optional[int] = None):
+    def run(self, start_page: Optional[int] = None, end_page: Optional[int] = None,
+            max_pages: Optional[int] = None):
         """
         Run the scraper for the specified page range.
         
         Args:
             start_page: Starting page number (default: resume from checkpoint or 0)
             end_page: Ending page number (default: END_PAGE)
+            max_pages: Stop after this many pages (default: whole range)
         """
         # Determine starting page
         last_checkpoint = self.get_last_checkpoint()
@@ -219,11 +298,14 @@ class HuggingFaceOrgScraper:
         
         if end_page is None:
             end_page = END_PAGE
+        if max_pages is not None:
+            end_page = min(end_page, start_page + max_pages - 1)
         
         # Initialize CSV
         self.init_csv(resume=resume)
         
         total_orgs = 0
+        completed = True
         
         logger.info(f"Starting scrape from page {start_page} to {end_page}")
         
@@ -234,25 +316,122 @@ class HuggingFaceOrgScraper:
                 if organizations:
                     self.append_to_csv(organizations, page_num)
                     total_orgs += len(organizations)
+                self.watchdog.tick(len(organizations))
                 
                 # Save checkpoint after each successful page
                 self.save_checkpoint(page_num)
+                self.stats.item_done()
+                self.stats.maybe_report(end_page - page_num)
                 
                 # Progress update every 100 pages
                 if page_num % 100 == 0:
                     logger.info(f"Progress: Page {page_num}/{end_page} | Total organizations: {total_orgs}")
             else:
                 logger.error(f"Failed to scrape page {page_num}. Stopping.")
+                completed = False
                 break
             
             # Be polite to the server
             time.sleep(DELAY_BETWEEN_PAGES)
         
+        self.stats.report(0)
         logger.info(f"Scraping complete! Total organizations collected: {total_orgs}")
         logger.info(f"Data saved to: {OUTPUT_CSV}")
+        
+        # Only a full listing can be diffed (a partial one would report every
+        # organization on the remaining pages as removed)
+        if completed and end_page == END_PAGE:
+            self.publish_changes()
+    
+    def publish_changes(self):
+        """Write the change feed for the current OUTPUT_CSV (no-op without --change-feed)."""
+        if self.change_feed is None:
+            return
+        import pandas as pd
+        try:
+            self.change_feed.publish(pd.read_csv(OUTPUT_CSV, dtype=str, keep_default_na=False))
+        except Exception as e:
+            logger.error(f"Failed to write change feed: {e}")
+    
+    def enqueue_pages(self, queue: WorkQueue, start_page: int, end_page: int) -> int:
+        """Add listing pages start_page..end_page to the work queue."""
+        added = queue.enqueue(PAGES_QUEUE, ((page_num, {'page': page_num})
+                                            for page_num in range(start_page, end_page + 1)))
+        logger.info(f"Enqueued {added} new pages ({start_page}-{end_page}). Queue: {queue.stats(PAGES_QUEUE)}")
+        return added
+    
+    def run_queue_worker(self, queue: WorkQueue, worker_id: str):
+        """
+        Scrape listing pages leased from the work queue until none are left.
+        
+        Results are stored in the queue; use export_queue_results() to write the CSV.
+        
+        Args:
+            queue: Shared work queue
+            worker_id: Unique id of this worker
+        """
+        logger.info(f"Worker {worker_id} started. Queue: {queue.stats(PAGES_QUEUE)}")
+        scraped = 0
+        
+        try:
+            while True:
+                tasks = queue.lease(PAGES_QUEUE, worker_id, WORK_QUEUE_BATCH_SIZE, WORK_QUEUE_LEASE_SECONDS,
+                                    WORK_QUEUE_MAX_ATTEMPTS)
+                
+                if not tasks:
+                    stats = queue.stats(PAGES_QUEUE)
+                    if stats['leased'] == 0 and stats['expired'] == 0 and stats['pending'] == 0:
+                        break
+                    # Other workers still hold leases - wait in case one of them dies
+                    time.sleep(WORK_QUEUE_POLL_INTERVAL)
+                    continue
+                
+                self.stats.maybe_report(queue.stats(PAGES_QUEUE)['pending'] + len(tasks))
+                for position, task in enumerate(tasks):
+                    page_num = task.payload['page']
+                    organizations = self.scrape_page(page_num)
+                    
+                    if organizations is not None:
+                        queue.complete(PAGES_QUEUE, task.key, {'organizations': organizations})
+                        scraped += 1
+                        self.stats.item_done()
+                        self.watchdog.tick(len(organizations))
+                    elif queue.fail(PAGES_QUEUE, task.key, 'all retries failed', WORK_QUEUE_MAX_ATTEMPTS):
+                        logger.warning(f"Page {page_num} returned to queue (attempt {task.attempts})")
+                    else:
+                        logger.error(f"Page {page_num} failed after {task.attempts} attempts")
+                    
+                    queue.renew(PAGES_QUEUE, worker_id, [t.key for t in tasks[position + 1:]],
+                                WORK_QUEUE_LEASE_SECONDS)
+                    
+                    # Be polite to the server
+                    time.sleep(DELAY_BETWEEN_PAGES)
+        finally:
+            released = queue.release(PAGES_QUEUE, worker_id)
+            if released:
+                logger.info(f"Returned {released} unfinished pages to the queue")
+        
+        self.stats.report(0)
+        logger.info(f"Worker {worker_id} finished: {scraped} pages scraped. Queue: {queue.stats(PAGES_QUEUE)}")
+    
+    def export_queue_results(self, queue: WorkQueue):
+        """Write all completed pages from the work queue to OUTPUT_CSV in page order."""
+        self.init_csv(resume=False)
+        
+        pages = sorted((payload['page'], result['organizations'])
+                       for _, payload, result in queue.results(PAGES_QUEUE))
+        total_orgs = 0
+        for page_num, organizations in pages:
+            self.append_to_csv(organizations, page_num)
+            total_orgs += len(organizations)
+        
+        logger.info(f"Exported {len(pages)} pages, {total_orgs} organizations to {OUTPUT_CSV}. "
+                    f"Queue: {queue.stats(PAGES_QUEUE)}")
+        if {page_num for page_num, _ in pages} >= set(range(START_PAGE, END_PAGE + 1)):
+            self.publish_changes()
 
 
-def main():
+def main(argv: Optional[List[str]] = None):
     """Main entry point."""
     import argparse
     
@@ -263,10 +442,46 @@ def main():
                         help=f'Ending page number (default: {END_PAGE})')
     parser.add_argument('--reset', action='store_true',
                         help='Reset checkpoint and start fresh')
+    parser.add_argument('--queue', nargs='?', const=WORK_QUEUE_DB, default=None,
+                        help=f'Pull pages from a shared work queue instead of a fixed range (default: {WORK_QUEUE_DB})')
+    parser.add_argument('--enqueue', action='store_true',
+                        help='With --queue: add pages --start..--end to the queue and exit')
+    parser.add_argument('--export', action='store_true',
+                        help='With --queue: write completed pages from the queue to the CSV and exit')
+    parser.add_argument('--worker-id', default=None,
+                        help='With --queue: worker id (default: hostname-pid)')
+    parser.add_argument('--base-url', default=HF_BASE,
+                        help=f'Site to scrape, e.g. a local mock_hf_server.py (default: {HF_BASE})')
+    parser.add_argument('--change-feed', action='store_true',
+                        help='After a complete run (or --export), write organizations added/removed/renamed '
+                             'since the previous one as JSON lines to output/changes/')
+    parser.add_argument('--memory-ceiling', type=float, default=MEMORY_CEILING_MB, metavar='MB',
+                        help=f'Pause before the next page while RSS is above MB, 0 disables '
+                             f'(default: {MEMORY_CEILING_MB})')
+    parser.add_argument('--profile', type=int, metavar='N', default=None,
+                        help='Profile a run of N pages: writes a cProfile .prof file and tracemalloc '
+                             'allocation reports to output/profiles/')
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+    setup_queue_logging(LOG_FILE)
     
-    scraper = HuggingFaceOrgScraper()
+    if args.profile is not None and (args.profile < 1 or args.queue):
+        parser.error("--profile needs N >= 1 and cannot be combined with --queue")
+    
+    scraper = HuggingFaceOrgScraper(base_url=args.base_url, change_feed=args.change_feed,
+                                    memory_ceiling_mb=args.memory_ceiling)
+    tune_gc()
+    
+    if args.queue:
+        queue = WorkQueue(args.queue)
+        if args.enqueue:
+            scraper.enqueue_pages(queue, args.start or START_PAGE, args.end)
+        elif args.export:
+            scraper.export_queue_results(queue)
+        else:
+            scraper.run_queue_worker(queue, args.worker_id or default_worker_id())
+        queue.close()
+        return
     
     if args.reset:
         # Remove checkpoint and CSV to start fresh
@@ -278,7 +493,12 @@ def main():
             logger.info("Previous CSV removed")
         args.start = 0
     
-    scraper.run(start_page=args.start, end_page=args.end)
+    if args.profile:
+        with ScrapeProfiler('phase1') as profiler:
+            profiler.snapshot('start')
+            scraper.run(start_page=args.start, end_page=args.end, max_pages=args.profile)
+    else:
+        scraper.run(start_page=args.start, end_page=args.end)
 
 
 if __name__ == "__main__":
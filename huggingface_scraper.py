@@ -4,16 +4,28 @@ Extracts company names and social media links, saves to Excel
 """
 
 import os
-import time
+import json
 import logging
-from typing import List, Dict, Optional
+import threading
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, List, Dict, Optional, Tuple
 from urllib.parse import urljoin
 
-import pandas as pd
+import requests
+from bs4 import BeautifulSoup
+from openpyxl import Workbook
 from tqdm import tqdm
 from dotenv import load_dotenv
 from firecrawl import FirecrawlApp
 
+from config import HF_BASE_URL
+from extraction_cache import DEFAULT_CACHE_FILE, ExtractionCache
+from link_classifier import LinkClassifier
+from memory_watchdog import parse_html
+from rate_limiter import RateLimiter
+from scrape_logging import setup_queue_logging
+
 # Load environment variables
 load_dotenv()
 
@@ -22,23 +34,43 @@ load_dotenv()
 # ============================================================================
 
 FIRECRAWL_API_KEY = os.getenv("FIRECRAWL_API_KEY", "")
-HF_BASE_URL = "https://huggingface.co"
 OUTPUT_FILE = "huggingface_organizations.xlsx"
 RATE_LIMIT_DELAY = 2  # seconds between requests
 MAX_RETRIES = 3
 
+# Page-range runs (--start-page/--end-page)
+PROFILE_WORKERS = 4  # concurrent profile extractions
+LISTING_WORKERS = 2  # listing pages fetched ahead of the page being processed
+MAX_REQUESTS_PER_SECOND = 1.0 / RATE_LIMIT_DELAY  # shared by all workers (same pace as the old delay; raise with --rate)
+PAGE_CHECKPOINT_FILE = "output/firecrawl_pages.jsonl"  # one line per finished listing page
+
+# Output columns, in workbook order
+RECORD_COLUMNS = ["Company Name", "Org URL", "LinkedIn", "Twitter", "GitHub", "Instagram", "Facebook",
+                  "All Social Links"]
+
+# Platform names from the link classifier that map to output columns
+SOCIAL_PLATFORMS = ("linkedin", "twitter", "github", "instagram", "facebook")
+link_classifier = LinkClassifier()
+
+# Profile extraction:
+#   "llm"    - Firecrawl LLM extraction (app.extract) for every profile
+#   "hybrid" - parse the profile HTML locally; use app.extract only when a
+#              REQUIRED_FIELDS value is missing
+#   "local"  - local parsing only (no LLM calls for profiles)
+EXTRACTION_MODES = ("llm", "hybrid", "local")
+EXTRACTION_MODE = os.getenv("EXTRACTION_MODE", "hybrid")
+# The <h1> almost always yields a name, so the links are what shows whether
+# the local parse found the profile's content
+REQUIRED_FIELDS = ("company_name", "social_links")
+PROFILE_TIMEOUT = 30  # seconds, local profile fetch
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+
 # ============================================================================
 # LOGGING
 # ============================================================================
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('scraper.log', encoding='utf-8'),
-        logging.StreamHandler()
-    ]
-)
+# Handlers are installed by main() (queue-backed, see scrape_logging)
+LOG_FILE = 'scraper.log'
 logger = logging.getLogger(__name__)
 
 # ============================================================================
@@ -61,7 +93,7 @@ def scrape_org_list_page(app: FirecrawlApp, page_num: int) -> Optional[List[Dict
     Scrape organization listing page
     Returns list of org dicts with 'name' and 'link'
     """
-    url = f"https://huggingface.co/organizations?p={page_num}"
+    url = f"{HF_BASE_URL}/organizations?p={page_num}"
     
     try:
         logger.info(f"Scraping listing page: {url}")
@@ -110,6 +142,115 @@ def scrape_org_profile(app: FirecrawlApp, org_link: str) -> Optional[Dict]:
         logger.error(f"Error scraping profile {org_link}: {str(e)}")
         return None
 
+# ============================================================================
+# LOCAL / HYBRID PROFILE EXTRACTION
+# ============================================================================
+
+def fetch_profile_html(session: requests.Session, url: str) -> Optional[str]:
+    """
+    Fetch an organization profile page directly
+    Returns the HTML, or None on any error
+    """
+    try:
+        response = session.get(url, timeout=PROFILE_TIMEOUT)
+        if response.status_code == 200:
+            return response.text
+        logger.debug(f"HTTP {response.status_code} for {url}")
+    except requests.exceptions.RequestException as e:
+        logger.debug(f"Error fetching {url}: {str(e)}")
+    return None
+
+def parse_profile_html(html: str) -> Dict:
+    """
+    Extract company name and social links from profile HTML without an LLM
+    Returns dict with company_name and social_links (same shape as scrape_org_profile)
+    """
+    with parse_html(html) as soup:
+        return parse_profile_tree(soup)
+
+def parse_profile_tree(soup: BeautifulSoup) -> Dict:
+    """Profile fields from a parsed profile page (see parse_profile_html)"""
+    region = soup.find('main') or soup
+    
+    company_name = ""
+    heading = region.find('h1')
+    if heading:
+        company_name = heading.get_text(strip=True)
+    else:
+        # og:title is "slug (Full Name)"
+        og_title = soup.find('meta', attrs={'property': 'og:title'})
+        title = og_title.get('content', '') if og_title else ''
+        if title.endswith(')') and '(' in title:
+            company_name = title[title.rindex('(') + 1:-1].strip()
+    
+    links = link_classifier.categorize(a.get('href') for a in region.find_all('a', href=True))
+    social_links = [{"platform": link_classifier.platform(url), "url": url}
+                    for url in links['github'] + links['social_media']]
+    
+    return {"company_name": company_name, "social_links": social_links}
+
+def missing_fields(profile: Dict, required=REQUIRED_FIELDS) -> List[str]:
+    """Required profile fields that are empty"""
+    return [field for field in required if not profile.get(field)]
+
+def merge_profiles(local: Dict, llm: Dict) -> Dict:
+    """LLM profile with the locally found links it does not already have"""
+    merged = {"company_name": llm.get("company_name") or local.get("company_name", ""),
+              "social_links": list(llm.get("social_links") or [])}
+    known = {link.get("url") for link in merged["social_links"] if isinstance(link, dict)}
+    merged["social_links"] += [link for link in local.get("social_links", []) if link["url"] not in known]
+    return merged
+
+def get_org_profile(app: FirecrawlApp, org_link: str, mode: str = EXTRACTION_MODE,
+                    cache: Optional[ExtractionCache] = None,
+                    session: Optional[requests.Session] = None,
+                    throttle: Optional[Callable[[], None]] = None) -> Tuple[Optional[Dict], str]:
+    """
+    Get an organization profile using the configured extraction mode
+    throttle (e.g. a RateLimiter) is called before every network request
+    Results are cached per URL and mode; empty profiles, and local results
+    whose LLM escalation failed, are not cached so a later run tries again
+    Returns (profile or None, source) where source is 'cache', 'local', 'llm', 'hybrid',
+    or 'failed' when the profile page could not be fetched and no LLM extraction ran
+    """
+    full_url = urljoin(HF_BASE_URL, org_link)
+    throttle = throttle or (lambda: None)
+    
+    if cache is not None:
+        cached = cache.get(full_url, mode)
+        if cached is not None:
+            return cached, "cache"
+    
+    profile, source, cacheable = None, "failed", True
+    if mode in ("hybrid", "local"):
+        throttle()
+        html = fetch_profile_html(session or requests.Session(), full_url)
+        if html is not None:
+            profile, source = parse_profile_html(html), "local"
+            missing = missing_fields(profile)
+            if missing and mode == "hybrid":
+                logger.info(f"Local parse missing {', '.join(missing)} for {full_url}; using LLM extraction")
+                throttle()
+                llm_profile = scrape_org_profile(app, org_link)
+                if llm_profile is not None:
+                    profile, source = merge_profiles(profile, llm_profile), "hybrid"
+                else:
+                    cacheable = False
+        elif mode == "hybrid":
+            throttle()
+            profile, source = scrape_org_profile(app, org_link), "llm"
+    else:
+        throttle()
+        profile, source = scrape_org_profile(app, org_link), "llm"
+    
+    if profile is not None and cache is not None and cacheable and not is_empty_profile(profile):
+        cache.put(full_url, mode, profile, source)
+    return profile, source
+
+def is_empty_profile(profile: Dict) -> bool:
+    """No name and no links (e.g. an LLM extraction that returned nothing usable)"""
+    return not profile.get("company_name") and not profile.get("social_links")
+
 # ============================================================================
 # SOCIAL MEDIA EXTRACTION
 # ============================================================================
@@ -117,14 +258,11 @@ def scrape_org_profile(app: FirecrawlApp, org_link: str) -> Optional[Dict]:
 def extract_social_media(social_links: Optional[List[Dict]]) -> Dict[str, str]:
     """
     Extract specific social media URLs from social_links array
+
+    The platform is taken from the URL's host (link_classifier); the label the
+    LLM gave is only used for hosts the classifier does not know.
     """
-    socials = {
-        "linkedin": "",
-        "twitter": "",
-        "github": "",
-        "instagram": "",
-        "facebook": ""
-    }
+    socials = {platform: "" for platform in SOCIAL_PLATFORMS}
     
     if not social_links or not isinstance(social_links, list):
         return socials
@@ -139,16 +277,14 @@ def extract_social_media(social_links: Optional[List[Dict]]) -> Dict[str, str]:
         if not url:
             continue
         
-        if "linkedin" in platform:
-            socials["linkedin"] = url
-        elif "twitter" in platform or "x.com" in url.lower():
-            socials["twitter"] = url
-        elif "github" in platform:
-            socials["github"] = url
-        elif "instagram" in platform:
-            socials["instagram"] = url
-        elif "facebook" in platform:
-            socials["facebook"] = url
+        host_platform = link_classifier.platform(url)
+        if host_platform in socials:
+            socials[host_platform] = url
+        elif host_platform is None:
+            for name in SOCIAL_PLATFORMS:
+                if name in platform:
+                    socials[name] = url
+                    break
     
     return socials
 
@@ -156,91 +292,253 @@ def extract_social_media(social_links: Optional[List[Dict]]) -> Dict[str, str]:
 # MAIN SCRAPER
 # ============================================================================
 
-def scrape_page(app: FirecrawlApp, page_num: int) -> List[Dict]:
+def new_session() -> requests.Session:
+    """HTTP session for local profile fetches"""
+    session = requests.Session()
+    session.headers.update({'User-Agent': USER_AGENT})
+    return session
+
+def build_record(org_name: str, org_link: str, profile: Dict) -> Dict:
+    """Output row for one organization"""
+    socials = extract_social_media(profile.get("social_links", []))
+    return {
+        "Company Name": profile.get("company_name", org_name),
+        "Org URL": urljoin(HF_BASE_URL, org_link),
+        "LinkedIn": socials.get("linkedin", ""),
+        "Twitter": socials.get("twitter", ""),
+        "GitHub": socials.get("github", ""),
+        "Instagram": socials.get("instagram", ""),
+        "Facebook": socials.get("facebook", ""),
+        "All Social Links": " | ".join([link.get("url", "") for link in profile.get("social_links", []) if link.get("url")])
+    }
+
+class ExcelStreamWriter:
     """
-    Scrape one page of organizations and their profiles
+    Appends records to a write-only openpyxl workbook: rows are streamed to a
+    temporary file as they arrive, so memory does not grow with the row count.
+    The .xlsx is written by close().
     """
-    organizations = []
-    
-    # Step 1: Get org list on the page
-    org_list = scrape_org_list_page(app, page_num)
-    
-    if org_list is None:
-        logger.error(f"Failed to scrape page {page_num}")
-        return []
-    
-    if not org_list:
-        logger.warning(f"No organizations on page {page_num}")
-        return []
     
-    logger.info(f"Processing {len(org_list)} organizations from page {page_num}")
+    def __init__(self, filename: str, columns: List[str] = RECORD_COLUMNS):
+        self.filename = filename
+        self.columns = columns
+        self.rows = 0
+        self.workbook = Workbook(write_only=True)
+        self.sheet = self.workbook.create_sheet("Organizations")
+        self.sheet.append(columns)
     
-    # Step 2: For each org, scrape their profile
-    for i, org in enumerate(tqdm(org_list, desc=f"Page {page_num}", unit="org"), 1):
-        try:
-            org_name = org.get("name", "Unknown")
-            org_link = org.get("link", "")
-            
-            if not org_link:
-                logger.warning(f"No link for org: {org_name}")
-                continue
-            
-            # Scrape profile
-            profile = scrape_org_profile(app, org_link)
-            
-            if profile is None:
-                logger.warning(f"Failed to scrape profile for: {org_name}")
-                continue
-            
-            # Extract social media
-            socials = extract_social_media(profile.get("social_links", []))
-            
-            # Build record
-            record = {
-                "Company Name": profile.get("company_name", org_name),
-                "Org URL": urljoin(HF_BASE_URL, org_link),
-                "LinkedIn": socials.get("linkedin", ""),
-                "Twitter": socials.get("twitter", ""),
-                "GitHub": socials.get("github", ""),
-                "Instagram": socials.get("instagram", ""),
-                "Facebook": socials.get("facebook", ""),
-                "All Social Links": " | ".join([link.get("url", "") for link in profile.get("social_links", []) if link.get("url")])
-            }
-            
-            organizations.append(record)
-            logger.info(f"[{i}/{len(org_list)}] Scraped: {record['Company Name']}")
-            
-            # Rate limiting
-            time.sleep(RATE_LIMIT_DELAY)
-        
-        except Exception as e:
-            logger.error(f"Error processing org {org.get('name', 'Unknown')}: {str(e)}")
-            continue
+    def append(self, record: Dict):
+        self.sheet.append([record.get(column, "") for column in self.columns])
+        self.rows += 1
     
-    return organizations
+    def close(self):
+        self.workbook.save(self.filename)
+        logger.info(f"Saved {self.rows} organizations to {self.filename}")
+        logger.info(f"File: {os.path.abspath(self.filename)}")
 
 def save_to_excel(organizations: List[Dict], filename: str):
-    """Save organizations to Excel file"""
-    if not organizations:
-        logger.error("No data to save")
-        return
-    
+    """Save organizations to Excel file (streamed; organizations may be any iterable)"""
     try:
-        df = pd.DataFrame(organizations)
-        df.to_excel(filename, index=False, engine='openpyxl')
-        logger.info(f"Saved {len(df)} organizations to {filename}")
-        logger.info(f"File: {os.path.abspath(filename)}")
-        return df
+        writer = ExcelStreamWriter(filename)
+        for record in organizations:
+            writer.append(record)
+        if not writer.rows:
+            logger.error("No data to save")
+            return None
+        writer.close()
+        return writer.rows
     except Exception as e:
         logger.error(f"Error saving to Excel: {str(e)}")
         return None
 
+# ============================================================================
+# PAGE RANGE (CONCURRENT) SCRAPER
+# ============================================================================
+
+def iter_page_checkpoint(checkpoint_file: str) -> Iterator[Tuple[int, List[Dict]]]:
+    """
+    (page number, records) for each checkpoint entry: the first entry of each
+    page, then any retry entries (records recovered by later runs; a page can
+    come up more than once)
+    """
+    if not os.path.exists(checkpoint_file):
+        return
+    seen = set()
+    for entry in read_page_checkpoint(checkpoint_file):
+        if entry.get("retry"):
+            if entry["page"] in seen:
+                yield entry["page"], entry["organizations"]
+        elif entry["page"] not in seen:
+            seen.add(entry["page"])
+            yield entry["page"], entry["organizations"]
+
+def page_checkpoint_failures(checkpoint_file: str) -> Dict[int, List[Dict]]:
+    """Listing entries whose profile fetch failed, per checkpointed page (latest entry wins)"""
+    failures = {}
+    if not os.path.exists(checkpoint_file):
+        return failures
+    for entry in read_page_checkpoint(checkpoint_file):
+        if entry.get("retry") or entry["page"] not in failures:
+            failures[entry["page"]] = entry.get("failed", [])
+    return {page: failed for page, failed in failures.items() if failed}
+
+def read_page_checkpoint(checkpoint_file: str) -> Iterator[Dict]:
+    """Parsed checkpoint lines"""
+    with open(checkpoint_file, encoding='utf-8') as f:
+        for line in f:
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                continue  # partial last line from an interrupted run
+
+def scrape_org_record(app: FirecrawlApp, org: Dict, mode: str, cache: Optional[ExtractionCache],
+                      session: requests.Session, throttle: Callable[[], None]) -> Tuple[Optional[Dict], str]:
+    """Profile + output record for one listing entry; returns (record or None, source)"""
+    org_name = org.get("name", "Unknown")
+    org_link = org.get("link", "")
+    if not org_link:
+        logger.warning(f"No link for org: {org_name}")
+        return None, "skipped"
+    try:
+        profile, source = get_org_profile(app, org_link, mode, cache, session, throttle)
+    except Exception as e:
+        logger.error(f"Error processing org {org_name}: {str(e)}")
+        return None, "error"
+    if profile is None:
+        logger.warning(f"Failed to scrape profile for: {org_name}")
+        return None, source
+    return build_record(org_name, org_link, profile), source
+
+def run_page_range(app: FirecrawlApp, start_page: int, end_page: int, mode: str = EXTRACTION_MODE,
+                   cache: Optional[ExtractionCache] = None, workers: int = PROFILE_WORKERS,
+                   page_workers: int = LISTING_WORKERS, rate: float = MAX_REQUESTS_PER_SECOND,
+                   output_file: str = OUTPUT_FILE, checkpoint_file: str = PAGE_CHECKPOINT_FILE) -> int:
+    """
+    Scrape listing pages start_page..end_page (inclusive) with bounded concurrency
+    
+    Up to page_workers listing pages are fetched ahead while the profiles of the
+    current page are extracted by `workers` threads; all requests share one
+    RateLimiter. Each finished page is appended to checkpoint_file together with
+    the listing entries whose profile failed, and pages already there are not
+    scraped again (their records are replayed); their failed profiles are
+    retried first. Records stream into the workbook as pages finish.
+    
+    Returns number of organizations written
+    """
+    throttle = RateLimiter(rate)
+    writer = ExcelStreamWriter(output_file)
+    sessions = threading.local()
+    sources = Counter()
+    
+    def profile_task(org: Dict) -> Tuple[Optional[Dict], str]:
+        if not hasattr(sessions, "session"):
+            sessions.session = new_session()
+        return scrape_org_record(app, org, mode, cache, sessions.session, throttle)
+    
+    def listing_task(page_num: int) -> Optional[List[Dict]]:
+        throttle()
+        return scrape_org_list_page(app, page_num)
+    
+    # Pages finished by an earlier run
+    done = set()
+    for page_num, records in iter_page_checkpoint(checkpoint_file):
+        if start_page <= page_num <= end_page:
+            done.add(page_num)
+            for record in records:
+                writer.append(record)
+    retries = {page_num: failed for page_num, failed in page_checkpoint_failures(checkpoint_file).items()
+               if page_num in done}
+    if done:
+        logger.info(f"Resuming: {len(done)} pages ({writer.rows} organizations) restored from {checkpoint_file}; "
+                    f"retrying {sum(map(len, retries.values()))} failed profiles")
+    
+    pages = iter([page for page in range(start_page, end_page + 1) if page not in done])
+    os.makedirs(os.path.dirname(checkpoint_file) or ".", exist_ok=True)
+    
+    with ThreadPoolExecutor(page_workers, thread_name_prefix="listing") as listing_pool, \
+            ThreadPoolExecutor(workers, thread_name_prefix="profile") as profile_pool, \
+            open(checkpoint_file, "a", encoding="utf-8") as checkpoint:
+        listings = deque()
+        
+        def scrape_profiles(page_num: int, org_list: List[Dict], retry: bool = False):
+            records, failed = [], []
+            for org, (record, source) in zip(org_list, tqdm(profile_pool.map(profile_task, org_list),
+                                                             total=len(org_list), desc=f"Page {page_num}",
+                                                             unit="org")):
+                sources[source] += 1
+                if record is not None:
+                    records.append(record)
+                elif source != "skipped":
+                    failed.append(org)
+            
+            entry = {"page": page_num, "organizations": records, "failed": failed}
+            if retry:
+                entry["retry"] = True
+            checkpoint.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            checkpoint.flush()
+            for record in records:
+                writer.append(record)
+            logger.info(f"Page {page_num}{' (retry)' if retry else ''}: {len(records)}/{len(org_list)} "
+                        f"organizations, {len(failed)} failed | total {writer.rows} | "
+                        f"profiles by source: {dict(sources)}")
+        
+        def fetch_ahead():
+            page_num = next(pages, None)
+            if page_num is not None:
+                listings.append((page_num, listing_pool.submit(listing_task, page_num)))
+        
+        for _ in range(max(1, page_workers)):
+            fetch_ahead()
+        
+        for page_num, failed in retries.items():
+            scrape_profiles(page_num, failed, retry=True)
+        
+        while listings:
+            page_num, listing = listings.popleft()
+            fetch_ahead()
+            org_list = listing.result()
+            if org_list is None:
+                logger.error(f"Failed to scrape page {page_num} (will be retried on the next run)")
+                continue
+            scrape_profiles(page_num, org_list)
+    
+    writer.close()
+    return writer.rows
+
 # ============================================================================
 # MAIN
 # ============================================================================
 
 def main():
     """Main entry point"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Scrape HuggingFace organizations with Firecrawl')
+    parser.add_argument('--mode', choices=EXTRACTION_MODES, default=EXTRACTION_MODE,
+                        help=f'Profile extraction mode (default: {EXTRACTION_MODE}): llm = app.extract for every '
+                             f'profile, hybrid = local parse first and app.extract only on misses, local = no LLM')
+    parser.add_argument('--cache', default=DEFAULT_CACHE_FILE,
+                        help=f'Extraction cache file keyed by URL and mode (default: {DEFAULT_CACHE_FILE})')
+    parser.add_argument('--no-cache', action='store_true', help='Do not read or write the extraction cache')
+    parser.add_argument('--start-page', type=int, default=0, help='First listing page (default: 0)')
+    parser.add_argument('--end-page', type=int, default=None,
+                        help='Last listing page, inclusive (default: same as --start-page)')
+    parser.add_argument('--workers', type=int, default=PROFILE_WORKERS,
+                        help=f'Concurrent profile extractions (default: {PROFILE_WORKERS})')
+    parser.add_argument('--page-workers', type=int, default=LISTING_WORKERS,
+                        help=f'Listing pages fetched ahead (default: {LISTING_WORKERS})')
+    parser.add_argument('--rate', type=float, default=MAX_REQUESTS_PER_SECOND,
+                        help=f'Maximum requests per second across all workers (default: {MAX_REQUESTS_PER_SECOND:g})')
+    parser.add_argument('--output', default=OUTPUT_FILE, help=f'Excel output file (default: {OUTPUT_FILE})')
+    parser.add_argument('--checkpoint', default=PAGE_CHECKPOINT_FILE,
+                        help=f'Per-page checkpoint file (default: {PAGE_CHECKPOINT_FILE})')
+    parser.add_argument('--restart', action='store_true', help='Ignore and remove the page checkpoint')
+    args = parser.parse_args()
+    end_page = args.start_page if args.end_page is None else args.end_page
+    if end_page < args.start_page or args.workers < 1 or args.page_workers < 1:
+        parser.error("--end-page must be >= --start-page, and worker counts must be >= 1")
+    setup_queue_logging(LOG_FILE)
+    
     try:
         logger.info("=" * 60)
         logger.info("HuggingFace Organizations Scraper")
@@ -250,19 +548,19 @@ def main():
         app = init_firecrawl()
         logger.info("Firecrawl initialized")
         
-        # Scrape page 0
-        logger.info("\nStarting scrape...")
-        organizations = scrape_page(app, page_num=0)
+        if args.restart and os.path.exists(args.checkpoint):
+            os.remove(args.checkpoint)
+            logger.info("Page checkpoint removed")
         
-        # Save to Excel
-        if organizations:
-            logger.info(f"\nSaving {len(organizations)} organizations to Excel...")
-            df = save_to_excel(organizations, OUTPUT_FILE)
-            
-            if df is not None:
-                logger.info("\nSample data (first 5 rows):")
-                logger.info(df.head().to_string())
-                logger.info("\nDone!")
+        # Scrape the page range (records stream into the workbook page by page)
+        logger.info(f"\nStarting scrape of pages {args.start_page}-{end_page}...")
+        cache = None if args.no_cache else ExtractionCache(args.cache)
+        total = run_page_range(app, args.start_page, end_page, mode=args.mode, cache=cache,
+                               workers=args.workers, page_workers=args.page_workers, rate=args.rate,
+                               output_file=args.output, checkpoint_file=args.checkpoint)
+        
+        if total:
+            logger.info("\nDone!")
         else:
             logger.error("No organizations scraped")
     
@@ -0,0 +1,128 @@
+"""
+Link Classifier
+Categorizes URLs by host with one parse per URL and a suffix lookup in a host
+table, instead of trying a list of regexes against every link.
+
+Categories (the Phase 2 link columns):
+- github:       code hosting (GitHub, GitLab)
+- social_media: social platforms (Twitter/X, LinkedIn, Facebook, ...)
+- website:      any other absolute http(s) link
+- ignore:       HuggingFace's own links; dropped
+
+A host matches a table entry if it is the entry or a subdomain of it
+("www.linkedin.com" -> "linkedin.com"), so "dropbox.com" never matches "x.com".
+Extra hosts can be added with LINK_PLATFORMS in config.py.
+"""
+
+from collections import namedtuple
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from config import LINK_PLATFORMS
+
+LinkClass = namedtuple('LinkClass', ['category', 'platform'])
+
+CATEGORIES = ('github', 'website', 'social_media')
+
+# Host -> (category, platform)
+DEFAULT_PLATFORMS: Dict[str, Tuple[str, str]] = {
+    'github.com': ('github', 'github'),
+    'github.io': ('website', 'github_pages'),
+    'gitlab.com': ('github', 'gitlab'),
+    'twitter.com': ('social_media', 'twitter'),
+    'x.com': ('social_media', 'twitter'),
+    'linkedin.com': ('social_media', 'linkedin'),
+    'facebook.com': ('social_media', 'facebook'),
+    'fb.com': ('social_media', 'facebook'),
+    'instagram.com': ('social_media', 'instagram'),
+    'youtube.com': ('social_media', 'youtube'),
+    'youtu.be': ('social_media', 'youtube'),
+    'huggingface.co': ('ignore', 'huggingface'),
+    'hf.co': ('ignore', 'huggingface'),
+}
+
+WEBSITE = LinkClass('website', None)
+
+# Distinct URLs remembered per classifier (site header/footer links repeat on every page)
+CACHE_SIZE = 65536
+
+
+class LinkClassifier:
+    """Host-table link classifier with a per-URL result cache."""
+
+    def __init__(self, platforms: Optional[Dict[str, Tuple[str, str]]] = None):
+        """
+        Args:
+            platforms: Extra or overriding host -> (category, platform) entries
+                       (default: LINK_PLATFORMS from config.py)
+        """
+        table = dict(DEFAULT_PLATFORMS)
+        table.update(LINK_PLATFORMS if platforms is None else platforms)
+        self.table = {host.lower(): LinkClass(*entry) for host, entry in table.items()}
+        self.classify = lru_cache(maxsize=CACHE_SIZE)(self._classify)
+
+    def classify_host(self, host: str) -> LinkClass:
+        """Class for a lowercase host name: the longest matching table suffix, else website."""
+        table = self.table
+        match = table.get(host)
+        if match is not None:
+            return match
+        position = host.find('.')
+        while position != -1:
+            match = table.get(host[position + 1:])
+            if match is not None:
+                return match
+            position = host.find('.', position + 1)
+        return WEBSITE
+
+    def _classify(self, url: str) -> Optional[LinkClass]:
+        """
+        Class of one URL (cached via self.classify).
+
+        Returns:
+            LinkClass, or None for relative, non-http(s) and malformed links
+        """
+        url = url.strip()
+        if url.startswith('//'):
+            url = 'https:' + url
+        try:
+            parts = urlsplit(url)
+            host = parts.hostname
+        except ValueError:
+            return None
+        if parts.scheme not in ('http', 'https') or not host or '.' not in host:
+            return None
+        return self.classify_host(host)
+
+    def categorize(self, urls: Iterable[str]) -> Dict[str, List[str]]:
+        """
+        Group URLs by category, keeping first-seen order and dropping duplicates.
+
+        Args:
+            urls: Link targets (e.g. every href on a page)
+
+        Returns:
+            {category: [url, ...]} for github, website and social_media
+        """
+        results = {category: [] for category in CATEGORIES}
+        seen = set()
+        classify = self.classify
+        for url in urls:
+            if not url:
+                continue
+            url = url.strip()
+            if url.startswith('//'):
+                url = 'https:' + url
+            if url in seen:
+                continue
+            seen.add(url)
+            link_class = classify(url)
+            if link_class is not None and link_class.category in results:
+                results[link_class.category].append(url)
+        return results
+
+    def platform(self, url: str) -> Optional[str]:
+        """Platform name for a URL ('twitter', 'github', ...), or None if it is not a known platform."""
+        link_class = self.classify(url) if url else None
+        return link_class.platform if link_class is not None else None
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Organization Link Table
+Explodes the comma-joined Phase 2 link columns (github_links, website_links,
+social_media_links) into a long-format table with one row per organization
+and link, so questions like "which orgs link to X" or "top domains" are a
+filter or a groupby instead of re-splitting strings.
+
+Columns:
+- org_id:             row number in the Phase 2 CSV
+- organization_url:   organization the link was found on
+- link_type:          github / website / social_media (source column)
+- position:           order of the link within its source column
+- url:                link as scraped
+- canonical_url:      https, lowercase host without "www.", no fragment or trailing slash
+- host:               host of canonical_url
+- platform:           LinkClassifier platform (twitter, github, ...), empty for plain websites
+- member_count, model_count, dataset_count: the organization's counts (nullable integers)
+
+All string work is done with vectorized pandas string methods, once per
+distinct URL (header/footer and common links repeat across organizations);
+only the distinct hosts go through the classifier.
+"""
+
+import os
+import sys
+import time
+from typing import List, Optional
+
+import pandas as pd
+
+from link_classifier import LinkClassifier
+
+DETAILED_CSV = "output/huggingface_organizations_detailed.csv"
+
+# Phase 2 column -> link_type
+LINK_COLUMNS = {
+    'github_links': 'github',
+    'website_links': 'website',
+    'social_media_links': 'social_media',
+}
+
+COUNT_COLUMNS = ['member_count', 'model_count', 'dataset_count']
+
+# Separator Phase 2 joins links with
+LINK_SEPARATOR = ', '
+
+# scheme (optional for //host links), host without "www." and default port,
+# rest of the URL without trailing slashes or fragment
+URL_PATTERN = (r'^\s*(?:(?P<scheme>[A-Za-z][A-Za-z0-9+.-]*):)?//(?:[Ww][Ww][Ww]\.)?(?P<host>[^/?#\s:]+)'
+               r'(?::(?:80|443)(?=[/?#]|$)|(?P<port>:\d+))?(?P<rest>[^#\s]*?)/*(?:#.*)?\s*$')
+
+
+def link_table_path(csv_path: str) -> str:
+    """
+    Path of the link table written next to a Phase 2 CSV.
+
+    Example: output/huggingface_organizations_detailed.csv -> output/huggingface_organizations_detailed_links.csv
+    """
+    root, ext = os.path.splitext(csv_path)
+    return f"{root}_links{ext or '.csv'}"
+
+
+def to_count(values: pd.Series) -> pd.Series:
+    """Count column ('Null', '', '12', 12.0) as a nullable Int32 series."""
+    return pd.to_numeric(values, errors='coerce').round().astype('Int32')
+
+
+def build_link_table(details_df: pd.DataFrame, classifier: Optional[LinkClassifier] = None) -> pd.DataFrame:
+    """
+    Long-format org -> link table from Phase 2 data.
+
+    Args:
+        details_df: Phase 2 dataframe (as read from the detailed CSV)
+        classifier: Host classifier for the platform column (default: LinkClassifier())
+
+    Returns:
+        Dataframe with the columns listed in the module docstring
+    """
+    classifier = classifier or LinkClassifier()
+    details_df = details_df.reset_index(drop=True)
+
+    parts = []
+    for column, link_type in LINK_COLUMNS.items():
+        if column not in details_df:
+            continue
+        links = details_df[column].str.split(LINK_SEPARATOR, regex=False).explode()
+        links = links[links.notna() & (links != '') & (links != 'Null')]
+        part = links.rename('url').to_frame()
+        part['link_type'] = link_type
+        part['position'] = part.groupby(level=0).cumcount()
+        parts.append(part)
+
+    columns = ['org_id', 'organization_url', 'link_type', 'position', 'url', 'canonical_url', 'host',
+               'platform'] + COUNT_COLUMNS
+    if not parts:
+        return pd.DataFrame(columns=columns)
+
+    table = pd.concat(parts)
+    org_ids = table.index.to_numpy()
+    table = table.reset_index(drop=True)
+    table.insert(0, 'org_id', org_ids.astype('int32'))
+    table.insert(1, 'organization_url', details_df['organization_url'].to_numpy()[org_ids])
+    table = table.sort_values(['org_id', 'link_type', 'position'], kind='stable', ignore_index=True)
+
+    # Canonical URL, host and platform, computed once per distinct URL
+    url_codes, urls = pd.factorize(table['url'])
+    parsed = pd.Series(urls, dtype=object).str.extract(URL_PATTERN)
+    host = parsed['host'].str.lower()
+    host = host.where(host.notna() & parsed['scheme'].fillna('https').str.lower().isin(['http', 'https']))
+    canonical = 'https://' + host + parsed['port'].fillna('') + parsed['rest'].fillna('')
+    distinct_hosts = host.dropna().unique()
+    platforms = pd.Series([classifier.classify_host(h).platform or '' for h in distinct_hosts],
+                          index=distinct_hosts, dtype=object)
+    platform = host.map(platforms).fillna('')
+
+    table['canonical_url'] = canonical.to_numpy()[url_codes]
+    table['host'] = pd.Categorical(host.to_numpy()[url_codes])
+    table['platform'] = pd.Categorical(platform.to_numpy()[url_codes])
+    table['link_type'] = table['link_type'].astype('category')
+    table['position'] = table['position'].astype('int16')
+
+    rows = table['org_id'].to_numpy()
+    for column in COUNT_COLUMNS:
+        if column in details_df:
+            table[column] = to_count(details_df[column]).take(rows).reset_index(drop=True)
+        else:
+            table[column] = pd.array([pd.NA] * len(table), dtype='Int32')
+
+    return table[columns]
+
+
+def write_link_table(csv_path: str = DETAILED_CSV, output_path: Optional[str] = None) -> pd.DataFrame:
+    """
+    Build the link table for a Phase 2 CSV and write it next to it.
+
+    Args:
+        csv_path: Phase 2 detailed CSV
+        output_path: Destination (default: <csv_path stem>_links.csv)
+
+    Returns:
+        The link table
+    """
+    details_df = pd.read_csv(csv_path, dtype=str, keep_default_na=False,
+                             usecols=lambda column: column == 'organization_url' or column in LINK_COLUMNS
+                             or column in COUNT_COLUMNS)
+    table = build_link_table(details_df)
+    table.to_csv(output_path or link_table_path(csv_path), index=False)
+    return table
+
+
+def main(argv: Optional[List[str]] = None):
+    """Build the org -> link table from Phase 2 output"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Explode Phase 2 link columns into a long-format link table')
+    parser.add_argument('--input', default=DETAILED_CSV, help=f'Phase 2 CSV (default: {DETAILED_CSV})')
+    parser.add_argument('--output', default=None,
+                        help=f'Link table CSV (default: {link_table_path(DETAILED_CSV)})')
+
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.input):
+        print(f"Error: Input file {args.input} not found!")
+        sys.exit(1)
+
+    started = time.perf_counter()
+    table = write_link_table(args.input, args.output)
+    print(f"Link table: {len(table)} links from {table['org_id'].nunique()} organizations "
+          f"saved to {args.output or link_table_path(args.input)} in {time.perf_counter() - started:.1f}s")
+    print("Top hosts:")
+    print(table['host'].value_counts().head(10).to_string())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+"""
+Parse Memory Management
+Keeps the resident size of multi-day runs flat:
+- parse_html():    a BeautifulSoup tree that is torn down (release_tree) as
+                   soon as extraction is done. Trees are full of parent/child/
+                   sibling reference cycles, so without this every page waits
+                   for a garbage collection to be freed.
+- tune_gc():       moves everything loaded at startup (modules, the input
+                   dataframe) out of the collector's view with gc.freeze() and
+                   raises the generation 0 threshold, so the collector runs
+                   less often and each run scans only recent objects.
+- MemoryWatchdog:  reads RSS from /proc/self/statm, logs it every
+                   MEMORY_LOG_EVERY organizations together with the growth
+                   since the last line, collects on a fixed cadence, and
+                   pauses intake while RSS is above MEMORY_CEILING_MB (so
+                   the background writer and result sinks can drain).
+"""
+
+import gc
+import logging
+import os
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+from config import (GC_COLLECT_EVERY, GC_GEN0_THRESHOLD, MEMORY_CEILING_MB, MEMORY_LOG_EVERY,
+                    MEMORY_MAX_PAUSE)
+
+STATM_PATH = "/proc/self/statm"
+
+logger = logging.getLogger(__name__)
+
+
+def release_tree(soup: BeautifulSoup):
+    """
+    Break every reference cycle in a parsed document so it is freed right away.
+
+    BeautifulSoup.decompose() on the document itself only clears the root
+    (extracting the root cuts its next_element chain), leaving the whole tree
+    for the cyclic collector; decomposing each top-level node first walks the
+    entire tree.
+    """
+    for node in list(soup.contents):
+        node.decompose()
+    soup.decompose()
+
+
+@contextmanager
+def parse_html(html: str, parser: str = 'html.parser',
+               parse_only: Optional[SoupStrainer] = None) -> Iterator[BeautifulSoup]:
+    """
+    Parse a page for the duration of the block, then tear the tree down.
+
+    Values taken out of the tree must be plain strings (get_text(), attribute
+    values, str(...)): tags and NavigableStrings are emptied on exit.
+
+    Args:
+        html: Page HTML
+        parser: BeautifulSoup tree builder
+        parse_only: Only build the parts of the tree this strainer matches
+    """
+    soup = BeautifulSoup(html, parser, parse_only=parse_only)
+    try:
+        yield soup
+    finally:
+        release_tree(soup)
+
+
+def tune_gc(gen0_threshold: int = GC_GEN0_THRESHOLD):
+    """
+    Freeze the objects alive now and raise the generation 0 threshold.
+
+    Call once startup data is loaded; frozen objects are never scanned again.
+    """
+    gc.collect()
+    gc.freeze()
+    _, gen1, gen2 = gc.get_threshold()
+    gc.set_threshold(gen0_threshold, gen1, gen2)
+
+
+def rss_bytes() -> Optional[int]:
+    """Current resident set size, or None where /proc is not available."""
+    try:
+        with open(STATM_PATH) as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class MemoryWatchdog:
+    """Per-item RSS logging, collection cadence and an intake ceiling."""
+
+    def __init__(self, unit: str = 'orgs', log_every: int = MEMORY_LOG_EVERY, ceiling_mb: float = MEMORY_CEILING_MB,
+                 collect_every: int = GC_COLLECT_EVERY, max_pause: float = MEMORY_MAX_PAUSE,
+                 check_interval: float = 5.0, log: Optional[logging.Logger] = None):
+        """
+        Args:
+            unit: Name of the counted items in log lines
+            log_every: Log RSS every this many items (0 disables)
+            ceiling_mb: Pause intake while RSS is above this (0 disables)
+            collect_every: Run a full garbage collection every this many items (0 disables)
+            max_pause: Longest pause (seconds) before intake resumes regardless
+            check_interval: Seconds between RSS checks while paused
+            log: Logger (default: module logger)
+        """
+        self.unit = unit
+        self.log_every = log_every
+        self.ceiling = ceiling_mb * 1e6
+        self.collect_every = collect_every
+        self.max_pause = max_pause
+        self.check_interval = check_interval
+        self.logger = log or logger
+        self.items = 0
+        self.pauses = 0
+        self.peak = 0
+        self._last_logged_rss = rss_bytes()
+
+    def tick(self, items: int = 1):
+        """Count processed items; log, collect or pause when a threshold is crossed."""
+        before, self.items = self.items, self.items + items
+        if self.collect_every and before // self.collect_every != self.items // self.collect_every:
+            gc.collect()
+        if self.log_every and before // self.log_every != self.items // self.log_every:
+            self.log()
+        if self.ceiling:
+            self.wait_below_ceiling()
+
+    def log(self):
+        """Log current RSS and the growth since the previous line."""
+        rss = rss_bytes()
+        if rss is None:
+            return
+        self.peak = max(self.peak, rss)
+        growth = ''
+        if self._last_logged_rss is not None:
+            growth = f" ({(rss - self._last_logged_rss) / 1e6:+.1f} MB since last)"
+        self._last_logged_rss = rss
+        self.logger.info(f"[MEM] {self.items} {self.unit}: RSS {rss / 1e6:.0f} MB{growth}, "
+                         f"peak {self.peak / 1e6:.0f} MB, gc counts {gc.get_count()}")
+
+    def wait_below_ceiling(self) -> float:
+        """
+        Block while RSS is above the ceiling (collecting between checks).
+
+        Returns:
+            Seconds paused
+        """
+        rss = rss_bytes()
+        if rss is None or rss <= self.ceiling:
+            return 0.0
+        gc.collect()
+        rss = rss_bytes()
+        if rss is None or rss <= self.ceiling:
+            return 0.0
+
+        self.pauses += 1
+        self.logger.warning(f"[MEM] RSS {rss / 1e6:.0f} MB above ceiling {self.ceiling / 1e6:.0f} MB; "
+                            f"pausing intake")
+        started = time.monotonic()
+        while rss > self.ceiling and time.monotonic() - started < self.max_pause:
+            time.sleep(self.check_interval)
+            gc.collect()
+            rss = rss_bytes()
+            if rss is None:
+                break
+        paused = time.monotonic() - started
+        if rss is None:
+            self.logger.warning(f"[MEM] RSS no longer readable; resuming intake after {paused:.0f}s")
+        elif rss > self.ceiling:
+            self.logger.error(f"[MEM] RSS still {rss / 1e6:.0f} MB after {paused:.0f}s; resuming intake")
+        else:
+            self.logger.info(f"[MEM] RSS {rss / 1e6:.0f} MB; resuming intake after {paused:.0f}s")
+        return paused
@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+Mock HuggingFace Server
+Local stand-in for huggingface.co for end-to-end load testing of the scrapers.
+Serves synthetic /organizations?p=N listing pages and /<org> profile pages in
+the same HTML shapes as the live site, with configurable latency, 429/5xx
+injection, request-rate limiting and slow-drip responses.
+
+Usage:
+    python mock_hf_server.py --port 8000 --latency lognormal:150:0.6 --rate-429 0.02
+    HF_BASE_URL=http://127.0.0.1:8000 python hf_org_scraper.py --start 0 --end 50
+    python phase2_detail_scraper.py --base-url http://127.0.0.1:8000
+
+GET /__stats returns response counters as JSON.
+"""
+
+import hashlib
+import html
+import json
+import math
+import random
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+ORG_TYPES = ['company', 'university', 'non-profit', 'community', 'team', 'enterprise']
+NAME_WORDS = ['ai', 'labs', 'research', 'nlp', 'vision', 'data', 'robotics', 'health', 'bio', 'speech',
+              'open', 'deep', 'quantum', 'neural', 'gen', 'lang', 'edu', 'climate', 'finance', 'legal']
+SOCIAL_HOSTS = ['https://twitter.com/', 'https://x.com/', 'https://www.linkedin.com/company/',
+                'https://www.youtube.com/@', 'https://www.facebook.com/', 'https://www.instagram.com/']
+STAT_SEPARATOR = '<span class="px-1.5 text-gray-300">•</span>'
+RESERVED_PATHS = {'models', 'datasets', 'spaces', 'docs', 'pricing', 'terms-of-service', 'privacy',
+                  'users', 'login', 'join', 'settings', 'new', 'organizations', 'enterprise'}
+
+
+# ============================================================================
+# SYNTHETIC DATA
+# ============================================================================
+
+def _rng(*seed) -> random.Random:
+    """Deterministic RNG so every page renders the same on every request."""
+    return random.Random(hashlib.md5(repr(seed).encode()).hexdigest())
+
+
+def _format_count(n: int) -> str:
+    return f"{n / 1000:.1f}k".replace('.0k', 'k') if n >= 1000 else str(n)
+
+
+def listing_orgs(page_num: int, per_page: int) -> List[Tuple[str, str, str, int, int]]:
+    """(slug, name, type, models, followers) for each org card on a listing page."""
+    rng = _rng('listing', page_num)
+    orgs = []
+    for position in range(per_page):
+        words = [rng.choice(NAME_WORDS) for _ in range(rng.choice([1, 2, 2, 3]))]
+        name = ' '.join(word.title() if rng.random() < 0.7 else word.upper() for word in words)
+        slug = f"{'-'.join(words)}-{page_num}-{position}"
+        orgs.append((slug, name, rng.choice(ORG_TYPES), rng.choice([0, 1, 3, 12, 68, 1050, rng.randint(0, 400)]),
+                     rng.choice([0, 1, 5, 17, 230, 1200, 48200])))
+    return orgs
+
+
+def _page(title: str, main: str) -> str:
+    nav = ''.join(f'<li><a class="group flex items-center px-2 py-0.5" href="/{path}">{path.title()}</a></li>'
+                  for path in ['models', 'datasets', 'spaces', 'docs', 'pricing'])
+    footer_links = [('/models', 'Models'), ('/terms-of-service', 'Terms of service'), ('/privacy', 'Privacy'),
+                    ('https://apply.workable.com/huggingface/', 'Jobs'), ('/docs', 'Documentation'),
+                    ('https://discuss.huggingface.co', 'Forum'), ('https://status.huggingface.co/', 'Service Status')]
+    footer = ''.join(f'<li><a class="hover:underline" href="{href}">{text}</a></li>' for href, text in footer_links)
+    return (f'<!doctype html>\n<html><head><meta charset="utf-8"><title>{html.escape(title)}</title></head>'
+            f'<body><div class="flex min-h-dvh flex-col"><header class="border-b border-gray-100"><a href="/">'
+            f'<span>Hugging Face</span></a><nav aria-label="Main"><ul>{nav}<li><a href="/login">Log In</a></li>'
+            f'<li><a href="/join">Sign Up</a></li></ul></nav></header><main class="flex flex-1 flex-col">{main}'
+            f'</main><footer class="border-t border-gray-100"><nav><ul>{footer}</ul></nav></footer></div>'
+            f'</body></html>\n')
+
+
+def render_listing(page_num: int, per_page: int) -> str:
+    """Listing page in the organizations-grid shape parsed by Phase 1."""
+    cards = []
+    for slug, name, org_type, models, followers in listing_orgs(page_num, per_page):
+        stats = ([f'<span>{_format_count(models)} model{"s" if models != 1 else ""}</span>'] if models else [])
+        stats.append(f'<span>{_format_count(followers)} follower{"s" if followers != 1 else ""}</span>')
+        cards.append(
+            f'<article class="overview-card-wrapper group/repo"><a class="flex items-center p-2" href="/{slug}">'
+            f'<img alt="" class="mr-3 h-10 w-10 flex-none rounded-lg" src="/avatars/{slug}.png">'
+            f'<div class="w-full truncate"><header class="flex items-center truncate">'
+            f'<h4 class="truncate text-md font-semibold text-gray-700">{html.escape(name)}</h4>'
+            f'<span class="ml-2 rounded-sm border border-gray-100 px-1 text-xs text-gray-400">{org_type}</span>'
+            f'</header><div class="mr-1 flex items-center overflow-hidden whitespace-nowrap text-sm text-gray-400">'
+            f'{STAT_SEPARATOR.join(stats)}</div></div></a></article>')
+    main = (f'<section class="pt-8"><h1 class="text-lg font-bold">Organizations</h1>'
+            f'<div class="grid grid-cols-1 gap-5 lg:grid-cols-3">{"".join(cards)}</div>'
+            f'<nav><ul><li><a href="?p={max(page_num - 1, 0)}">Previous</a></li>'
+            f'<li><a href="?p={page_num + 1}">Next</a></li></ul></nav></section>')
+    return _page('Organizations - Hugging Face', main)
+
+
+def render_org(slug: str) -> str:
+    """Organization profile page in the sidebar + repo-list shape parsed by Phase 2."""
+    rng = _rng('org', slug)
+    name = slug.replace('-', ' ').title()
+    links = []
+    if rng.random() < 0.6:
+        links.append((f'https://{slug}.example.com', 'Website'))
+    if rng.random() < 0.5:
+        links.append((f'https://github.com/{slug}', 'GitHub'))
+    for host in rng.sample(SOCIAL_HOSTS, rng.randint(0, 3)):
+        links.append((f'{host}{slug}', host.split('//')[1].split('.')[-2].title()))
+    link_html = ''.join(f'<a class="mb-1 mr-1 flex items-center rounded-md border px-2 py-1 text-sm" href="{href}" '
+                        f'rel="nofollow" target="_blank">{text}</a>' for href, text in links)
+    location = (f'<div class="mb-2 flex items-center text-sm text-gray-500"><span>{rng.choice(["Paris, France", "Berlin, Germany", "Tokyo, Japan", "Austin, United States"])}</span></div>'
+                if rng.random() < 0.3 else '')
+    models = rng.choice([0, 1, 4, 12, 68, 300])
+    description = f"{name} builds open {rng.choice(NAME_WORDS)} models and datasets for the community."
+    repos = ''.join(f'<article class="overview-card-wrapper"><a class="block p-2" href="/{slug}/model-{i}">'
+                    f'<h4 class="text-md truncate font-mono">{slug}/model-{i}</h4></a></article>'
+                    for i in range(min(models, 12)))
+    main = (f'<div class="container relative flex flex-col lg:grid lg:grid-cols-10">'
+            f'<section class="pb-8 pt-8 lg:col-span-3"><h1 class="mb-2 text-2xl font-bold"><span>{html.escape(name)}</span></h1>'
+            f'{location}<div class="mb-4 flex flex-wrap">{link_html}</div>'
+            f'<h3 class="mb-3 font-semibold">Team members <span class="ml-1 text-gray-400">{rng.randint(1, 200)}</span></h3>'
+            f'</section><section class="col-span-1 pb-8 pt-6 lg:col-span-7"><div class="prose pb-4"><p>{html.escape(description)}</p></div>'
+            f'<section class="pt-8"><h3 class="mr-3 text-lg font-semibold">Models <span class="ml-1 text-gray-400">{models}</span></h3>'
+            f'<div class="grid grid-cols-1 gap-5">{repos}</div></section></section></div>')
+    return _page(f'{slug} ({name})', main)
+
+
+# ============================================================================
+# FAULT INJECTION
+# ============================================================================
+
+class LatencyModel:
+    """Response delay distribution parsed from 'fixed:MS', 'uniform:MIN_MS:MAX_MS' or 'lognormal:MEDIAN_MS:SIGMA'."""
+
+    def __init__(self, spec: str = 'fixed:0'):
+        kind, *values = spec.split(':')
+        self.kind = kind
+        self.values = [float(value) for value in values]
+        if (kind, len(self.values)) not in {('fixed', 1), ('uniform', 2), ('lognormal', 2)}:
+            raise ValueError(f"Invalid latency spec '{spec}'")
+
+    def sample(self, rng: random.Random) -> float:
+        """Delay in seconds."""
+        if self.kind == 'fixed':
+            ms = self.values[0]
+        elif self.kind == 'uniform':
+            ms = rng.uniform(*self.values)
+        else:
+            median, sigma = self.values
+            ms = rng.lognormvariate(math.log(max(median, 1e-3)), sigma)
+        return ms / 1000
+
+
+class MockConfig:
+    """Server behaviour; all rates are probabilities per request."""
+
+    def __init__(self, pages: int = 6615, per_page: int = 50, latency: str = 'fixed:0',
+                 rate_429: float = 0.0, rate_5xx: float = 0.0, slow_drip_rate: float = 0.0,
+                 drip_seconds: float = 5.0, max_rps: Optional[float] = None, seed: Optional[int] = None):
+        self.pages = pages
+        self.per_page = per_page
+        self.latency = LatencyModel(latency)
+        self.rate_429 = rate_429
+        self.rate_5xx = rate_5xx
+        self.slow_drip_rate = slow_drip_rate
+        self.drip_seconds = drip_seconds
+        self.max_rps = max_rps
+        self.rng = random.Random(seed)
+
+
+class MockHFServer(ThreadingHTTPServer):
+    """Threaded HTTP server holding the mock config, a token bucket and counters."""
+
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], config: MockConfig):
+        super().__init__(address, MockHFHandler)
+        self.config = config
+        self.counters = Counter()
+        self.lock = threading.Lock()
+        self.tokens = config.max_rps or 0.0
+        self.last_refill = time.monotonic()
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def take_token(self) -> bool:
+        """Token-bucket request limiter; False means the client is over max_rps."""
+        if not self.config.max_rps:
+            return True
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.config.max_rps, self.tokens + (now - self.last_refill) * self.config.max_rps)
+            self.last_refill = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True
+            return False
+
+    def roll(self, rate: float) -> bool:
+        with self.lock:
+            return self.config.rng.random() < rate
+
+
+class MockHFHandler(BaseHTTPRequestHandler):
+    server: MockHFServer
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        config = self.server.config
+        parsed = urlparse(self.path)
+        path = parsed.path.strip('/')
+
+        if path == '__stats':
+            self._send(200, json.dumps(dict(self.server.counters)), 'application/json', count=False)
+            return
+
+        with self.server.lock:
+            delay = config.latency.sample(config.rng)
+        time.sleep(delay)
+
+        if not self.server.take_token() or self.server.roll(config.rate_429):
+            self._send(429, 'Too Many Requests', headers={'Retry-After': '30'})
+            return
+        if self.server.roll(config.rate_5xx):
+            with self.server.lock:
+                status = config.rng.choice([500, 502, 503])
+            self._send(status, 'Server Error')
+            return
+
+        if path == 'organizations':
+            page_num = int(parse_qs(parsed.query).get('p', ['0'])[0])
+            per_page = config.per_page if 0 <= page_num < config.pages else 0
+            body = render_listing(page_num, per_page)
+        elif path and '/' not in path and path not in RESERVED_PATHS:
+            body = render_org(path)
+        else:
+            self._send(404, 'Not Found')
+            return
+
+        self._send(200, body, drip=self.server.roll(config.slow_drip_rate))
+
+    def _send(self, status: int, body: str, content_type: str = 'text/html; charset=utf-8',
+              headers: Optional[Dict[str, str]] = None, drip: bool = False, count: bool = True):
+        data = body.encode('utf-8')
+        if count:
+            with self.server.lock:
+                self.server.counters[str(status)] += 1
+                self.server.counters['slow_drip'] += int(drip)
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+
+        try:
+            if not drip:
+                self.wfile.write(data)
+                return
+            # Slow drip: body trickles out in small chunks over drip_seconds
+            chunks = 20
+            size = math.ceil(len(data) / chunks)
+            for start in range(0, len(data), size):
+                self.wfile.write(data[start:start + size])
+                self.wfile.flush()
+                time.sleep(self.server.config.drip_seconds / chunks)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+
+def start_server(config: MockConfig, host: str = '127.0.0.1', port: int = 0) -> MockHFServer:
+    """Start the mock server on a background thread (port 0 = pick a free port)."""
+    server = MockHFServer((host, port), config)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    """Run the mock server in the foreground"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Local mock of huggingface.co for scraper load testing')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--pages', type=int, default=6615, help='Number of non-empty listing pages')
+    parser.add_argument('--per-page', type=int, default=50, help='Organizations per listing page')
+    parser.add_argument('--latency', default='fixed:0',
+                        help="Delay distribution: fixed:MS, uniform:MIN_MS:MAX_MS or lognormal:MEDIAN_MS:SIGMA")
+    parser.add_argument('--rate-429', type=float, default=0.0, help='Probability of a 429 response')
+    parser.add_argument('--rate-5xx', type=float, default=0.0, help='Probability of a 500/502/503 response')
+    parser.add_argument('--max-rps', type=float, default=None, help='Answer 429 above this many requests/second')
+    parser.add_argument('--slow-drip-rate', type=float, default=0.0,
+                        help='Probability of trickling the body out slowly')
+    parser.add_argument('--drip-seconds', type=float, default=5.0, help='Duration of a slow-drip response')
+    parser.add_argument('--seed', type=int, default=None, help='Seed for fault injection')
+
+    args = parser.parse_args()
+
+    config = MockConfig(args.pages, args.per_page, args.latency, args.rate_429, args.rate_5xx,
+                        args.slow_drip_rate, args.drip_seconds, args.max_rps, args.seed)
+    server = MockHFServer((args.host, args.port), config)
+    print(f"Mock HuggingFace server on {server.base_url} (stats: {server.base_url}/__stats)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print(f"\nStopped. Responses: {dict(server.counters)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Organization Search Index
+Exports Phase 2 output into a local SQLite database so lookups do not scan
+the 323k-row CSV:
+- orgs:      one row per organization, B-tree indexes on organization_url and
+             status (scrape_status bucket, see status_index)
+- links:     the long-format link table (see link_table), B-tree indexes on
+             host and canonical_url
+- orgs_fts:  FTS5 full-text index over organization_name and description
+
+Build, then query:
+    python org_index.py build
+    python org_index.py query "speech recognition"
+    python org_index.py query --host github.com --status success
+    python org_index.py query --url https://huggingface.co/meta-llama
+"""
+
+import os
+import sqlite3
+import sys
+import time
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from link_table import COUNT_COLUMNS, DETAILED_CSV, build_link_table, to_count
+from status_index import status_bucket
+
+INDEX_DB = "output/huggingface_organizations.db"
+
+# Columns copied from the Phase 2 CSV (counts are stored as integers)
+ORG_COLUMNS = ['organization_name', 'organization_url', 'page_number', 'location', 'description',
+               'member_count', 'model_count', 'dataset_count', 'last_updated', 'scrape_status',
+               'scrape_timestamp']
+
+LINK_COLUMNS = ['org_id', 'link_type', 'position', 'url', 'canonical_url', 'host', 'platform']
+
+SCHEMA = """
+CREATE TABLE orgs (
+    org_id            INTEGER PRIMARY KEY,
+    organization_name TEXT,
+    organization_url  TEXT,
+    page_number       INTEGER,
+    location          TEXT,
+    description       TEXT,
+    member_count      INTEGER,
+    model_count       INTEGER,
+    dataset_count     INTEGER,
+    last_updated      TEXT,
+    scrape_status     TEXT,
+    scrape_timestamp  TEXT,
+    status            TEXT NOT NULL
+);
+CREATE TABLE links (
+    org_id        INTEGER NOT NULL,
+    link_type     TEXT NOT NULL,
+    position      INTEGER NOT NULL,
+    url           TEXT NOT NULL,
+    canonical_url TEXT,
+    host          TEXT,
+    platform      TEXT
+);
+CREATE VIRTUAL TABLE orgs_fts USING fts5(
+    organization_name, description, content='orgs', content_rowid='org_id', tokenize='unicode61'
+);
+"""
+
+# Created after the bulk insert (cheaper than maintaining them row by row)
+INDEXES = """
+CREATE INDEX idx_orgs_url ON orgs (organization_url);
+CREATE INDEX idx_orgs_status ON orgs (status);
+CREATE INDEX idx_links_host ON links (host, org_id);
+CREATE INDEX idx_links_canonical_url ON links (canonical_url);
+CREATE INDEX idx_links_org ON links (org_id);
+INSERT INTO orgs_fts (orgs_fts) VALUES ('rebuild');
+"""
+
+
+def _nullable(values: pd.Series) -> List:
+    """Column values for sqlite: 'Null', '' and NaN become NULL."""
+    values = values.astype(object)
+    return values.where(values.notna() & (values != 'Null') & (values != ''), None).tolist()
+
+
+def build_index(csv_path: str = DETAILED_CSV, db_path: str = INDEX_DB) -> Dict[str, int]:
+    """
+    Build the search database from a Phase 2 CSV.
+
+    The database is built under a temporary name and renamed into place, so
+    readers never see a half-built index.
+
+    Args:
+        csv_path: Phase 2 detailed CSV
+        db_path: Destination SQLite file (replaced if it exists)
+
+    Returns:
+        {'orgs': ..., 'links': ...} row counts
+    """
+    details_df = pd.read_csv(csv_path, dtype=str, keep_default_na=False)
+    for column in ORG_COLUMNS:
+        if column not in details_df:
+            details_df[column] = None
+
+    statuses = details_df['scrape_status']
+    buckets = {status: status_bucket(status) for status in statuses.unique()}
+    org_columns = {column: _nullable(details_df[column]) for column in ORG_COLUMNS}
+    for column in COUNT_COLUMNS + ['page_number']:
+        org_columns[column] = [None if pd.isna(value) else int(value) for value in to_count(details_df[column])]
+    org_rows = zip(range(len(details_df)), *(org_columns[column] for column in ORG_COLUMNS),
+                   statuses.map(buckets).tolist())
+
+    links = build_link_table(details_df)
+    link_rows = zip(links['org_id'].tolist(), links['link_type'].astype(object).tolist(),
+                    links['position'].tolist(), links['url'].tolist(),
+                    *(_nullable(links[column]) for column in ('canonical_url', 'host', 'platform')))
+
+    directory = os.path.dirname(db_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{db_path}.tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+
+    conn = sqlite3.connect(tmp_path)
+    try:
+        conn.execute("PRAGMA journal_mode = OFF")
+        conn.execute("PRAGMA synchronous = OFF")
+        conn.executescript(SCHEMA)
+        with conn:
+            conn.executemany(f"INSERT INTO orgs VALUES ({', '.join('?' * (len(ORG_COLUMNS) + 2))})", org_rows)
+            conn.executemany(f"INSERT INTO links ({', '.join(LINK_COLUMNS)}) "
+                             f"VALUES ({', '.join('?' * len(LINK_COLUMNS))})", link_rows)
+        conn.executescript(INDEXES)
+        conn.execute("ANALYZE")
+        conn.commit()
+    finally:
+        conn.close()
+    os.replace(tmp_path, db_path)
+    return {'orgs': len(details_df), 'links': len(links)}
+
+
+def fts_query(text: str) -> str:
+    """
+    FTS5 MATCH expression for plain search text: every word must match, the
+    last one as a prefix ("hugging fa" finds "Hugging Face").
+    """
+    words = ['"' + word.replace('"', '""') + '"' for word in text.split()]
+    if words:
+        words[-1] += '*'
+    return ' '.join(words)
+
+
+class OrgIndex:
+    """Read-only queries against a database built by build_index."""
+
+    def __init__(self, db_path: str = INDEX_DB):
+        """
+        Args:
+            db_path: SQLite file written by build_index
+        """
+        if not os.path.exists(db_path):
+            raise FileNotFoundError(f"Index {db_path} not found (run: python org_index.py build)")
+        self.conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+        self.conn.row_factory = sqlite3.Row
+
+    def query(self, text: Optional[str] = None, host: Optional[str] = None, status: Optional[str] = None,
+              url: Optional[str] = None, limit: int = 20) -> List[Dict]:
+        """
+        Organizations matching all given filters, best full-text match first.
+
+        Args:
+            text: Words to find in organization_name or description
+            host: Organizations linking to this host (e.g. github.com; "www." is ignored)
+            status: Status bucket (pending, success, failed, error)
+            url: Exact organization_url
+            limit: Maximum number of results
+
+        Returns:
+            List of org rows (dicts)
+        """
+        joins, where, params, order = [], [], [], "orgs.org_id"
+        if text:
+            joins.append("JOIN orgs_fts ON orgs_fts.rowid = orgs.org_id")
+            where.append("orgs_fts MATCH ?")
+            params.append(fts_query(text))
+            order = "orgs_fts.rank"
+        if host:
+            host = host.lower()
+            where.append("orgs.org_id IN (SELECT org_id FROM links WHERE host = ?)")
+            params.append(host[4:] if host.startswith('www.') else host)
+        if status:
+            where.append("orgs.status = ?")
+            params.append(status)
+        if url:
+            where.append("orgs.organization_url = ?")
+            params.append(url)
+
+        sql = f"SELECT orgs.* FROM orgs {' '.join(joins)}"
+        if where:
+            sql += f" WHERE {' AND '.join(where)}"
+        sql += f" ORDER BY {order} LIMIT ?"
+        return [dict(row) for row in self.conn.execute(sql, params + [limit])]
+
+    def links(self, org_id: int) -> List[Dict]:
+        """Links of one organization, in column order."""
+        rows = self.conn.execute("SELECT link_type, url, host, platform FROM links WHERE org_id = ? "
+                                 "ORDER BY link_type, position", (org_id,))
+        return [dict(row) for row in rows]
+
+    def close(self):
+        self.conn.close()
+
+
+def main(argv: Optional[List[str]] = None):
+    """Build or query the organization search index"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Indexed search over Phase 2 organization data')
+    parser.add_argument('--db', default=INDEX_DB, help=f'Index database (default: {INDEX_DB})')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    build = commands.add_parser('build', help='Build the index from the Phase 2 CSV')
+    build.add_argument('--input', default=DETAILED_CSV, help=f'Phase 2 CSV (default: {DETAILED_CSV})')
+
+    query = commands.add_parser('query', help='Search the index')
+    query.add_argument('text', nargs='?', default=None, help='Words to find in name or description')
+    query.add_argument('--host', default=None, help='Only organizations linking to this host')
+    query.add_argument('--status', default=None, help='Only this status bucket (pending/success/failed/error)')
+    query.add_argument('--url', default=None, help='Exact organization URL')
+    query.add_argument('--limit', type=int, default=20, help='Maximum results (default: 20)')
+    query.add_argument('--links', action='store_true', help='Also list each organization\'s links')
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'build':
+        if not os.path.exists(args.input):
+            print(f"Error: Input file {args.input} not found!")
+            sys.exit(1)
+        started = time.perf_counter()
+        counts = build_index(args.input, args.db)
+        print(f"Indexed {counts['orgs']} organizations and {counts['links']} links into {args.db} "
+              f"in {time.perf_counter() - started:.1f}s")
+        return
+
+    if not (args.text or args.host or args.status or args.url):
+        parser.error("query needs search text or at least one of --host, --status, --url")
+    try:
+        index = OrgIndex(args.db)
+    except FileNotFoundError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    started = time.perf_counter()
+    rows = index.query(args.text, args.host, args.status, args.url, args.limit)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    for row in rows:
+        description = (row['description'] or '')[:100]
+        print(f"{row['organization_name']}  {row['organization_url']}  [{row['status']}]")
+        if description:
+            print(f"    {description}")
+        if args.links:
+            for link in index.links(row['org_id']):
+                print(f"    {link['link_type']:<13} {link['url']}")
+    print(f"{len(rows)} results in {elapsed_ms:.1f} ms")
+    index.close()
+
+
+if __name__ == "__main__":
+    main()
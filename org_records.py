@@ -0,0 +1,114 @@
+"""
+Compact Phase 2 Result Records
+Slotted per-organization records for the checkpoint, kept once per row
+(a re-scrape replaces the row's record instead of appending another one),
+with repeated short values ('Null', 'success', dates, counts) interned so
+every row shares one string object.
+"""
+
+import sys
+from typing import Dict, Iterable, Iterator
+
+import numpy as np
+
+# Result columns Phase 2 adds to the Phase 1 CSV, in output order
+RESULT_FIELDS = (
+    'github_links',
+    'website_links',
+    'social_media_links',
+    'location',
+    'description',
+    'member_count',
+    'model_count',
+    'dataset_count',
+    'last_updated',
+    'scrape_status',
+    'scrape_timestamp',
+)
+
+# Fields whose values repeat across organizations; links, descriptions and
+# timestamps are mostly unique and would only grow the intern table
+INTERNED_FIELDS = frozenset({
+    'location', 'member_count', 'model_count', 'dataset_count', 'last_updated', 'scrape_status',
+})
+
+
+def compact_value(field: str, value):
+    """Intern short repeated string values (always 'Null')."""
+    if isinstance(value, str) and (value == 'Null' or field in INTERNED_FIELDS):
+        return sys.intern(value)
+    return value
+
+
+class OrgRecord:
+    """One organization's Phase 2 result (row index plus RESULT_FIELDS)."""
+
+    __slots__ = ('index',) + RESULT_FIELDS
+
+    def __init__(self, index: int, **fields):
+        self.index = int(index)
+        for field in RESULT_FIELDS:
+            setattr(self, field, compact_value(field, fields.get(field)))
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'OrgRecord':
+        """Record from a checkpoint/result dict with an 'index' key (unknown keys are ignored)."""
+        return cls(**data)
+
+    def to_dict(self) -> Dict:
+        """Checkpoint JSON form: {'index': ..., <result fields>}."""
+        data = {'index': self.index}
+        for field in RESULT_FIELDS:
+            data[field] = getattr(self, field)
+        return data
+
+
+class CheckpointRecords:
+    """
+    Latest OrgRecord per row, in first-seen order. Row -> position lookups use
+    an int32 array (-1 = no record) instead of a dict.
+    """
+
+    def __init__(self, records: Iterable = ()):
+        """
+        Args:
+            records: OrgRecords or checkpoint dicts; later records for a row replace earlier ones
+        """
+        self._records = []
+        self._positions = np.full(0, -1, dtype=np.int32)
+        for record in records:
+            self.add(record)
+
+    def add(self, record):
+        """Store a record (OrgRecord or dict), replacing any earlier one for the same row."""
+        if not isinstance(record, OrgRecord):
+            record = OrgRecord.from_dict(record)
+        index = record.index
+        if index >= len(self._positions):
+            grown = np.full(max(index + 1, 2 * len(self._positions)), -1, dtype=np.int32)
+            grown[:len(self._positions)] = self._positions
+            self._positions = grown
+        position = self._positions[index]
+        if position >= 0:
+            self._records[position] = record
+        else:
+            self._positions[index] = len(self._records)
+            self._records.append(record)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __iter__(self) -> Iterator[OrgRecord]:
+        return iter(self._records)
+
+    def __bool__(self) -> bool:
+        return bool(self._records)
+
+
+def checkpoint_json_default(obj):
+    """json.dump default= hook for CheckpointRecords and OrgRecord."""
+    if isinstance(obj, CheckpointRecords):
+        return list(obj)  # each record is converted as the encoder reaches it
+    if isinstance(obj, OrgRecord):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
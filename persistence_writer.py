@@ -0,0 +1,155 @@
+"""
+Background Persistence for Phase 2
+A writer thread that takes scrape results off the fetch loop, applies them to
+the in-memory state and group-commits the checkpoint and CSV once enough
+results (or enough time) have accumulated.
+
+Durability levels for the files it writes (see durable_open):
+- none:   write the file in place (a crash mid-write can leave it truncated)
+- atomic: write a temp file next to it and os.replace() it over the old one
+- fsync:  atomic, plus fsync of the temp file and its directory before returning
+"""
+
+import logging
+import os
+import queue
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Optional
+
+DURABILITY_LEVELS = ('none', 'atomic', 'fsync')
+
+
+@contextmanager
+def durable_open(path: str, durability: str = 'atomic', mode: str = 'w', encoding: Optional[str] = 'utf-8'):
+    """
+    Open a file for writing at the given durability level.
+
+    Args:
+        path: Destination file
+        durability: 'none', 'atomic' or 'fsync' (see module docstring)
+        mode: File mode ('w' or 'wb')
+        encoding: Text encoding (ignored for binary modes)
+
+    Yields:
+        Open file object; the destination is only replaced if the block succeeds
+    """
+    if durability not in DURABILITY_LEVELS:
+        raise ValueError(f"Unknown durability level {durability!r} (expected one of {', '.join(DURABILITY_LEVELS)})")
+    if 'b' in mode:
+        encoding = None
+
+    directory = os.path.dirname(os.path.abspath(path))
+    if durability == 'none':
+        with open(path, mode, encoding=encoding, newline='' if encoding else None) as f:
+            yield f
+        return
+
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{os.path.basename(path)}.", suffix='.tmp', dir=directory)
+    try:
+        with os.fdopen(fd, mode, encoding=encoding, newline='' if encoding else None) as f:
+            yield f
+            if durability == 'fsync':
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    if durability == 'fsync':
+        dir_fd = os.open(directory, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+class PersistenceWriter:
+    """
+    Applies submitted results on a background thread and calls commit() after
+    every batch_size results or interval seconds, whichever comes first.
+
+    apply() and commit() always run on the writer thread, so the state they
+    touch (dataframe, checkpoint data) needs no locking as long as the
+    submitting thread leaves it alone while the writer is running.
+    """
+
+    def __init__(self, apply: Callable, commit: Callable[[], None], batch_size: int = 10,
+                 interval: float = 30.0, logger: Optional[logging.Logger] = None):
+        """
+        Args:
+            apply: Called with each submitted item, in order
+            commit: Writes the applied state to disk (checkpoint, CSV)
+            batch_size: Commit after this many applied items
+            interval: Commit at least this often (seconds) while items are pending
+            logger: Logger for errors (default: module logger)
+        """
+        self.apply = apply
+        self.commit = commit
+        self.batch_size = max(1, batch_size)
+        self.interval = interval
+        self.logger = logger or logging.getLogger(__name__)
+        self.commits = 0
+        self.applied = 0
+        self._queue = queue.Queue()
+        self._thread = None
+
+    def start(self) -> 'PersistenceWriter':
+        self._thread = threading.Thread(target=self._run, name='persistence-writer', daemon=True)
+        self._thread.start()
+        return self
+
+    def submit(self, item):
+        """Hand a result to the writer (never blocks on disk I/O)."""
+        self._queue.put(item)
+
+    def close(self):
+        """Apply everything submitted so far, commit it (at least one commit per run) and stop the thread."""
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> 'PersistenceWriter':
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _run(self):
+        uncommitted = 0
+        last_commit = time.monotonic()
+        while True:
+            timeout = max(0.0, last_commit + self.interval - time.monotonic()) if uncommitted else None
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = ...  # interval elapsed with results pending
+
+            if item is None:
+                if uncommitted or not self.commits:
+                    self._commit()
+                return
+            if item is not ...:
+                try:
+                    self.apply(item)
+                    self.applied += 1
+                    uncommitted += 1
+                except Exception as e:
+                    self.logger.error(f"Failed to apply result: {e}")
+
+            if uncommitted and (uncommitted >= self.batch_size or time.monotonic() - last_commit >= self.interval):
+                self._commit()
+                uncommitted = 0
+                last_commit = time.monotonic()
+
+    def _commit(self):
+        try:
+            self.commit()
+            self.commits += 1
+        except Exception as e:
+            self.logger.error(f"Failed to commit results: {e}")
@@ -14,16 +14,50 @@ from bs4 import BeautifulSoup
 import time
 import logging
 from datetime import datetime
+from functools import partial
 import json
 import re
 from urllib.parse import urljoin, urlparse
 import os
-from typing import Dict, List, Optional, Tuple
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import contextmanager, nullcontext
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from change_feed import ChangeFeed
+from config import (CANONICAL_HF_BASE, CHROME_HALFLIFE_PAGES, CHROME_LINK_THRESHOLD, CHROME_MIN_PAGES, HF_BASE_URL,
+                    LOG_SUCCESS_SAMPLE_RATE, MAX_CONCURRENCY, MEMORY_CEILING_MB, PERSIST_BATCH_SIZE, PERSIST_DURABILITY,
+                    PERSIST_INTERVAL, REFRESH_TTL_DAYS, REFRESH_DAILY_BUDGET, REFRESH_ACTIVITY_WEIGHT,
+                    REQUEST_DELAY, RESULT_SINKS, RUNTIME_CONTROL_FILE, SCRAPE_CONCURRENCY, STATS_REPORT_INTERVAL, WORK_QUEUE_DB, WORK_QUEUE_BATCH_SIZE,
+                    WORK_QUEUE_LEASE_SECONDS, WORK_QUEUE_MAX_ATTEMPTS, WORK_QUEUE_POLL_INTERVAL)
+from link_classifier import LinkClassifier
+from link_table import build_link_table, link_table_path
+from memory_watchdog import MemoryWatchdog, release_tree, tune_gc
+from org_records import RESULT_FIELDS, CheckpointRecords, OrgRecord, checkpoint_json_default, compact_value
+from persistence_writer import DURABILITY_LEVELS, PersistenceWriter, durable_open
+from phase2_shards import parse_shard, select_shard, shard_path
+from refresh_scheduler import build_refresh_queue
+from result_sinks import SINK_CSV_PATH, SINK_DB_PATH, SINK_NAMES, ResultSink, SinkDispatcher, create_sinks
+from profiling import ScrapeProfiler
+from rate_limiter import RateLimiter
+from runtime_settings import DEFAULT_SETTINGS, RuntimeSettings, ScrapeSettings, validate_settings
+from scrape_logging import EventLog, setup_queue_logging
+from scrape_stats import ScrapeStats
+from site_chrome import ChromeFilter
+from status_index import STATUS_BUCKETS, StatusIndex
+from work_queue import WorkQueue, default_worker_id
+
+ORGS_QUEUE = "phase2_orgs"  # work queue name for organization detail pages
 
 # (Google Sheets integration removed) - local CSV-only saver
 
 class Phase2OrganizationScraper:
-    def __init__(self, input_csv_path: str, output_csv_path: str, checkpoint_file: str = "output/phase2_checkpoint.json"):
+    def __init__(self, input_csv_path: str, output_csv_path: str, checkpoint_file: str = "output/phase2_checkpoint.json",
+                 shard: Optional[Tuple[int, int]] = None, base_url: str = HF_BASE_URL,
+                 log_sample_rate: float = LOG_SUCCESS_SAMPLE_RATE, durability: str = PERSIST_DURABILITY,
+                 link_table: bool = True, change_feed: bool = False,
+                 settings: ScrapeSettings = DEFAULT_SETTINGS, control_file: Optional[str] = None,
+                 sinks: Sequence[ResultSink] = (), memory_ceiling_mb: float = MEMORY_CEILING_MB):
         """
         Initialize the Phase 2 scraper (local CSV output only)
         
@@ -31,19 +65,66 @@ class Phase2OrganizationScraper:
             input_csv_path: Path to Phase 1 CSV file
             output_csv_path: Path to save enhanced CSV
             checkpoint_file: Path to checkpoint file for resume functionality
+            shard: Optional (shard_index, num_shards) - only scrape organizations in this
+                   hash shard (pass per-shard output/checkpoint paths, see phase2_shards)
+            base_url: Site to fetch organization pages from (default: HF_BASE_URL; a mock
+                      server for load tests). huggingface.co URLs from the CSV are rewritten to it.
+            log_sample_rate: Fraction of successful organizations echoed to the log
+                             (all results go to the JSON-lines events file)
+            durability: How checkpoint/CSV files are written: 'none', 'atomic' or 'fsync'
+                        (see persistence_writer)
+            link_table: Write the long-format org -> link table (see link_table) next to
+                        the output CSV at the end of a run
+            change_feed: Write the organizations added/removed/modified since the previous
+                         run to output/changes at the end of a run (see change_feed)
+            settings: Concurrency, request delay, timeout and retries (default: config.py)
+            control_file: JSON file the settings are re-read from during a run
+                          (see runtime_settings; None: fixed settings)
+            sinks: Extra destinations results are streamed to in the background
+                   (see result_sinks)
+            memory_ceiling_mb: Stop taking new organizations while RSS is above this
+                               (0: never; see memory_watchdog)
         """
         self.input_csv_path = input_csv_path
         self.output_csv_path = output_csv_path
         self.checkpoint_file = checkpoint_file
-        
-        # Retry configuration
-        self.retry_delays = [30, 60, 180]  # 30s, 60s, 3min
+        self.shard = shard
+        self.base_url = base_url.rstrip('/')
+        self.log_sample_rate = log_sample_rate
+        self.durability = durability
+        self.link_table_path = link_table_path(output_csv_path) if link_table else None
+        feed_name = 'phase2' if shard is None else f"phase2.shard{shard[0]}of{shard[1]}"
+        self.change_feed = ChangeFeed(feed_name, durability=durability) if change_feed else None
+        self.writer: Optional[PersistenceWriter] = None  # set while a run mode persists in the background
+        # Rows of an in-order run not yet finished (last_processed_index only passes finished rows)
+        self.checkpoint_order: Optional[deque] = None
+        self.finished_ahead = set()
+        self.sinks = SinkDispatcher(sinks)
+        
+        # Link categorization (host table lookup, cached per URL)
+        self.link_classifier = LinkClassifier()
+        # Links shared by nearly every page (site header/footer), learned as pages come in
+        self.chrome_filter = ChromeFilter(CHROME_LINK_THRESHOLD, CHROME_MIN_PAGES, CHROME_HALFLIFE_PAGES)
         
         # Setup logging
         self.setup_logging()
         
+        # Request settings, adjustable while running through the control file
+        self.runtime = RuntimeSettings(control_file, settings)
+        self.throttle = RateLimiter(0)
+        self.runtime.on_change(self.apply_settings)
+        
+        # Per-stage timings and throughput/ETA reporting
+        stats_file = "output/phase2_stats.json" if shard is None else shard_path("output/phase2_stats.json", shard)
+        self.stats = ScrapeStats('orgs', stats_file, STATS_REPORT_INTERVAL, self.logger)
+        # RSS logged per 1k organizations, intake paused above the ceiling
+        self.watchdog = MemoryWatchdog('orgs', ceiling_mb=memory_ceiling_mb, log=self.logger)
+        
         # Load data
         self.organizations_df = pd.read_csv(input_csv_path)
+        if shard is not None:
+            self.organizations_df = select_shard(self.organizations_df, shard)
+            self.logger.info(f"Shard {shard[0]}/{shard[1]}: {len(self.organizations_df)} organizations")
         self.processed_count = 0
         
         # Checkpoint data
@@ -51,6 +132,9 @@ class Phase2OrganizationScraper:
         
         # Session for requests
         self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=MAX_CONCURRENCY)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
@@ -62,24 +146,21 @@ class Phase2OrganizationScraper:
         self.logger.info("Google Sheets integration removed; saving locally to CSV only")
         
     def setup_logging(self):
-        """Setup logging to both file and console"""
+        """Setup queue-backed logging to file and console, and the per-organization events file"""
         log_filename = f"output/phase2_scraper_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+        if self.shard is not None:
+            log_filename = shard_path(log_filename, self.shard)
         
         # Create output directory if it doesn't exist
         os.makedirs("output", exist_ok=True)
         
-        # Configure logging
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(log_filename, encoding='utf-8'),
-                logging.StreamHandler()
-            ]
-        )
+        # Configure logging (formatting and writes happen on a background thread)
+        setup_queue_logging(log_filename)
         
         self.logger = logging.getLogger(__name__)
-        self.logger.info(f"Phase 2 scraper initialized. Log file: {log_filename}")
+        events_filename = log_filename.replace('phase2_scraper_', 'phase2_events_', 1)[:-len('.log')] + '.jsonl'
+        self.events = EventLog(events_filename, self.logger, self.log_sample_rate)
+        self.logger.info(f"Phase 2 scraper initialized. Log file: {log_filename}, events: {events_filename}")
         
     def load_checkpoint(self) -> Dict:
         """Load checkpoint data if exists"""
@@ -87,69 +168,90 @@ class Phase2OrganizationScraper:
             try:
                 with open(self.checkpoint_file, 'r') as f:
                     checkpoint = json.load(f)
+                checkpoint['processed_organizations'] = CheckpointRecords(checkpoint.get('processed_organizations', []))
                 self.logger.info(f"Loaded checkpoint. Last processed: {checkpoint.get('last_processed_index', 0)}")
                 return checkpoint
             except Exception as e:
                 self.logger.warning(f"Could not load checkpoint: {e}")
         
-        return {'last_processed_index': 0, 'processed_organizations': []}
+        return {'last_processed_index': 0, 'processed_organizations': CheckpointRecords()}
     
-    def save_checkpoint(self, index: int, org_data: Dict):
-        """Save checkpoint data"""
-        self.checkpoint_data['last_processed_index'] = index
-        self.checkpoint_data['processed_organizations'].append(org_data)
-        
+    def write_checkpoint(self):
+        """Write checkpoint data to disk"""
         try:
             os.makedirs(os.path.dirname(self.checkpoint_file), exist_ok=True)
-            with open(self.checkpoint_file, 'w') as f:
-                json.dump(self.checkpoint_data, f, indent=2)
-            self.logger.debug(f"Checkpoint saved at index {index}")
+            with self.stats.stage('checkpoint'), durable_open(self.checkpoint_file, self.durability) as f:
+                json.dump(self.checkpoint_data, f, indent=2, default=checkpoint_json_default)
+            self.logger.debug(f"Checkpoint saved at index {self.checkpoint_data['last_processed_index']}")
         except Exception as e:
             self.logger.error(f"Failed to save checkpoint: {e}")
     
     def initialize_enhanced_dataframe(self):
         """Initialize the enhanced dataframe with new columns"""
         # Add new columns if they don't exist
-        new_columns = [
-            'github_links',
-            'website_links', 
-            'social_media_links',
-            'location',
-            'description',
-            'member_count',
-            'model_count',
-            'dataset_count',
-            'last_updated',
-            'scrape_status',
-            'scrape_timestamp'
-        ]
-        
-        for col in new_columns:
+        for col in RESULT_FIELDS:
             if col not in self.organizations_df.columns:
                 self.organizations_df[col] = None
+            else:
+                # Columns read back from a previous output CSV may be inferred as
+                # float (all empty) or numeric; keep them generic so any value fits
+                self.organizations_df[col] = self.organizations_df[col].astype(object)
                 
-        # Restore processed data from checkpoint
-        if self.checkpoint_data.get('processed_organizations'):
-            for org_data in self.checkpoint_data['processed_organizations']:
-                index = org_data.get('index')
-                if index is not None and index < len(self.organizations_df):
-                    for key, value in org_data.items():
-                        if key != 'index' and key in self.organizations_df.columns:
-                            self.organizations_df.at[index, key] = value
+        # Restore processed data from checkpoint (one record per row), a column at a time
+        records = [record for record in self.checkpoint_data.get('processed_organizations', [])
+                   if record.index < len(self.organizations_df)]
+        if records:
+            rows = [record.index for record in records]
+            for col in RESULT_FIELDS:
+                values = self.organizations_df[col].to_numpy(dtype=object, copy=True)
+                values[rows] = [getattr(record, col) for record in records]
+                self.organizations_df[col] = values
+        
+        # Index rows by scrape status so run modes can go straight to them
+        self.status_index = StatusIndex.from_series(self.organizations_df['scrape_status'])
+        self.logger.info(f"Status counts: {self.status_index.counts()}")
+    
+    def rebase_url(self, url: str) -> str:
+        """Point a huggingface.co URL at the configured base URL"""
+        if self.base_url != CANONICAL_HF_BASE and url.startswith(CANONICAL_HF_BASE):
+            return self.base_url + url[len(CANONICAL_HF_BASE):]
+        return url
+    
+    @property
+    def settings(self) -> ScrapeSettings:
+        """Request settings currently in effect"""
+        return self.runtime.current
+    
+    def apply_settings(self, settings: ScrapeSettings):
+        """Pace requests REQUEST_DELAY apart (across all fetch threads)"""
+        self.throttle.set_rate(1.0 / settings.request_delay if settings.request_delay > 0 else 0)
     
     def make_request_with_retry(self, url: str) -> Tuple[Optional[requests.Response], str]:
         """
         Make HTTP request with progressive retry delays
         
+        Timeout, retries and delays are read from the current settings once per
+        request, so a settings change applies from the next organization.
+        
         Returns:
             Tuple of (response, status_message)
         """
-        for attempt, delay in enumerate(self.retry_delays):
+        settings = self.settings
+        retry_delays = settings.retry_delays
+        for attempt in range(settings.max_retries):
+            delay = retry_delays[min(attempt, len(retry_delays) - 1)]
+            if attempt:
+                self.stats.count('retries')
             try:
-                response = self.session.get(url, timeout=60)  # Increased timeout to 60s
+                self.throttle.wait()
+                with self.stats.stage('fetch'):
+                    response = self.session.get(self.rebase_url(url), timeout=settings.request_timeout)
+                self.stats.count('requests')
+                self.stats.count('bytes', len(response.content))
                 if response.status_code == 200:
                     return response, "success"
                 elif response.status_code == 429:  # Rate limited
+                    self.stats.count('rate_limited')
                     self.logger.warning(f"Rate limited on {url}. Waiting {delay} seconds...")
                     time.sleep(delay)
                     continue
@@ -157,48 +259,42 @@ class Phase2OrganizationScraper:
                     self.logger.warning(f"HTTP {response.status_code} for {url}")
                     
             except requests.Timeout:
+                self.stats.count('errors')
                 self.logger.warning(f"Timeout for {url} (attempt {attempt + 1})")
-                if attempt < len(self.retry_delays) - 1:
+                if attempt < settings.max_retries - 1:
                     self.logger.info(f"Waiting {delay} seconds before retry...")
                     time.sleep(delay)
             except requests.RequestException as e:
+                self.stats.count('errors')
                 self.logger.warning(f"Request failed for {url} (attempt {attempt + 1}): {e}")
                 
-                if attempt < len(self.retry_delays) - 1:
+                if attempt < settings.max_retries - 1:
                     self.logger.info(f"Waiting {delay} seconds before retry...")
                     time.sleep(delay)
         
         return None, "failed_after_retries"
     
-    def extract_links_by_pattern(self, soup: BeautifulSoup, patterns: Dict[str, List[str]]) -> Dict[str, List[str]]:
-        """Extract links based on patterns"""
-        results = {}
-        
-        for link_type, pattern_list in patterns.items():
-            found_links = []
-            
-            try:
-                # Look for links in href attributes
-                for pattern in pattern_list:
-                    try:
-                        links = soup.find_all('a', href=re.compile(pattern, re.I))
-                        for link in links:
-                            href = link.get('href', '')
-                            if href and href.strip() and href not in found_links:
-                                # Convert relative URLs to absolute
-                                if href.startswith('/'):
-                                    href = 'https://huggingface.co' + href
-                                found_links.append(href)
-                    except re.error as e:
-                        self.logger.warning(f"Regex error for pattern '{pattern}': {e}")
-                        continue
-                
-                results[link_type] = found_links if found_links else ['Null']
-            except Exception as e:
-                self.logger.warning(f"Error extracting {link_type} links: {e}")
-                results[link_type] = ['Null']
+    def extract_links(self, soup: BeautifulSoup) -> Dict[str, List[str]]:
+        """
+        Categorize the organization's links (github, website, social_media; 'Null' if none)
         
-        return results
+        Only anchors inside <main> are considered when the page has one, which leaves
+        out the site header and footer. Absolute links that the chrome filter has seen
+        on nearly every recent page are dropped before classification.
+        """
+        try:
+            region = soup.find('main') or soup
+            hrefs = [href for href in (a.get('href') for a in region.find_all('a', href=True))
+                     if href.startswith(('http', '//'))]
+            if self.chrome_filter.observe(hrefs):
+                self.logger.info(f"Site-wide links learned ({len(self.chrome_filter.chrome)}): "
+                                 f"{', '.join(sorted(self.chrome_filter.chrome)) or 'none'}")
+            chrome = self.chrome_filter.chrome
+            links = self.link_classifier.categorize(href for href in hrefs if href not in chrome)
+        except Exception as e:
+            self.logger.warning(f"Error extracting links: {e}")
+            links = {}
+        return {category: links.get(category) or ['Null'] for category in ('github', 'website', 'social_media')}
     
     def extract_text_content(self, soup: BeautifulSoup, selectors: List[str]) -> str:
         """Extract text content using CSS selectors"""
@@ -215,7 +311,7 @@ class Phase2OrganizationScraper:
         Returns:
             Dictionary with extracted information
         """
-        self.logger.info(f"Scraping details for: {org_url}")
+        self.logger.debug(f"Scraping details for: {org_url}")
         
         response, status = self.make_request_with_retry(org_url)
         
@@ -235,17 +331,25 @@ class Phase2OrganizationScraper:
                 'scrape_timestamp': datetime.now().isoformat()
             }
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        with self.stats.stage('parse'):
+            soup = BeautifulSoup(response.text, 'html.parser')
         
-        # Define patterns for different types of links
-        link_patterns = {
-            'github': [r'github\.com', r'gitlab\.com'],
-            'website': [r'https?://[a-zA-Z0-9\-\.]+\.[a-zA-Z]{2,}(?![^"\']*(?:huggingface|github|twitter|linkedin|facebook|instagram|youtube))'],
-            'social_media': [r'twitter\.com', r'x\.com', r'linkedin\.com', r'facebook\.com', r'instagram\.com', r'youtube\.com']
-        }
+        try:
+            with self.stats.stage('extract'):
+                return self.extract_details_from_soup(soup, org_url)
+        finally:
+            # Free the tree now; its reference cycles would otherwise wait for the collector
+            release_tree(soup)
+    
+    def extract_details_from_soup(self, soup: BeautifulSoup, org_url: str) -> Dict[str, any]:
+        """
+        Extract organization details from a parsed organization page
         
+        Returns:
+            Dictionary with extracted information
+        """
         # Extract links
-        extracted_links = self.extract_links_by_pattern(soup, link_patterns)
+        extracted_links = self.extract_links(soup)
         
         # Extract organization details
         try:
@@ -330,14 +434,197 @@ class Phase2OrganizationScraper:
     def save_progress(self):
         """Save current progress to CSV"""
         try:
-            self.organizations_df.to_csv(self.output_csv_path, index=False)
-            self.logger.info(f"Progress saved to {self.output_csv_path}")
+            with self.stats.stage('csv'):
+                with durable_open(self.output_csv_path, self.durability) as f:
+                    self.organizations_df.to_csv(f, index=False)
+            self.logger.debug(f"Progress saved to {self.output_csv_path}")
         except Exception as e:
             self.logger.error(f"Failed to save progress: {e}")
     
     
-    def run_phase2_scraping(self):
-        """Run the Phase 2 scraping process"""
+    def export_run_outputs(self):
+        """End-of-run outputs derived from the dataframe: link table and change feed"""
+        self.export_link_table()
+        if self.change_feed is not None:
+            try:
+                self.change_feed.publish(self.organizations_df)
+            except Exception as e:
+                self.logger.error(f"Failed to write change feed: {e}")
+    
+    def export_link_table(self):
+        """Write the long-format org -> link table next to the output CSV"""
+        if self.link_table_path is None:
+            return
+        try:
+            table = build_link_table(self.organizations_df, self.link_classifier)
+            with durable_open(self.link_table_path, self.durability) as f:
+                table.to_csv(f, index=False)
+            self.logger.info(f"Link table: {len(table)} links saved to {self.link_table_path}")
+        except Exception as e:
+            self.logger.error(f"Failed to write link table: {e}")
+    
+    def apply_details(self, index: int, details: Dict):
+        """Write extracted details into the dataframe row and status index"""
+        for key, value in details.items():
+            self.organizations_df.at[index, key] = compact_value(key, value)
+        self.status_index.update(index, details.get('scrape_status'))
+        if self.sinks:
+            self.sinks.submit({'organization_name': self.organizations_df.at[index, 'organization_name'],
+                               'organization_url': self.organizations_df.at[index, 'organization_url'],
+                               **details})
+    
+    def apply_result(self, result: Tuple[int, Dict, bool]):
+        """
+        Apply one scrape result to the dataframe, status index and checkpoint data
+        (in memory only; see commit_progress)
+        
+        Args:
+            result: (row index, extracted details, advance last_processed_index)
+        """
+        index, details, advance = result
+        self.apply_details(index, details)
+        if advance:
+            self.advance_checkpoint(index)
+        self.checkpoint_data['processed_organizations'].add(OrgRecord(index, **details))
+    
+    def advance_checkpoint(self, index: int):
+        """
+        Move last_processed_index for a finished row. Rows finish out of order
+        with concurrency > 1, so during an in-order run (checkpoint_order set) it
+        only moves up to the highest row below which every row has finished;
+        rows still in flight are picked up again on resume.
+        """
+        if self.checkpoint_order is None:
+            self.checkpoint_data['last_processed_index'] = index
+            return
+        self.finished_ahead.add(index)
+        while self.checkpoint_order and self.checkpoint_order[0] in self.finished_ahead:
+            done = self.checkpoint_order.popleft()
+            self.finished_ahead.discard(done)
+            self.checkpoint_data['last_processed_index'] = done
+    
+    def commit_progress(self):
+        """Write the checkpoint and output CSV"""
+        self.write_checkpoint()
+        self.save_progress()
+        self.logger.info(f"Progress saved. {len(self.checkpoint_data['processed_organizations'])} organizations "
+                         f"in checkpoint, status counts: {self.status_index.counts()}")
+    
+    @contextmanager
+    def background_persistence(self):
+        """
+        Route process_organization() results through a PersistenceWriter thread that
+        applies them and group-commits checkpoint + CSV (PERSIST_BATCH_SIZE results
+        or PERSIST_INTERVAL seconds), and through the result sink threads. Everything
+        is committed and uploaded when the block exits.
+        
+        While active, the dataframe and checkpoint data belong to the writer thread:
+        the fetch loop must only read the input columns it copied beforehand.
+        """
+        self.writer = PersistenceWriter(self.apply_result, self.commit_progress, PERSIST_BATCH_SIZE,
+                                        PERSIST_INTERVAL, self.logger)
+        try:
+            with self.result_sinks(), self.writer:
+                yield self.writer
+        finally:
+            self.writer = None
+    
+    @contextmanager
+    def result_sinks(self):
+        """Run the result sink threads for the block; pending results are uploaded on exit"""
+        with self.sinks:
+            yield self.sinks
+        if self.sinks:
+            self.logger.info(f"Result sinks: {self.sinks.stats()}")
+    
+    def log_details(self, index: int, org_name: str, org_url: str, details: Dict):
+        """
+        Log the outcome of one organization: a JSON-lines event (fields that are
+        'Null' are omitted) plus a sampled [OK] line or an [ERROR] line
+        """
+        status = details.get('scrape_status', 'unknown')
+        event = {'row': int(index), 'org': org_name, 'url': org_url, 'status': status}
+        event.update((key, value) for key, value in details.items()
+                     if key not in ('scrape_status', 'scrape_timestamp') and value != 'Null')
+        
+        if status == 'success':
+            github = details.get('github_links', 'Null')
+            website = details.get('website_links', 'Null') 
+            social = details.get('social_media_links', 'Null')
+            location = details.get('location', 'Null')
+            
+            message = (f"[OK] row {index + 1} {org_name}: GitHub={github[:50]}{'...' if len(github) > 50 else ''}, "
+                       f"Website={website[:50]}{'...' if len(website) > 50 else ''}, "
+                       f"Social={social[:50]}{'...' if len(social) > 50 else ''}, "
+                       f"Location={location}")
+        else:
+            message = f"[ERROR] row {index + 1} {org_name}: {status}"
+        
+        self.events.record(event, status == 'success', message)
+    
+    def process_organization(self, index: int, org_name: str, org_url: str, advance_checkpoint: bool = True) -> Dict:
+        """
+        Scrape one organization, update its dataframe row and checkpoint the result
+        (through the background writer when background_persistence() is active)
+        
+        Args:
+            index: Row index in organizations_df
+            org_name: Organization name (for logging)
+            org_url: Organization profile URL
+            advance_checkpoint: Move last_processed_index to this row (False for out-of-order runs)
+            
+        Returns:
+            Dictionary with extracted information
+        """
+        details = self.extract_organization_details(org_url)
+        self.log_details(index, org_name, org_url, details)
+        
+        # Hand the result to the background writer, or save it right away
+        if self.writer is not None:
+            self.writer.submit((index, details, advance_checkpoint))
+        else:
+            self.apply_result((index, details, advance_checkpoint))
+            self.write_checkpoint()
+        self.stats.item_done()
+        
+        return details
+    
+    def run_concurrently(self, jobs: Iterable[Callable[[], object]]):
+        """
+        Run jobs (typically process_organization calls) on up to `concurrency`
+        fetch threads, re-reading the runtime settings as jobs finish. Intake
+        also waits while the memory watchdog reports RSS above its ceiling.
+        
+        Lowering the concurrency only stops new jobs from starting until enough
+        running ones have finished; nothing in flight is cancelled. The jobs
+        iterator is advanced on the calling thread, one job per free slot.
+        
+        Args:
+            jobs: Callables taking no arguments; an exception in one is re-raised
+                  here after the jobs already started have finished
+        """
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENCY, thread_name_prefix='phase2-fetch') as pool:
+            in_flight = set()
+            for job in jobs:
+                while len(in_flight) >= self.settings.concurrency:
+                    done, in_flight = wait(in_flight, timeout=self.runtime.poll_interval,
+                                           return_when=FIRST_COMPLETED)
+                    for future in done:
+                        future.result()
+                    self.runtime.check()
+                in_flight.add(pool.submit(job))
+                self.runtime.check()
+                self.watchdog.tick()
+            for future in in_flight:
+                future.result()
+    
+    def run_phase2_scraping(self, limit: Optional[int] = None):
+        """
+        Run the Phase 2 scraping process
+        
+        Args:
+            limit: Stop after this many organizations (default: all)
+        """
         self.logger.info("Starting Phase 2 scraping...")
         
         total_orgs = len(self.organizations_df)
@@ -346,66 +633,321 @@ class Phase2OrganizationScraper:
         self.logger.info(f"Total organizations: {total_orgs}")
         self.logger.info(f"Starting from index: {start_index}")
         
-        for index in range(start_index, total_orgs):
-            row = self.organizations_df.iloc[index]
-            org_name = row['organization_name']
-            org_url = row['organization_url']
-            
-            # Skip if already processed successfully
-            if pd.notna(row.get('scrape_status')) and row.get('scrape_status') == 'success':
-                self.logger.info(f"Skipping already processed: {org_name}")
-                continue
-            
-            self.logger.info(f"Processing {index + 1}/{total_orgs}: {org_name}")
-            
-            # Extract details
-            details = self.extract_organization_details(org_url)
-            
-            # Update dataframe
-            for key, value in details.items():
-                self.organizations_df.at[index, key] = value
-            
-            # Log results
-            status = details.get('scrape_status', 'unknown')
-            if status == 'success':
-                github = details.get('github_links', 'Null')
-                website = details.get('website_links', 'Null') 
-                social = details.get('social_media_links', 'Null')
-                location = details.get('location', 'Null')
+        # Already successful rows are skipped via the status index
+        pending = [index for index in self.status_index.indices(['pending', 'failed', 'error'])
+                   if index >= start_index]
+        self.logger.info(f"Skipping {total_orgs - start_index - len(pending)} already processed organizations")
+        if limit is not None:
+            pending = pending[:limit]
+        
+        names = self.organizations_df['organization_name'].to_numpy()
+        urls = self.organizations_df['organization_url'].to_numpy()
+        
+        def jobs():
+            for done, index in enumerate(pending):
+                self.stats.maybe_report(len(pending) - done)
+                org_name = names[index]
                 
-                self.logger.info(f"[OK] {org_name}: GitHub={github[:50]}{'...' if len(github) > 50 else ''}, "
-                               f"Website={website[:50]}{'...' if len(website) > 50 else ''}, "
-                               f"Social={social[:50]}{'...' if len(social) > 50 else ''}, "
-                               f"Location={location}")
-            else:
-                self.logger.warning(f"[ERROR] {org_name}: {status}")
+                self.logger.debug(f"Processing {index + 1}/{total_orgs}: {org_name}")
                 
-                if any(field == 'Null' for field in [details.get('github_links'), details.get('website_links'), 
-                                                   details.get('social_media_links'), details.get('location')]):
-                    self.logger.info("Some fields not findable - marked as Null")
-            
-            # Save checkpoint and progress
-            checkpoint_data = {'index': index, **details}
-            self.save_checkpoint(index, checkpoint_data)
-            
-            # Save progress every 10 organizations
-            if (index + 1) % 10 == 0:
-                self.save_progress()
-                self.logger.info(f"Progress saved. Completed {index + 1}/{total_orgs} organizations")
-            
-            # Small delay to be respectful
-            time.sleep(1)
+                yield partial(self.process_organization, index, org_name, urls[index])
         
-        # Final save
-        self.save_progress()
+        # Checkpoint/CSV writes happen on the writer thread, in batches
+        self.checkpoint_order, self.finished_ahead = deque(pending), set()
+        try:
+            with self.background_persistence():
+                self.run_concurrently(jobs())
+        finally:
+            self.checkpoint_order = None
+        
+        self.stats.report(0)
+        self.export_run_outputs()
         self.logger.info("Phase 2 scraping completed!")
         self.logger.info(f"Enhanced data saved to: {self.output_csv_path}")
+    
+    def run_only_status(self, buckets: List[str], limit: Optional[int] = None):
+        """
+        Re-scrape only the organizations currently in the given status buckets
+        
+        Args:
+            buckets: Status buckets to retry (see status_index.STATUS_BUCKETS),
+                     e.g. ['failed', 'error']
+            limit: Stop after this many organizations (default: all)
+        """
+        self.logger.info(f"Starting Phase 2 run for status: {', '.join(buckets)}")
+        
+        targets = self.status_index.indices(buckets)[:limit]
+        self.logger.info(f"Organizations to retry: {len(targets)}")
+        rows = self.organizations_df.iloc[targets][['organization_name', 'organization_url', 'scrape_status']]
+        
+        def jobs():
+            for count, (index, (org_name, org_url, old_status)) in enumerate(zip(targets, rows.itertuples(index=False)), 1):
+                self.stats.maybe_report(len(targets) - count + 1)
+                
+                self.logger.debug(f"Retrying {count}/{len(targets)} (row {index + 1}, was {old_status}): {org_name}")
+                yield partial(self.process_organization, index, org_name, org_url, advance_checkpoint=False)
+        
+        with self.background_persistence():
+            self.run_concurrently(jobs())
+        
+        self.stats.report(0)
+        self.export_run_outputs()
+        self.logger.info(f"Status run completed. Status counts: {self.status_index.counts()}")
+    
+    def enqueue_work(self, queue: WorkQueue, buckets: Optional[List[str]] = None) -> int:
+        """
+        Add organizations to the shared work queue (keyed by row index)
+        
+        Args:
+            queue: Shared work queue
+            buckets: Status buckets to enqueue (default: everything not yet successful)
+            
+        Returns:
+            Number of new tasks added
+        """
+        buckets = buckets or ['pending', 'failed', 'error']
+        rows = self.status_index.indices(buckets)
+        names = self.organizations_df['organization_name']
+        urls = self.organizations_df['organization_url']
+        
+        added = queue.enqueue(ORGS_QUEUE, ((index, {'index': index, 'name': names.iat[index], 'url': urls.iat[index]})
+                                           for index in rows))
+        self.logger.info(f"Enqueued {added} new organizations ({', '.join(buckets)}). Queue: {queue.stats(ORGS_QUEUE)}")
+        return added
+    
+    def run_queue_worker(self, queue: WorkQueue, worker_id: str):
+        """
+        Scrape organizations leased from the work queue until none are left
+        
+        Workers only write to the queue (no checkpoint/CSV), so any number can run
+        at once; use apply_queue_results() afterwards to build the output CSV.
+        
+        Args:
+            queue: Shared work queue
+            worker_id: Unique id of this worker
+        """
+        self.logger.info(f"Worker {worker_id} started. Queue: {queue.stats(ORGS_QUEUE)}")
+        scraped = 0
+        
+        try:
+            while True:
+                tasks = queue.lease(ORGS_QUEUE, worker_id, WORK_QUEUE_BATCH_SIZE, WORK_QUEUE_LEASE_SECONDS,
+                                    WORK_QUEUE_MAX_ATTEMPTS)
+                
+                if not tasks:
+                    stats = queue.stats(ORGS_QUEUE)
+                    if stats['leased'] == 0 and stats['expired'] == 0 and stats['pending'] == 0:
+                        break
+                    # Other workers still hold leases - wait in case one of them dies
+                    time.sleep(WORK_QUEUE_POLL_INTERVAL)
+                    continue
+                
+                self.stats.maybe_report(queue.stats(ORGS_QUEUE)['pending'] + len(tasks))
+                for position, task in enumerate(tasks):
+                    self.logger.debug(f"Processing row {task.payload['index'] + 1}: {task.payload['name']}")
+                    
+                    details = self.extract_organization_details(task.payload['url'])
+                    self.log_details(task.payload['index'], task.payload['name'], task.payload['url'], details)
+                    queue.complete(ORGS_QUEUE, task.key, details)
+                    scraped += 1
+                    self.stats.item_done()
+                    
+                    queue.renew(ORGS_QUEUE, worker_id, [t.key for t in tasks[position + 1:]],
+                                WORK_QUEUE_LEASE_SECONDS)
+                    self.runtime.check()
+                    self.watchdog.tick()
+        finally:
+            released = queue.release(ORGS_QUEUE, worker_id)
+            if released:
+                self.logger.info(f"Returned {released} unfinished organizations to the queue")
+        
+        self.stats.report(0)
+        self.logger.info(f"Worker {worker_id} finished: {scraped} organizations. Queue: {queue.stats(ORGS_QUEUE)}")
+    
+    def apply_queue_results(self, queue: WorkQueue) -> int:
+        """
+        Merge completed work-queue results into the dataframe, checkpoint and CSV
+        
+        Returns:
+            Number of results applied
+        """
+        applied = 0
+        with self.result_sinks():
+            for _, payload, details in queue.results(ORGS_QUEUE):
+                index = payload['index']
+                if index >= len(self.organizations_df) or self.organizations_df.at[index, 'organization_url'] != payload['url']:
+                    self.logger.warning(f"Queue result for row {index} does not match the input CSV - skipped")
+                    continue
+                self.apply_details(index, details)
+                self.checkpoint_data['processed_organizations'].add(OrgRecord(index, **details))
+                applied += 1
+        
+        if applied:
+            self.write_checkpoint()
+        self.save_progress()
+        self.export_run_outputs()
+        self.logger.info(f"Applied {applied} queue results. Status counts: {self.status_index.counts()}")
+        return applied
+    
+    def remaining_refresh_budget(self, daily_budget: int) -> int:
+        """Number of refresh requests still allowed today (budget is tracked in the checkpoint)"""
+        today = datetime.now().strftime('%Y-%m-%d')
+        budget_state = self.checkpoint_data.get('refresh_budget', {})
+        if budget_state.get('date') != today:
+            budget_state = {'date': today, 'used': 0}
+            self.checkpoint_data['refresh_budget'] = budget_state
+        return max(daily_budget - budget_state['used'], 0)
+    
+    def run_refresh(self, ttl_days: float = REFRESH_TTL_DAYS, daily_budget: int = REFRESH_DAILY_BUDGET,
+                    activity_weight: float = REFRESH_ACTIVITY_WEIGHT, limit: Optional[int] = None):
+        """
+        Re-scrape organizations whose data is older than the TTL
+        
+        Stale organizations are pushed onto a priority queue (most overdue first,
+        with the TTL shortened for orgs with many models) and popped until
+        today's request budget is spent.
+        
+        Args:
+            ttl_days: Base time-to-live for scraped data
+            daily_budget: Maximum number of refresh requests per calendar day
+            activity_weight: How strongly model_count shortens the TTL (0 disables)
+            limit: Stop after this many organizations even if budget is left
+        """
+        self.logger.info("Starting Phase 2 stale refresh...")
+        
+        queue = build_refresh_queue(self.organizations_df, ttl_days, activity_weight)
+        remaining = self.remaining_refresh_budget(daily_budget)
+        if limit is not None:
+            remaining = min(remaining, limit)
+        
+        self.logger.info(f"Stale organizations: {len(queue)} (TTL {ttl_days} days, activity weight {activity_weight})")
+        self.logger.info(f"Refresh budget remaining today: {remaining}/{daily_budget}")
+        
+        planned = min(len(queue), remaining)
+        refreshed = 0
+        names = self.organizations_df['organization_name'].to_numpy()
+        urls = self.organizations_df['organization_url'].to_numpy()
+        budget_state = self.checkpoint_data['refresh_budget']
+        
+        def jobs():
+            nonlocal refreshed
+            while queue and refreshed < remaining:
+                self.stats.maybe_report(planned - refreshed)
+                priority, index = queue.pop()
+                org_name = names[index]
+                
+                age = "never scraped" if priority == float('inf') else f"overdue x{priority:.2f}"
+                self.logger.info(f"Refreshing {refreshed + 1}/{planned}: {org_name} ({age})")
+                
+                budget_state['used'] += 1
+                refreshed += 1
+                yield partial(self.process_organization, index, org_name, urls[index], advance_checkpoint=False)
+        
+        with self.background_persistence():
+            self.run_concurrently(jobs())
+        
+        self.stats.report(len(queue))
+        self.export_run_outputs()
+        self.logger.info(f"Refresh completed: {refreshed} organizations refreshed, {len(queue)} still stale")
 
 
-def main():
+def main(argv: Optional[List[str]] = None):
     """Main function to run Phase 2 scraper"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Scrape HuggingFace organization details (Phase 2)')
+    parser.add_argument('--refresh', action='store_true',
+                        help='Re-scrape organizations whose data is older than the TTL instead of a normal run')
+    parser.add_argument('--ttl-days', type=float, default=REFRESH_TTL_DAYS,
+                        help=f'Base TTL in days for --refresh (default: {REFRESH_TTL_DAYS})')
+    parser.add_argument('--budget', type=int, default=REFRESH_DAILY_BUDGET,
+                        help=f'Daily request budget for --refresh (default: {REFRESH_DAILY_BUDGET})')
+    parser.add_argument('--activity-weight', type=float, default=REFRESH_ACTIVITY_WEIGHT,
+                        help=f'How much model_count shortens the TTL, 0 disables (default: {REFRESH_ACTIVITY_WEIGHT})')
+    parser.add_argument('--only-status', type=str, default=None,
+                        help=f'Only re-scrape rows in these comma-separated status buckets '
+                             f'({", ".join(STATUS_BUCKETS)}), e.g. failed,error')
+    parser.add_argument('--shard', type=str, default=None,
+                        help='Only scrape hash shard i of N, e.g. 0/4 (uses per-shard output and checkpoint files; '
+                             'combine with: python phase2_shards.py N)')
+    parser.add_argument('--queue', nargs='?', const=WORK_QUEUE_DB, default=None,
+                        help=f'Pull organizations from a shared work queue (default: {WORK_QUEUE_DB})')
+    parser.add_argument('--enqueue', action='store_true',
+                        help='With --queue: add unfinished organizations (or --only-status buckets) and exit')
+    parser.add_argument('--export', action='store_true',
+                        help='With --queue: apply completed queue results to the checkpoint and CSV and exit')
+    parser.add_argument('--worker-id', default=None,
+                        help='With --queue: worker id (default: hostname-pid)')
+    parser.add_argument('--base-url', default=HF_BASE_URL,
+                        help=f'Site to fetch organization pages from, e.g. a local mock_hf_server.py '
+                             f'(default: {HF_BASE_URL})')
+    parser.add_argument('--log-sample', type=float, default=LOG_SUCCESS_SAMPLE_RATE, metavar='RATE',
+                        help=f'Fraction of successful organizations echoed to the console/log, 0-1 '
+                             f'(default: {LOG_SUCCESS_SAMPLE_RATE}; every result goes to output/phase2_events_*.jsonl)')
+    parser.add_argument('--durability', choices=DURABILITY_LEVELS, default=PERSIST_DURABILITY,
+                        help=f'How checkpoint/CSV files are written (default: {PERSIST_DURABILITY}): '
+                             f'none = in place, atomic = temp file + rename, fsync = atomic + fsync')
+    parser.add_argument('--no-link-table', action='store_true',
+                        help='Do not write the org -> link table (<output>_links.csv) at the end of a run')
+    parser.add_argument('--change-feed', action='store_true',
+                        help='Write organizations added/removed/modified since the previous run as JSON lines '
+                             'to output/changes/')
+    parser.add_argument('--concurrency', type=int, default=SCRAPE_CONCURRENCY, metavar='N',
+                        help=f'Organization pages fetched at once, 1-{MAX_CONCURRENCY} (default: {SCRAPE_CONCURRENCY})')
+    parser.add_argument('--request-delay', type=float, default=REQUEST_DELAY, metavar='SECONDS',
+                        help=f'Seconds between request starts across all fetches (default: {REQUEST_DELAY})')
+    parser.add_argument('--control-file', default=RUNTIME_CONTROL_FILE,
+                        help=f'JSON file with setting overrides re-read during the run, e.g. '
+                             f'{{"concurrency": 4, "request_delay": 0.5}} (default: {RUNTIME_CONTROL_FILE}; '
+                             f'send SIGHUP to reload at once)')
+    parser.add_argument('--sink', default=','.join(RESULT_SINKS), metavar='NAMES',
+                        help=f'Comma-separated result sinks fed in the background ({", ".join(SINK_NAMES)}; '
+                             f'default: {",".join(RESULT_SINKS) or "none"}, see RESULT_SINKS in config.py)')
+    parser.add_argument('--memory-ceiling', type=float, default=MEMORY_CEILING_MB, metavar='MB',
+                        help=f'Stop taking new organizations while RSS is above MB, 0 disables '
+                             f'(default: {MEMORY_CEILING_MB})')
+    parser.add_argument('--profile', type=int, metavar='N', default=None,
+                        help='Profile a run of N organizations: writes a cProfile .prof file and tracemalloc '
+                             'allocation reports to output/profiles/')
+    
+    args = parser.parse_args(argv)
+    
+    if args.profile is not None and (args.profile < 1 or args.queue):
+        parser.error("--profile needs N >= 1 and cannot be combined with --queue")
+    if not 0 <= args.log_sample <= 1:
+        parser.error("--log-sample must be between 0 and 1")
+    try:
+        settings = validate_settings({'concurrency': args.concurrency, 'request_delay': args.request_delay})
+    except ValueError as e:
+        parser.error(str(e))
+    only_status = None
+    if args.only_status:
+        only_status = [bucket.strip() for bucket in args.only_status.split(',') if bucket.strip()]
+        unknown = [bucket for bucket in only_status if bucket not in STATUS_BUCKETS]
+        if unknown:
+            parser.error(f"unknown status bucket(s): {', '.join(unknown)}")
+    
+    shard = None
+    if args.shard:
+        try:
+            shard = parse_shard(args.shard)
+        except ValueError as e:
+            parser.error(str(e))
+    
     input_csv = "output/huggingface_organizations.csv"
     output_csv = "output/huggingface_organizations_detailed.csv"
+    checkpoint_file = "output/phase2_checkpoint.json"
+    if shard is not None:
+        output_csv = shard_path(output_csv, shard)
+        checkpoint_file = shard_path(checkpoint_file, shard)
+    
+    sink_csv, sink_db = SINK_CSV_PATH, SINK_DB_PATH
+    if shard is not None:
+        sink_csv, sink_db = shard_path(sink_csv, shard), shard_path(sink_db, shard)
+    try:
+        sinks = create_sinks([name.strip() for name in args.sink.split(',') if name.strip()], sink_csv, sink_db)
+    except ValueError as e:
+        parser.error(str(e))
     
     # Check if input file exists
     if not os.path.exists(input_csv):
@@ -419,8 +961,34 @@ def main():
     print("="*80)
     
     try:
-        scraper = Phase2OrganizationScraper(input_csv, output_csv)
-        scraper.run_phase2_scraping()
+        profiler = ScrapeProfiler('phase2') if args.profile else nullcontext()
+        with profiler:
+            scraper = Phase2OrganizationScraper(input_csv, output_csv, checkpoint_file, shard=shard,
+                                                base_url=args.base_url, log_sample_rate=args.log_sample,
+                                                durability=args.durability, link_table=not args.no_link_table,
+                                                change_feed=args.change_feed, settings=settings,
+                                                control_file=args.control_file or None, sinks=sinks,
+                                                memory_ceiling_mb=args.memory_ceiling)
+            scraper.runtime.install_signal_handler()
+            tune_gc()  # after the input dataframe and checkpoint are loaded
+            if args.profile:
+                profiler.snapshot('start')
+            
+            if args.queue:
+                queue = WorkQueue(args.queue)
+                if args.enqueue:
+                    scraper.enqueue_work(queue, only_status)
+                elif args.export:
+                    scraper.apply_queue_results(queue)
+                else:
+                    scraper.run_queue_worker(queue, args.worker_id or default_worker_id())
+                queue.close()
+            elif args.refresh:
+                scraper.run_refresh(args.ttl_days, args.budget, args.activity_weight, limit=args.profile)
+            elif only_status:
+                scraper.run_only_status(only_status, limit=args.profile)
+            else:
+                scraper.run_phase2_scraping(limit=args.profile)
         
     except KeyboardInterrupt:
         print("\n\nScraping interrupted by user. Progress has been saved.")
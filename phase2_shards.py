@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Hash-Sharded Phase 2 Runs
+Splits the Phase 2 organization list into N shards by a stable hash of
+organization_url (so every process/machine gets a fixed, disjoint subset),
+and merges the per-shard outputs back into one ordered dataset
+"""
+
+import hashlib
+import os
+import sys
+from typing import List, Optional, Tuple
+
+import pandas as pd
+
+from link_table import build_link_table, link_table_path
+
+INPUT_CSV = "output/huggingface_organizations.csv"
+OUTPUT_CSV = "output/huggingface_organizations_detailed.csv"
+
+
+def parse_shard(spec: str) -> Tuple[int, int]:
+    """
+    Parse a shard spec of the form "i/N" (0 <= i < N).
+    
+    Args:
+        spec: Shard spec, e.g. "0/4"
+        
+    Returns:
+        Tuple of (shard_index, num_shards)
+    """
+    try:
+        shard_index, num_shards = (int(part) for part in spec.split('/'))
+    except ValueError:
+        raise ValueError(f"Invalid shard spec '{spec}', expected i/N (e.g. 0/4)")
+    if num_shards < 1 or not 0 <= shard_index < num_shards:
+        raise ValueError(f"Invalid shard spec '{spec}', need 0 <= i < N")
+    return shard_index, num_shards
+
+
+def shard_of(org_url: str, num_shards: int) -> int:
+    """Stable shard number for an organization URL (same on every machine and run)."""
+    digest = hashlib.md5(org_url.encode('utf-8')).digest()
+    return int.from_bytes(digest[:8], 'big') % num_shards
+
+
+def shard_path(path: str, shard: Tuple[int, int]) -> str:
+    """
+    Per-shard variant of a file path.
+    
+    Example: output/phase2_checkpoint.json -> output/phase2_checkpoint.shard0of4.json
+    """
+    root, ext = os.path.splitext(path)
+    return f"{root}.shard{shard[0]}of{shard[1]}{ext}"
+
+
+def select_shard(organizations_df: pd.DataFrame, shard: Tuple[int, int]) -> pd.DataFrame:
+    """
+    Rows of organizations_df that belong to the given shard, in original order.
+    
+    The index is reset so checkpoint indices are local to the shard.
+    """
+    shard_index, num_shards = shard
+    mask = organizations_df['organization_url'].map(lambda url: shard_of(url, num_shards) == shard_index)
+    return organizations_df[mask].reset_index(drop=True)
+
+
+def _occurrence_key(df: pd.DataFrame) -> pd.DataFrame:
+    """Add an occurrence counter so duplicate URLs in the input still join one-to-one."""
+    df = df.copy()
+    df['_occurrence'] = df.groupby('organization_url').cumcount()
+    return df
+
+
+def merge_shards(num_shards: int, input_csv: str = INPUT_CSV, output_csv: str = OUTPUT_CSV,
+                 shard_output_csv: Optional[str] = None) -> pd.DataFrame:
+    """
+    Merge per-shard Phase 2 outputs into one dataset ordered like the input.
+    
+    Every organization in input_csv must appear in exactly one shard output
+    exactly as many times as it appears in the input; otherwise nothing is
+    written and ValueError is raised listing missing/duplicated URLs.
+    
+    Args:
+        num_shards: Number of shards the run was split into
+        input_csv: Phase 1 CSV the shards were selected from
+        output_csv: Path for the merged dataset
+        shard_output_csv: Base path of the shard outputs (default: output_csv)
+        
+    Returns:
+        The merged dataframe
+    """
+    shard_output_csv = shard_output_csv or output_csv
+    
+    shard_frames = []
+    for shard_index in range(num_shards):
+        path = shard_path(shard_output_csv, (shard_index, num_shards))
+        if not os.path.exists(path):
+            raise ValueError(f"Shard output not found: {path}")
+        shard_df = pd.read_csv(path)
+        wrong_shard = shard_df['organization_url'].map(lambda url: shard_of(url, num_shards) != shard_index)
+        if wrong_shard.any():
+            raise ValueError(f"{path} contains {int(wrong_shard.sum())} organizations from other shards")
+        shard_frames.append(_occurrence_key(shard_df))
+    
+    merged = pd.concat(shard_frames, ignore_index=True)
+    expected = _occurrence_key(pd.read_csv(input_csv, usecols=['organization_url']))
+    expected['_order'] = range(len(expected))
+    
+    check = expected.merge(merged[['organization_url', '_occurrence']], how='outer',
+                           on=['organization_url', '_occurrence'], indicator=True)
+    missing = check.loc[check['_merge'] == 'left_only', 'organization_url'].tolist()
+    duplicated = check.loc[check['_merge'] == 'right_only', 'organization_url'].tolist()
+    
+    if missing or duplicated:
+        raise ValueError(f"Shard outputs do not match input: {len(missing)} missing "
+                         f"(e.g. {missing[:5]}), {len(duplicated)} duplicated/unknown (e.g. {duplicated[:5]})")
+    
+    merged = (merged.merge(expected, on=['organization_url', '_occurrence'])
+              .sort_values('_order')
+              .drop(columns=['_occurrence', '_order'])
+              .reset_index(drop=True))
+    merged.to_csv(output_csv, index=False)
+    return merged
+
+
+def main(argv: Optional[List[str]] = None):
+    """Merge command for sharded Phase 2 runs"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Merge sharded Phase 2 outputs into one dataset')
+    parser.add_argument('num_shards', type=int, help='Number of shards the run was split into (N)')
+    parser.add_argument('--input', default=INPUT_CSV, help=f'Phase 1 CSV (default: {INPUT_CSV})')
+    parser.add_argument('--output', default=OUTPUT_CSV, help=f'Merged output CSV (default: {OUTPUT_CSV})')
+    
+    args = parser.parse_args(argv)
+    
+    try:
+        merged = merge_shards(args.num_shards, args.input, args.output)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    
+    print(f"Merged {args.num_shards} shards: {len(merged)} organizations saved to {args.output}")
+    
+    links_csv = link_table_path(args.output)
+    build_link_table(merged).to_csv(links_csv, index=False)
+    print(f"Link table saved to {links_csv}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Scrape Profiling
+cProfile + tracemalloc wrapper for bounded profiling runs of the scrapers.
+
+Writes to output/profiles/:
+- <name>_<timestamp>.prof          CPU profile (pstats format: snakeviz, tuna,
+                                    gprof2dot, python -m pstats)
+- <name>_<timestamp>_cpu.txt       Top functions by cumulative and own time
+- <name>_<timestamp>_alloc_<label>.txt  Top allocation sites per snapshot
+- <name>_<timestamp>_alloc_diff.txt     Allocation growth from first to last snapshot
+"""
+
+import cProfile
+import io
+import logging
+import os
+import pstats
+import tracemalloc
+from datetime import datetime
+from typing import List, Tuple
+
+PROFILE_DIR = "output/profiles"
+
+logger = logging.getLogger(__name__)
+
+
+class ScrapeProfiler:
+    """Context manager that CPU- and memory-profiles the enclosed run."""
+    
+    def __init__(self, name: str, output_dir: str = PROFILE_DIR, top: int = 30, traceback_frames: int = 10):
+        """
+        Args:
+            name: Prefix for output files (e.g. "phase2")
+            output_dir: Directory for profile files
+            top: Number of entries in the text reports
+            traceback_frames: Stack depth tracemalloc records per allocation
+        """
+        self.top = top
+        self.traceback_frames = traceback_frames
+        os.makedirs(output_dir, exist_ok=True)
+        self.prefix = os.path.join(output_dir, f"{name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
+        self.profiler = cProfile.Profile()
+        self.snapshots: List[Tuple[str, tracemalloc.Snapshot]] = []
+    
+    def __enter__(self) -> 'ScrapeProfiler':
+        tracemalloc.start(self.traceback_frames)
+        self.profiler.enable()
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.profiler.disable()
+        self.snapshot('end')
+        tracemalloc.stop()
+        self.write_reports()
+        return False
+    
+    def snapshot(self, label: str):
+        """Take a tracemalloc snapshot and write its top allocation sites."""
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+        ))
+        self.snapshots.append((label, snapshot))
+        
+        current, peak = tracemalloc.get_traced_memory()
+        lines = [f"Snapshot '{label}': current {current / 1e6:.1f} MB, peak {peak / 1e6:.1f} MB", ""]
+        lines += [str(stat) for stat in snapshot.statistics('lineno')[:self.top]]
+        self._write(f"_alloc_{label}.txt", "\n".join(lines))
+    
+    def write_reports(self):
+        """Write the CPU profile, its text summary and the allocation diff."""
+        self.profiler.dump_stats(f"{self.prefix}.prof")
+        
+        report = io.StringIO()
+        stats = pstats.Stats(self.profiler, stream=report).strip_dirs()
+        report.write("=== Top functions by cumulative time ===\n")
+        stats.sort_stats('cumulative').print_stats(self.top)
+        report.write("\n=== Top functions by own time ===\n")
+        stats.sort_stats('tottime').print_stats(self.top)
+        self._write("_cpu.txt", report.getvalue())
+        
+        if len(self.snapshots) >= 2:
+            (first_label, first), (last_label, last) = self.snapshots[0], self.snapshots[-1]
+            lines = [f"Allocation growth '{first_label}' -> '{last_label}'", ""]
+            lines += [str(stat) for stat in last.compare_to(first, 'lineno')[:self.top]]
+            self._write("_alloc_diff.txt", "\n".join(lines))
+        
+        logger.info(f"Profile written: {self.prefix}.prof (+ _cpu.txt, _alloc_*.txt)")
+    
+    def _write(self, suffix: str, text: str):
+        with open(f"{self.prefix}{suffix}", 'w', encoding='utf-8') as f:
+            f.write(text)
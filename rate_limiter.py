@@ -0,0 +1,42 @@
+"""
+Request Rate Limiter
+Thread-safe pacing for scrapers that fetch from several threads: each call to
+wait() reserves the next free slot, so the combined request rate stays at or
+below the configured rate no matter how many workers share the limiter.
+"""
+
+import threading
+import time
+
+
+class RateLimiter:
+    """Spaces calls at least 1/rate seconds apart across all threads."""
+
+    def __init__(self, rate: float):
+        """
+        Args:
+            rate: Maximum calls per second (0 or less disables limiting)
+        """
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+        self.set_rate(rate)
+
+    def set_rate(self, rate: float):
+        """Change the rate; takes effect from the next reserved slot."""
+        with self._lock:
+            self.rate = rate
+            self.interval = 1.0 / rate if rate > 0 else 0.0
+
+    def wait(self):
+        """Block until this caller's slot comes up."""
+        with self._lock:
+            if not self.interval:
+                return
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+    __call__ = wait
@@ -0,0 +1,86 @@
+"""
+Stale Refresh Scheduler for Phase 2
+Selects organizations whose scrape_timestamp is older than a TTL and queues
+them by priority so a limited request budget goes to the stalest and most
+active organizations first
+"""
+
+import heapq
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+def compute_refresh_priority(organizations_df: pd.DataFrame, ttl_days: float,
+                             activity_weight: float = 1.0,
+                             now: Optional[datetime] = None) -> pd.Series:
+    """
+    Compute how overdue each organization is for a refresh.
+    
+    The TTL is shortened for active organizations:
+        effective_ttl = ttl_days / (1 + activity_weight * log10(1 + model_count))
+    and the priority is age / effective_ttl, so anything >= 1 is stale.
+    Rows that were never scraped (or have an unparsable timestamp) get +inf.
+    
+    Args:
+        organizations_df: Phase 2 dataframe (needs scrape_timestamp, model_count)
+        ttl_days: Base time-to-live in days
+        activity_weight: How strongly model_count shortens the TTL (0 disables)
+        now: Reference time (default: current time)
+        
+    Returns:
+        Float series aligned with organizations_df
+    """
+    now = now or datetime.now()
+    
+    timestamps = pd.to_datetime(organizations_df['scrape_timestamp'], errors='coerce', format='ISO8601')
+    age_days = (pd.Timestamp(now) - timestamps).dt.total_seconds() / 86400
+    
+    model_count = pd.to_numeric(organizations_df['model_count'], errors='coerce').fillna(0).clip(lower=0)
+    effective_ttl = ttl_days / (1 + activity_weight * np.log10(1 + model_count))
+    
+    priority = age_days / effective_ttl
+    return priority.fillna(float('inf'))
+
+
+class RefreshQueue:
+    """Max-priority queue of (priority, row index) pairs backed by heapq."""
+    
+    def __init__(self, items: Optional[List[Tuple[float, int]]] = None):
+        # heapq is a min-heap, so priorities are stored negated
+        self._heap = [(-priority, index) for priority, index in (items or [])]
+        heapq.heapify(self._heap)
+    
+    def push(self, priority: float, index: int):
+        """Add a row with the given priority."""
+        heapq.heappush(self._heap, (-priority, index))
+    
+    def pop(self) -> Tuple[float, int]:
+        """Remove and return the most overdue (priority, index) pair."""
+        priority, index = heapq.heappop(self._heap)
+        return -priority, index
+    
+    def __len__(self) -> int:
+        return len(self._heap)
+
+
+def build_refresh_queue(organizations_df: pd.DataFrame, ttl_days: float,
+                        activity_weight: float = 1.0,
+                        now: Optional[datetime] = None) -> RefreshQueue:
+    """
+    Build a priority queue of all stale organizations.
+    
+    Args:
+        organizations_df: Phase 2 dataframe
+        ttl_days: Base time-to-live in days
+        activity_weight: How strongly model_count shortens the TTL (0 disables)
+        now: Reference time (default: current time)
+        
+    Returns:
+        RefreshQueue holding every row with priority >= 1
+    """
+    priority = compute_refresh_priority(organizations_df, ttl_days, activity_weight, now)
+    stale = priority[priority >= 1]
+    return RefreshQueue(list(zip(stale.tolist(), stale.index.tolist())))
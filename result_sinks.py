@@ -0,0 +1,377 @@
+"""
+Phase 2 Result Sinks
+Streams scrape results to other destinations besides the output CSV and
+checkpoint (which PersistenceWriter keeps writing as before):
+- csv:     append-only results log, one line per uploaded result
+- sqlite:  table upserted by organization_url
+- sheets:  Google Sheet, rows updated in place by organization_url (needs gspread)
+
+Every sink gets its own SinkWorker thread, so a slow sink (a remote sheet
+behind a rate-limited API) never holds up fetching or the other sinks:
+- batching:     results are uploaded UPLOAD_INTERVAL at a time, or after
+                SINK_FLUSH_INTERVAL seconds with results pending
+- diff-only:    pending results are coalesced per organization (latest wins),
+                and a result identical to the last one uploaded for that
+                organization (ignoring SINK_IGNORED_FIELDS) is not sent again
+- backpressure: once SINK_MAX_PENDING organizations are waiting, submit()
+                blocks until the sink catches up. Results are submitted from
+                the persistence writer thread, so fetch threads keep running.
+"""
+
+import csv
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from config import (GOOGLE_CREDENTIALS_PATH, GOOGLE_SHEET_NAME, SINK_FLUSH_INTERVAL, SINK_IGNORED_FIELDS,
+                    SINK_MAX_PENDING, UPLOAD_INTERVAL)
+from org_records import RESULT_FIELDS
+
+KEY = 'organization_url'
+
+# Columns of a sink row, in output order
+SINK_COLUMNS = ('organization_name', KEY) + RESULT_FIELDS
+
+SINK_NAMES = ('csv', 'sqlite', 'sheets')
+
+SINK_CSV_PATH = "output/phase2_results.csv"
+SINK_DB_PATH = "output/phase2_results.db"
+
+logger = logging.getLogger(__name__)
+
+
+class ResultSink:
+    """Destination for batches of result rows (dicts with SINK_COLUMNS)."""
+
+    name = 'sink'
+
+    def open(self):
+        """Connect / create the destination; called on the sink's worker thread."""
+
+    def write(self, rows: List[Dict]):
+        """Upload one batch. Raising keeps the batch pending for the next attempt."""
+        raise NotImplementedError
+
+    def close(self):
+        """Release connections; the sink may be opened again later."""
+
+
+class CsvSink(ResultSink):
+    """Appends every uploaded row to a CSV file (a log of results, newest last)."""
+
+    name = 'csv'
+
+    def __init__(self, path: str = SINK_CSV_PATH):
+        self.path = path
+
+    def write(self, rows: List[Dict]):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        new_file = not os.path.exists(self.path) or os.path.getsize(self.path) == 0
+        with open(self.path, 'a', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=SINK_COLUMNS, extrasaction='ignore')
+            if new_file:
+                writer.writeheader()
+            writer.writerows(rows)
+
+
+class SqliteSink(ResultSink):
+    """Keeps one row per organization in a SQLite table (upsert by organization_url)."""
+
+    name = 'sqlite'
+
+    def __init__(self, db_path: str = SINK_DB_PATH, table: str = 'results'):
+        self.db_path = db_path
+        self.table = table
+        self.conn: Optional[sqlite3.Connection] = None
+
+    def open(self):
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.conn = sqlite3.connect(self.db_path)
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        columns = ', '.join(f"{column} TEXT" + (" PRIMARY KEY" if column == KEY else "") for column in SINK_COLUMNS)
+        self.conn.execute(f"CREATE TABLE IF NOT EXISTS {self.table} ({columns})")
+        self.conn.commit()
+
+    def write(self, rows: List[Dict]):
+        placeholders = ', '.join('?' * len(SINK_COLUMNS))
+        updates = ', '.join(f"{column} = excluded.{column}" for column in SINK_COLUMNS if column != KEY)
+        with self.conn:
+            self.conn.executemany(
+                f"INSERT INTO {self.table} ({', '.join(SINK_COLUMNS)}) VALUES ({placeholders}) "
+                f"ON CONFLICT ({KEY}) DO UPDATE SET {updates}",
+                ([None if row.get(column) is None else str(row.get(column)) for column in SINK_COLUMNS]
+                 for row in rows))
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+
+class GoogleSheetSink(ResultSink):
+    """
+    Mirrors results into the first worksheet of a Google Sheet: existing
+    organizations are updated in place, new ones appended, one API call each
+    per batch. Cells are limited to 50,000 characters by Sheets. Row numbers
+    are tracked locally, so only one process should write to a sheet.
+    """
+
+    name = 'sheets'
+    MAX_CELL = 50000
+
+    def __init__(self, credentials_path: str = GOOGLE_CREDENTIALS_PATH, sheet_name: str = GOOGLE_SHEET_NAME):
+        self.credentials_path = credentials_path
+        self.sheet_name = sheet_name
+        self.worksheet = None
+        self.rows: Dict[str, int] = {}  # organization_url -> sheet row number
+
+    def open(self):
+        try:
+            import gspread
+        except ImportError:
+            raise RuntimeError("the sheets sink needs gspread (pip install gspread)") from None
+        if not os.path.exists(self.credentials_path):
+            raise RuntimeError(f"Google credentials {self.credentials_path} not found")
+
+        client = gspread.service_account(filename=self.credentials_path)
+        try:
+            spreadsheet = client.open(self.sheet_name)
+        except gspread.SpreadsheetNotFound:
+            spreadsheet = client.create(self.sheet_name)
+        self.worksheet = spreadsheet.sheet1
+        header = self.worksheet.row_values(1)
+        if header != list(SINK_COLUMNS):
+            self.worksheet.update([list(SINK_COLUMNS)], 'A1')
+        urls = self.worksheet.col_values(SINK_COLUMNS.index(KEY) + 1)
+        self.rows = {url: number for number, url in enumerate(urls, 1) if number > 1 and url}
+
+    def _cells(self, row: Dict) -> List[str]:
+        return ['' if row.get(column) is None else str(row.get(column))[:self.MAX_CELL] for column in SINK_COLUMNS]
+
+    def write(self, rows: List[Dict]):
+        updates, appends = [], []
+        for row in rows:
+            number = self.rows.get(row[KEY])
+            if number is None:
+                appends.append(row)
+            else:
+                updates.append({'range': f"A{number}", 'values': [self._cells(row)]})
+        if updates:
+            self.worksheet.batch_update(updates)
+        if appends:
+            first = max(self.rows.values(), default=1) + 1
+            self.worksheet.append_rows([self._cells(row) for row in appends], value_input_option='RAW')
+            for offset, row in enumerate(appends):
+                self.rows[row[KEY]] = first + offset
+
+    def close(self):
+        self.worksheet = None
+
+
+def row_digest(row: Dict, ignore: Iterable[str] = SINK_IGNORED_FIELDS) -> str:
+    """Digest of a row's values, leaving out fields that change on every scrape."""
+    values = {column: row.get(column) for column in SINK_COLUMNS if column not in ignore}
+    return hashlib.sha1(json.dumps(values, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
+class SinkWorker:
+    """Background uploader for one sink: batching, diff-only uploads, backpressure."""
+
+    def __init__(self, sink: ResultSink, batch_size: int = UPLOAD_INTERVAL, interval: float = SINK_FLUSH_INTERVAL,
+                 max_pending: int = SINK_MAX_PENDING, ignore: Iterable[str] = SINK_IGNORED_FIELDS,
+                 retry_delay: float = 30.0):
+        """
+        Args:
+            sink: Destination
+            batch_size: Rows per upload
+            interval: Upload pending rows at least this often (seconds)
+            max_pending: Organizations waiting before submit() blocks
+            ignore: Fields left out of the diff against the last uploaded row
+            retry_delay: Seconds to wait after a failed upload
+        """
+        self.sink = sink
+        self.batch_size = max(1, batch_size)
+        self.interval = interval
+        self.max_pending = max(self.batch_size, max_pending)
+        self.ignore = tuple(ignore)
+        self.retry_delay = retry_delay
+        self.uploaded = 0
+        self.skipped = 0
+        self.failures = 0
+        self.disabled = False
+        self._pending: 'OrderedDict[str, Dict]' = OrderedDict()
+        self._last_uploaded: Dict[str, str] = {}
+        self._condition = threading.Condition()
+        self._closing = False
+        self._thread = None
+
+    def start(self) -> 'SinkWorker':
+        if self._thread is not None:
+            return self
+        self._closing = False
+        self.disabled = False
+        self._thread = threading.Thread(target=self._run, name=f"sink-{self.sink.name}", daemon=True)
+        self._thread.start()
+        return self
+
+    def submit(self, row: Dict):
+        """Queue a row for upload; blocks while max_pending organizations are waiting."""
+        key = row[KEY]
+        with self._condition:
+            if self.disabled:
+                return
+            if key not in self._pending and len(self._pending) >= self.max_pending:
+                logger.warning(f"Sink {self.sink.name} is {len(self._pending)} results behind; waiting")
+                self._condition.wait_for(lambda: len(self._pending) < self.max_pending or self.disabled)
+            self._pending.pop(key, None)
+            self._pending[key] = row
+            if len(self._pending) == 1 or len(self._pending) >= self.batch_size:
+                self._condition.notify_all()
+
+    def close(self):
+        """Upload everything pending and stop the thread."""
+        if self._thread is None:
+            return
+        with self._condition:
+            self._closing = True
+            self._condition.notify_all()
+        self._thread.join()
+        self._thread = None
+
+    def _next_batch(self) -> Optional[List[Dict]]:
+        """Wait for a full batch (or the interval, or close) and take it; None when closed and drained."""
+        with self._condition:
+            deadline = None  # interval counts from the first pending result
+            while not self._closing and len(self._pending) < self.batch_size:
+                if not self._pending:
+                    deadline = None
+                    self._condition.wait()
+                    continue
+                if deadline is None:
+                    deadline = time.monotonic() + self.interval
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+            if not self._pending:
+                return None
+            batch = []
+            while self._pending and len(batch) < self.batch_size:
+                batch.append(self._pending.popitem(last=False)[1])
+            self._condition.notify_all()
+            return batch
+
+    def _run(self):
+        try:
+            self.sink.open()
+        except Exception as e:
+            logger.error(f"Sink {self.sink.name} disabled: {e}")
+            with self._condition:
+                self.disabled = True
+                self._pending.clear()
+                self._condition.notify_all()
+            return
+
+        try:
+            while True:
+                batch = self._next_batch()
+                if batch is None:
+                    return
+                changed = [row for row in batch if self._last_uploaded.get(row[KEY]) != row_digest(row, self.ignore)]
+                self.skipped += len(batch) - len(changed)
+                if not changed:
+                    continue
+                try:
+                    self.sink.write(changed)
+                except Exception as e:
+                    self.failures += 1
+                    logger.error(f"Sink {self.sink.name} upload of {len(changed)} results failed: {e}")
+                    self._requeue(changed)
+                    with self._condition:
+                        if self._closing:
+                            return  # give up on what is left instead of retrying forever at shutdown
+                        self._condition.wait(self.retry_delay)
+                    continue
+                self.uploaded += len(changed)
+                for row in changed:
+                    self._last_uploaded[row[KEY]] = row_digest(row, self.ignore)
+        finally:
+            self.sink.close()
+
+    def _requeue(self, rows: List[Dict]):
+        """Put a failed batch back in front of the queue (newer results for the same organization win)."""
+        with self._condition:
+            newer = self._pending
+            self._pending = OrderedDict((row[KEY], row) for row in rows if row[KEY] not in newer)
+            self._pending.update(newer)
+
+
+class SinkDispatcher:
+    """Fans result rows out to one SinkWorker per sink."""
+
+    def __init__(self, sinks: Sequence[ResultSink] = (), **worker_options):
+        """
+        Args:
+            sinks: Destinations (none: submit() is a no-op)
+            worker_options: Passed to every SinkWorker (batch_size, interval, ...)
+        """
+        self.workers = [SinkWorker(sink, **worker_options) for sink in sinks]
+
+    def __bool__(self) -> bool:
+        return bool(self.workers)
+
+    def start(self) -> 'SinkDispatcher':
+        for worker in self.workers:
+            worker.start()
+        return self
+
+    def submit(self, row: Dict):
+        for worker in self.workers:
+            worker.submit(row)
+
+    def close(self):
+        for worker in self.workers:
+            worker.close()
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Per sink: uploaded, skipped (unchanged) and failed uploads"""
+        return {worker.sink.name: {'uploaded': worker.uploaded, 'skipped': worker.skipped,
+                                   'failures': worker.failures} for worker in self.workers}
+
+    def __enter__(self) -> 'SinkDispatcher':
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def create_sinks(names: Iterable[str], csv_path: str = SINK_CSV_PATH,
+                 db_path: str = SINK_DB_PATH) -> List[ResultSink]:
+    """
+    Sinks by name.
+
+    Args:
+        names: Any of SINK_NAMES
+        csv_path: File for the csv sink
+        db_path: Database for the sqlite sink
+
+    Raises:
+        ValueError: Unknown sink name
+    """
+    factories = {'csv': lambda: CsvSink(csv_path), 'sqlite': lambda: SqliteSink(db_path),
+                 'sheets': GoogleSheetSink}
+    names = list(names)
+    unknown = [name for name in names if name not in factories]
+    if unknown:
+        raise ValueError(f"unknown sink(s): {', '.join(unknown)} (expected {', '.join(SINK_NAMES)})")
+    return [factories[name]() for name in names]
@@ -3,11 +3,24 @@
 Run the complete Phase 2 scraping process
 """
 
+import argparse
 import os
-from phase2_detail_scraper import main
+import sys
+from typing import List, Optional
 
-def run_full_phase2():
-    """Run the full Phase 2 scraping on all organizations"""
+def run_full_phase2(argv: Optional[List[str]] = None):
+    """
+    Run the full Phase 2 scraping on all organizations
+    
+    Args:
+        argv: --yes to start without the confirmation prompt; everything else
+              is passed on to phase2_detail_scraper
+    """
+    parser = argparse.ArgumentParser(description='Run the full Phase 2 scrape (see phase2_detail_scraper.py --help)')
+    parser.add_argument('--yes', '-y', action='store_true',
+                        help='Start without asking (also implied when stdin is not a terminal)')
+    args, scraper_args = parser.parse_known_args(argv)
+    
     print("\n" + "="*80)
     print("HUGGINGFACE ORGANIZATION SCRAPER - PHASE 2")
     print("Extracting detailed information for ALL organizations...")
@@ -35,10 +48,12 @@ def run_full_phase2():
     print("   * Saves to CSV locally")
     print()
     
-    input("Press Enter to start Phase 2 scraping...")
+    if not args.yes and sys.stdin.isatty():
+        input("Press Enter to start Phase 2 scraping...")
     
-    # Run the main scraper
-    main()
+    # Run the main scraper (imported here: pandas/bs4 only load once the run starts)
+    from phase2_detail_scraper import main
+    main(scraper_args)
 
 if __name__ == "__main__":
     run_full_phase2()
@@ -0,0 +1,152 @@
+"""
+Runtime Scrape Settings
+Request settings a long run re-reads while it works, so it can be sped up
+off-peak or slowed down after 429s without a restart.
+
+Defaults come from config.py (and command line flags). Values in the
+control file override them; a key removed from the file falls back to its
+default again:
+
+    output/phase2_control.json
+    {"concurrency": 4, "request_delay": 0.5, "request_timeout": 30,
+     "max_retries": 3, "retry_delays": [30, 60, 180]}
+
+The file's modification time is checked every CONTROL_POLL_INTERVAL seconds;
+SIGHUP makes the next check reload it right away. Changes apply to the next
+request: fetches already in flight finish with the settings they started with.
+"""
+
+import json
+import logging
+import os
+import signal
+import threading
+import time
+from collections import namedtuple
+from typing import Callable, Dict, List, Optional
+
+from config import (CONTROL_POLL_INTERVAL, MAX_CONCURRENCY, MAX_RETRIES, REQUEST_DELAY, REQUEST_TIMEOUT,
+                    RETRY_DELAYS, SCRAPE_CONCURRENCY)
+
+ScrapeSettings = namedtuple('ScrapeSettings', ['concurrency', 'request_delay', 'request_timeout',
+                                               'max_retries', 'retry_delays'])
+
+DEFAULT_SETTINGS = ScrapeSettings(SCRAPE_CONCURRENCY, REQUEST_DELAY, REQUEST_TIMEOUT, MAX_RETRIES,
+                                  tuple(RETRY_DELAYS))
+
+logger = logging.getLogger(__name__)
+
+
+def validate_settings(values: Dict, defaults: ScrapeSettings = DEFAULT_SETTINGS) -> ScrapeSettings:
+    """
+    Settings from a dict of overrides.
+
+    Args:
+        values: Setting name -> value (missing names keep their default)
+        defaults: Values for settings not in `values`
+
+    Returns:
+        The merged settings
+
+    Raises:
+        ValueError: Unknown setting or out-of-range value
+    """
+    unknown = set(values) - set(ScrapeSettings._fields)
+    if unknown:
+        raise ValueError(f"unknown setting(s): {', '.join(sorted(unknown))}")
+    try:
+        settings = defaults._replace(**values)
+        settings = ScrapeSettings(int(settings.concurrency), float(settings.request_delay),
+                                  float(settings.request_timeout), int(settings.max_retries),
+                                  tuple(float(delay) for delay in settings.retry_delays))
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"invalid setting value: {e}") from None
+    if not 1 <= settings.concurrency <= MAX_CONCURRENCY:
+        raise ValueError(f"concurrency must be between 1 and {MAX_CONCURRENCY}")
+    if settings.request_delay < 0 or settings.request_timeout <= 0:
+        raise ValueError("request_delay must be >= 0 and request_timeout > 0")
+    if settings.max_retries < 1 or not settings.retry_delays or min(settings.retry_delays) < 0:
+        raise ValueError("max_retries must be >= 1 and retry_delays a non-empty list of delays >= 0")
+    return settings
+
+
+class RuntimeSettings:
+    """Current settings, reloaded from a control file when it changes."""
+
+    def __init__(self, control_file: Optional[str] = None, defaults: ScrapeSettings = DEFAULT_SETTINGS,
+                 poll_interval: float = CONTROL_POLL_INTERVAL):
+        """
+        Args:
+            control_file: JSON file with setting overrides (None: defaults only)
+            defaults: Settings used for keys the control file does not set
+            poll_interval: Seconds between modification time checks
+        """
+        self.control_file = control_file
+        self.defaults = defaults
+        self.poll_interval = poll_interval
+        self.current = defaults
+        self._lock = threading.Lock()
+        self._listeners: List[Callable[[ScrapeSettings], None]] = []
+        self._mtime = None
+        self._next_check = 0.0
+        self._reload_requested = False
+        self.check()
+
+    def on_change(self, listener: Callable[[ScrapeSettings], None]):
+        """Call listener(settings) now and after every change."""
+        self._listeners.append(listener)
+        listener(self.current)
+
+    def install_signal_handler(self):
+        """Reload on SIGHUP (main thread only; no-op where SIGHUP does not exist)."""
+        if hasattr(signal, 'SIGHUP') and threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGHUP, lambda signum, frame: self.request_reload())
+
+    def request_reload(self):
+        """Make the next check() reload the control file regardless of its modification time."""
+        self._reload_requested = True
+
+    def check(self) -> bool:
+        """
+        Reload the control file if it changed (cheap to call per request).
+
+        Returns:
+            True if the settings changed
+        """
+        now = time.monotonic()
+        if not self._reload_requested and now < self._next_check:
+            return False
+        with self._lock:
+            self._next_check = now + self.poll_interval
+            forced, self._reload_requested = self._reload_requested, False
+            try:
+                mtime = os.path.getmtime(self.control_file) if self.control_file else None
+            except OSError:
+                mtime = None
+            if mtime == self._mtime and not forced:
+                return False
+            self._mtime = mtime
+            settings = self._load()
+            if settings is None or settings == self.current:
+                return False
+            previous, self.current = self.current, settings
+        changes = ', '.join(f"{field}={value}" for field, old, value in zip(settings._fields, previous, settings)
+                            if old != value)
+        logger.info(f"Runtime settings changed: {changes}")
+        for listener in self._listeners:
+            listener(settings)
+        return True
+
+    def _load(self) -> Optional[ScrapeSettings]:
+        """Defaults plus the control file's overrides, or None (settings unchanged) if it is invalid."""
+        if self.control_file is None or not os.path.exists(self.control_file):
+            return self.defaults
+        try:
+            with open(self.control_file, encoding='utf-8') as f:
+                values = json.load(f)
+            if not isinstance(values, dict):
+                raise ValueError("expected a JSON object")
+            return validate_settings(values, self.defaults)
+        except (OSError, ValueError) as e:
+            logger.error(f"Ignoring control file {self.control_file}: {e}")
+            return None
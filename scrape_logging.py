@@ -0,0 +1,154 @@
+"""
+Scrape Logging
+Queue-backed logging that keeps file/console writes off the scraping hot path,
+plus a JSON-lines event log for per-organization results.
+
+- setup_queue_logging(): the root logger only enqueues records; a background
+  QueueListener thread formats them and writes the log file and console
+- EventLog: one compact JSON object per scraped item, serialized and written by
+  its own background thread; only a sample of successful items (and every
+  failure) is echoed to the regular log
+"""
+
+import atexit
+import json
+import logging
+import queue
+import threading
+from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional
+
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+# Events written per file flush by the EventLog writer thread
+EVENT_FLUSH_BATCH = 256
+
+_listener: Optional[QueueListener] = None
+
+
+def setup_queue_logging(log_file: str, level: int = logging.INFO, console: bool = True) -> QueueListener:
+    """
+    Route the root logger through a queue to file (and console) handlers
+    running on a background thread. Replaces any handlers installed earlier.
+
+    Args:
+        log_file: Log file path (appended to)
+        level: Root logger level
+        console: Also write records to stderr
+
+    Returns:
+        The running QueueListener (stopped automatically at exit)
+    """
+    global _listener
+    stop_queue_logging()
+
+    formatter = logging.Formatter(LOG_FORMAT)
+    handlers = [logging.FileHandler(log_file, encoding='utf-8')]
+    if console:
+        handlers.append(logging.StreamHandler())
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+        handler.close()
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(level)
+
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    return _listener
+
+
+def stop_queue_logging():
+    """Flush queued records and stop the listener thread (safe to call twice)."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+atexit.register(stop_queue_logging)
+
+
+class EventLog:
+    """
+    Per-item result records as JSON lines, written off the hot path.
+
+    Every record goes to the events file. Failures are always echoed to the
+    logger; successes only at success_sample_rate (0.05 = every 20th), so
+    console output stays readable and cheap at hundreds of items per minute.
+    """
+
+    def __init__(self, path: str, logger: logging.Logger, success_sample_rate: float = 1.0):
+        """
+        Args:
+            path: JSON-lines file to append events to
+            logger: Logger for the sampled human-readable lines
+            success_sample_rate: Fraction of successful items echoed to the logger (0-1)
+        """
+        self.path = path
+        self.logger = logger
+        self.success_sample_rate = success_sample_rate
+        self.events_written = 0
+        self._sample_credit = 0.0
+        self._sample_lock = threading.Lock()  # record() is called from every fetch thread
+        self._queue = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._writer, name='event-log-writer', daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def record(self, event: Dict, ok: bool, message: str):
+        """
+        Log one item result.
+
+        Args:
+            event: JSON-serializable record (a timestamp is added)
+            ok: Whether the item succeeded (failures are always echoed)
+            message: Human-readable line for the regular log
+        """
+        event = {'ts': datetime.now().isoformat(timespec='seconds'), **event}
+        self._queue.put(event)
+
+        if not ok:
+            self.logger.warning(message)
+            return
+        with self._sample_lock:
+            self._sample_credit += self.success_sample_rate
+            sampled = self._sample_credit >= 1.0
+            if sampled:
+                self._sample_credit -= 1.0
+        if sampled:
+            self.logger.info(message)
+
+    def _writer(self):
+        """Serialize queued events and append them to the file in batches."""
+        with open(self.path, 'a', encoding='utf-8') as f:
+            while True:
+                event = self._queue.get()
+                batch = []
+                while event is not None:
+                    batch.append(json.dumps(event, ensure_ascii=False, separators=(',', ':')))
+                    if len(batch) >= EVENT_FLUSH_BATCH:
+                        break
+                    try:
+                        event = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                if batch:
+                    f.write('\n'.join(batch) + '\n')
+                    f.flush()
+                    self.events_written += len(batch)
+                if event is None:
+                    return
+
+    def close(self):
+        """Write out queued events and stop the writer thread."""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
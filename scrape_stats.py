@@ -0,0 +1,206 @@
+"""
+Scrape Statistics
+Per-stage latency histograms, transfer/retry counters and live throughput/ETA
+reporting for the scrapers' hot paths
+"""
+
+import bisect
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+# Histogram bucket upper bounds in seconds: 1ms .. ~17min, ~12% apart
+BUCKET_BOUNDS = [0.001 * 1.12 ** i for i in range(123)]
+
+# Completions used for the recent-throughput window behind the ETA
+RECENT_WINDOW = 500
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram (constant memory, approximate percentiles)."""
+    
+    def __init__(self):
+        self.buckets = [0] * (len(BUCKET_BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+    
+    def record(self, seconds: float):
+        """Add one observation."""
+        self.buckets[bisect.bisect_left(BUCKET_BOUNDS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+    
+    def percentile(self, p: float) -> float:
+        """Approximate p-th percentile (0-100) in seconds, interpolated within its bucket."""
+        if not self.count:
+            return 0.0
+        target = p / 100 * self.count
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            if n and seen + n >= target:
+                if i >= len(BUCKET_BOUNDS):
+                    return self.max
+                lower = BUCKET_BOUNDS[i - 1] if i else 0.0
+                estimate = lower + (BUCKET_BOUNDS[i] - lower) * (target - seen) / n
+                return min(estimate, self.max)
+            seen += n
+        return self.max
+    
+    def summary(self) -> Dict[str, float]:
+        return {
+            'count': self.count,
+            'mean': self.total / self.count if self.count else 0.0,
+            'p50': self.percentile(50),
+            'p90': self.percentile(90),
+            'p99': self.percentile(99),
+            'max': self.max,
+        }
+
+
+def format_seconds(seconds: float) -> str:
+    """Compact duration: 850ms, 2.3s, 4m12s, 3h05m, 2d04h."""
+    if seconds < 1:
+        return f"{seconds * 1000:.0f}ms"
+    if seconds < 60:
+        return f"{seconds:.1f}s"
+    minutes, secs = divmod(int(seconds), 60)
+    if minutes < 60:
+        return f"{minutes}m{secs:02d}s"
+    hours, minutes = divmod(minutes, 60)
+    if hours < 48:
+        return f"{hours}h{minutes:02d}m"
+    days, hours = divmod(hours, 24)
+    return f"{days}d{hours:02d}h"
+
+
+class ScrapeStats:
+    """Collects stage timings and counters and periodically reports them."""
+    
+    def __init__(self, unit: str = "items", stats_file: Optional[str] = None,
+                 report_interval: float = 60, logger: Optional[logging.Logger] = None):
+        """
+        Args:
+            unit: Name of a unit of work in reports ("orgs", "pages")
+            stats_file: JSON file rewritten on every report (None = log only)
+            report_interval: Minimum seconds between reports
+            logger: Logger for the stats line (default: this module's logger)
+        """
+        self.unit = unit
+        self.stats_file = stats_file
+        self.report_interval = report_interval
+        self.logger = logger or logging.getLogger(__name__)
+        
+        self.started = time.time()
+        self.last_report = self.started
+        self.stages: Dict[str, LatencyHistogram] = {}
+        self.counters: Dict[str, int] = {'requests': 0, 'bytes': 0, 'retries': 0, 'rate_limited': 0, 'errors': 0}
+        self.completed = 0
+        self.recent = deque(maxlen=RECENT_WINDOW)
+        self._lock = threading.Lock()
+    
+    @contextmanager
+    def stage(self, name: str):
+        """Time the enclosed block as one observation of a stage."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+    
+    def record(self, name: str, seconds: float):
+        """Record a stage latency."""
+        with self._lock:
+            histogram = self.stages.get(name)
+            if histogram is None:
+                histogram = self.stages[name] = LatencyHistogram()
+            histogram.record(seconds)
+    
+    def count(self, counter: str, amount: int = 1):
+        """Increment a counter (requests, bytes, retries, rate_limited, errors, ...)."""
+        with self._lock:
+            self.counters[counter] = self.counters.get(counter, 0) + amount
+    
+    def item_done(self):
+        """Mark one unit of work (an org or a page) as finished."""
+        now = time.time()
+        with self._lock:
+            self.completed += 1
+            self.recent.append(now)
+    
+    def snapshot(self, remaining: Optional[int] = None) -> Dict:
+        """
+        Current statistics as a JSON-serializable dict.
+        
+        Args:
+            remaining: Units of work left, for the ETA
+        """
+        now = time.time()
+        with self._lock:
+            elapsed = max(now - self.started, 1e-9)
+            
+            # Recent rate reflects current conditions (rate limiting, slow pages)
+            # better than the run average, so the ETA uses it when available
+            recent_rate = None
+            if len(self.recent) >= 2 and self.recent[-1] > self.recent[0]:
+                recent_rate = (len(self.recent) - 1) / (now - self.recent[0])
+            rate = recent_rate or self.completed / elapsed
+            
+            eta = remaining / rate if remaining is not None and rate > 0 else None
+            
+            return {
+                'timestamp': now,
+                'elapsed_seconds': elapsed,
+                'unit': self.unit,
+                'completed': self.completed,
+                'remaining': remaining,
+                'rate_per_second': self.completed / elapsed,
+                'recent_rate_per_second': recent_rate,
+                'requests_per_second': self.counters['requests'] / elapsed,
+                'eta_seconds': eta,
+                'counters': dict(self.counters),
+                'stages': {name: histogram.summary() for name, histogram in self.stages.items()},
+            }
+    
+    def format_line(self, snapshot: Dict) -> str:
+        """One compact log line for a snapshot."""
+        parts = [f"[STATS] {snapshot['completed']} {self.unit} in {format_seconds(snapshot['elapsed_seconds'])}",
+                 f"{snapshot['rate_per_second']:.2f} {self.unit}/s"
+                 + (f" (recent {snapshot['recent_rate_per_second']:.2f})" if snapshot['recent_rate_per_second'] else ""),
+                 f"{snapshot['requests_per_second']:.2f} req/s"]
+        for name, summary in snapshot['stages'].items():
+            parts.append(f"{name} p50={format_seconds(summary['p50'])} p90={format_seconds(summary['p90'])} "
+                         f"p99={format_seconds(summary['p99'])}")
+        counters = snapshot['counters']
+        parts.append(f"{counters['bytes'] / 1e6:.1f}MB retries={counters['retries']} "
+                     f"429s={counters['rate_limited']} errors={counters['errors']}")
+        if snapshot['eta_seconds'] is not None:
+            parts.append(f"ETA {format_seconds(snapshot['eta_seconds'])} ({snapshot['remaining']} remaining)")
+        return " | ".join(parts)
+    
+    def report(self, remaining: Optional[int] = None) -> Dict:
+        """Log a stats line and rewrite the stats file."""
+        snapshot = self.snapshot(remaining)
+        self.last_report = snapshot['timestamp']
+        self.logger.info(self.format_line(snapshot))
+        
+        if self.stats_file:
+            try:
+                tmp_file = f"{self.stats_file}.tmp"
+                with open(tmp_file, 'w') as f:
+                    json.dump(snapshot, f, indent=2)
+                os.replace(tmp_file, self.stats_file)
+            except OSError as e:
+                self.logger.warning(f"Could not write stats file {self.stats_file}: {e}")
+        return snapshot
+    
+    def maybe_report(self, remaining: Optional[int] = None):
+        """Report if report_interval has passed since the last report."""
+        if time.time() - self.last_report >= self.report_interval:
+            self.report(remaining)
@@ -0,0 +1,81 @@
+"""
+Site Chrome Filter
+Learns which links belong to the site's shared template (header, footer,
+global banners) by counting how often each link appears across recently
+scraped pages, so they can be dropped before link classification.
+
+Counts decay exponentially (half-life in pages), so the learned set follows
+template changes during a long run, and links seen on only a few pages are
+pruned to keep memory bounded.
+"""
+
+import threading
+from typing import FrozenSet, Iterable
+
+# Recompute the learned set every this many pages
+REFRESH_EVERY = 10
+
+# Forget links whose decayed count fell below this
+PRUNE_BELOW = 0.1
+
+
+class ChromeFilter:
+    """Decayed per-link page frequencies and the set of near-global links."""
+
+    def __init__(self, threshold: float = 0.6, min_pages: int = 20, halflife: float = 1000):
+        """
+        Args:
+            threshold: Fraction of recent pages a link must appear on to count as site chrome
+            min_pages: Pages to observe before anything is classified as chrome
+            halflife: Pages after which an observation counts half as much
+        """
+        self.threshold = threshold
+        self.min_pages = min_pages
+        self.decay = 0.5 ** (1.0 / halflife)
+        self.pages = 0
+        self.chrome: FrozenSet[str] = frozenset()
+        self._links = {}  # link -> [decayed count, page number of last update]
+        self._lock = threading.Lock()
+
+    def observe(self, links: Iterable[str]) -> bool:
+        """
+        Record the distinct links of one page.
+
+        Returns:
+            True if the learned chrome set changed
+        """
+        with self._lock:
+            self.pages += 1
+            page, decay, entries = self.pages, self.decay, self._links
+            for link in set(links):
+                entry = entries.get(link)
+                if entry is None:
+                    entries[link] = [1.0, page]
+                else:
+                    entry[0] = entry[0] * decay ** (page - entry[1]) + 1.0
+                    entry[1] = page
+            if page % REFRESH_EVERY == 0 and page >= self.min_pages:
+                return self._refresh()
+            return False
+
+    def _refresh(self) -> bool:
+        """Recompute the chrome set from decayed frequencies and prune rare links."""
+        page, decay = self.pages, self.decay
+        decayed_pages = (1.0 - decay ** page) / (1.0 - decay)
+        chrome, stale = set(), []
+        for link, (count, last) in self._links.items():
+            current = count * decay ** (page - last)
+            if current >= self.threshold * decayed_pages:
+                chrome.add(link)
+            elif current < PRUNE_BELOW:
+                stale.append(link)
+        for link in stale:
+            del self._links[link]
+
+        changed = chrome != self.chrome
+        self.chrome = frozenset(chrome)
+        return changed
+
+    def __len__(self) -> int:
+        """Number of links currently tracked."""
+        return len(self._links)
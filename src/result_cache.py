@@ -0,0 +1,143 @@
+"""Persistent, content-addressed cache of Firecrawl scrape results."""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+
+def cache_key(url, options=None):
+    """Stable digest of a URL plus scrape options.
+
+    Unlike hash(), the digest is the same in every process, so results saved
+    by one run are found by the next.
+
+    Args:
+        url (str): URL to scrape
+        options (dict, optional): Scrape parameters that change the result
+
+    Returns:
+        str: Hex SHA-256 digest
+    """
+    payload = json.dumps({"url": url.strip(), "options": options or {}},
+                         sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def to_jsonable(result):
+    """Plain dict for a scrape result (SDK response models are converted)."""
+    if hasattr(result, 'model_dump'):
+        return result.model_dump(exclude_none=True)
+    return result
+
+
+class ResultCache:
+    """One JSON file per cache key, expired after a TTL and evicted
+    least-recently-used first once the directory exceeds a size limit."""
+
+    def __init__(self, cache_dir="output/cache", ttl=7 * 24 * 3600, max_bytes=500 * 1024 * 1024):
+        """Open (or create) a cache directory.
+
+        Args:
+            cache_dir (str): Directory holding the cache files
+            ttl (float): Seconds an entry stays valid (None or 0: forever)
+            max_bytes (int): Total size above which old entries are evicted (None or 0: unlimited)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._sizes = {path.stem: path.stat().st_size for path in self.cache_dir.glob('*.json')}
+        self._total = sum(self._sizes.values())
+
+    def _path(self, key):
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key):
+        """Cached result for a key, or None if missing or expired."""
+        path = self._path(key)
+        try:
+            with open(path, encoding='utf-8') as f:
+                entry = json.load(f)
+            created_at, result = float(entry['created_at']), entry['result']
+        except (OSError, ValueError, KeyError, TypeError):
+            entry = None  # missing, unreadable or malformed: a miss
+
+        if entry is not None and self.ttl and time.time() - created_at > self.ttl:
+            self._remove(key)
+            entry = None
+
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        try:
+            os.utime(path)  # mark as recently used for eviction
+        except OSError:
+            pass
+        return result
+
+    def put(self, key, url, result):
+        """Store a result, then evict old entries if the cache is over its size limit."""
+        path = self._path(key)
+        tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"url": url, "created_at": time.time(), "result": result}, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            self._total += path.stat().st_size - self._sizes.get(key, 0)
+            self._sizes[key] = path.stat().st_size
+            over = self.max_bytes and self._total > self.max_bytes
+        if over:
+            self._evict()
+
+    def _remove(self, key):
+        try:
+            self._path(key).unlink()
+        except OSError:
+            pass
+        with self._lock:
+            self._total -= self._sizes.pop(key, 0)
+
+    def _evict(self):
+        """Delete least-recently-used entries until the cache is at 90% of max_bytes."""
+        def last_used(key):
+            try:
+                return self._path(key).stat().st_mtime
+            except OSError:
+                return 0
+
+        target = self.max_bytes * 0.9
+        for key in sorted(list(self._sizes), key=last_used):
+            if self._total <= target:
+                break
+            self._remove(key)
+            with self._lock:
+                self.evictions += 1
+
+    def __len__(self):
+        return len(self._sizes)
+
+    def stats(self):
+        """Lookup counters and current size.
+
+        Returns:
+            dict: hits, misses, hit_rate, evictions, entries, bytes
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "entries": len(self._sizes),
+            "bytes": self._total,
+        }
@@ -1,26 +1,91 @@
 """Firecrawl-based web scraper."""
 
 from firecrawl import FirecrawlApp
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from itertools import islice
 import json
 import os
+import time
 from pathlib import Path
+from urllib.parse import urlsplit
+
+from .result_cache import ResultCache, cache_key, to_jsonable
+
+# Consecutive failed status checks after which a batch job is given up
+BATCH_STATUS_MAX_ERRORS = 5
+
+
+def _field(obj, name):
+    """Read a field from an SDK response object or a plain dict."""
+    if isinstance(obj, dict):
+        return obj.get(name)
+    return getattr(obj, name, None)
+
+
+def _url_key(url):
+    """URL without scheme, a leading www. or a trailing slash (redirects often differ only there)."""
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    host = host[4:] if host.startswith('www.') else host
+    return host + parts.path.rstrip('/') + (f"?{parts.query}" if parts.query else '')
+
+
+def _match_batch(batch, documents):
+    """Pair batch job documents with the URLs that were submitted.
+    
+    A document belongs to the submitted URL equal to its metadata.sourceURL
+    or metadata.url, compared exactly and then without scheme, www. and
+    trailing slash. Documents come back in submission order, so only those
+    still unmatched after that are paired with the unmatched URLs by
+    position, and only when the counts agree; otherwise they cannot be
+    attributed and are dropped.
+    
+    Returns:
+        list: (submitted url, document) pairs, in document order
+    """
+    unmatched = list(batch)
+    matched = [None] * len(documents)
+    for compare in (str.strip, _url_key):
+        for i, document in enumerate(documents):
+            if matched[i] is not None:
+                continue
+            metadata = _field(document, 'metadata') or {}
+            keys = {compare(url) for url in (_field(metadata, 'sourceURL'), _field(metadata, 'url')) if url}
+            for url in unmatched:
+                if compare(url) in keys:
+                    matched[i] = url
+                    unmatched.remove(url)
+                    break
+    
+    leftover = [i for i, url in enumerate(matched) if url is None]
+    if len(leftover) == len(unmatched):
+        for i, url in zip(leftover, unmatched):
+            matched[i] = url
+    return [(url, document) for url, document in zip(matched, documents) if url is not None]
 
 
 class FirecrawlScraper:
     """A web scraper using Firecrawl API."""
     
-    def __init__(self, api_key):
+    def __init__(self, api_key, app=None, cache=True, cache_ttl=7 * 24 * 3600,
+                 cache_max_bytes=500 * 1024 * 1024):
         """Initialize the scraper with Firecrawl API key.
         
         Args:
             api_key (str): Firecrawl API key
+            app (optional): Client to use instead of FirecrawlApp(api_key)
+            cache (bool): Reuse results saved in output/cache by earlier scrapes
+            cache_ttl (float): Seconds a cached result stays valid
+            cache_max_bytes (int): Cache size above which least-recently-used results are evicted
         """
-        self.app = FirecrawlApp(api_key=api_key)
+        self.app = app if app is not None else FirecrawlApp(api_key=api_key)
         self.output_dir = Path("output")
         self.output_dir.mkdir(exist_ok=True)
+        self.cache = (ResultCache(self.output_dir / "cache", ttl=cache_ttl, max_bytes=cache_max_bytes)
+                      if cache else None)
     
     def scrape_url(self, url, **kwargs):
-        """Scrape a single URL using Firecrawl.
+        """Scrape a single URL using Firecrawl, or return the cached result.
         
         Args:
             url (str): URL to scrape
@@ -29,31 +94,163 @@ class FirecrawlScraper:
         Returns:
             dict: Scraped content from Firecrawl
         """
+        key = cache_key(url, kwargs)
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                print(f"Cache hit: {url}")
+                return cached
+        
         try:
             print(f"Scraping: {url}")
-            result = self.app.scrape_url(url, **kwargs)
+            result = to_jsonable(self.app.scrape_url(url, **kwargs))
             print(f"Successfully scraped: {url}")
-            return result
         except Exception as e:
             print(f"Error scraping {url}: {str(e)}")
             return None
+        
+        if result and self.cache is not None:
+            try:
+                self.cache.put(key, url, result)
+            except (OSError, TypeError, ValueError) as e:
+                print(f"Could not cache result for {url}: {str(e)}")
+        return result
+    
+    def cache_stats(self):
+        """Cache hit/miss counters (see ResultCache.stats), or None without a cache."""
+        return self.cache.stats() if self.cache is not None else None
+    
+    def print_cache_stats(self):
+        """Print the cache hit rate."""
+        stats = self.cache_stats()
+        if stats:
+            print(f"Cache: {stats['hits']} hits, {stats['misses']} misses "
+                  f"({stats['hit_rate']:.0%} hit rate), {stats['entries']} entries, "
+                  f"{stats['bytes'] / 1024 / 1024:.1f} MB, {stats['evictions']} evicted")
     
-    def scrape_urls(self, urls, **kwargs):
-        """Scrape multiple URLs.
+    def scrape_urls(self, urls, concurrency=1, batch_size=None, poll_interval=2.0, **kwargs):
+        """Scrape multiple URLs, yielding results as they complete.
+        
+        With concurrency=1 URLs are scraped one after another. A higher
+        concurrency keeps up to that many scrape_url calls in flight; with
+        batch_size, URLs are submitted as Firecrawl batch jobs of that size
+        instead, up to `concurrency` jobs at a time, and polled until done.
+        URLs are read from the iterable only as capacity frees up.
         
         Args:
-            urls (list): List of URLs to scrape
+            urls (iterable): URLs to scrape
+            concurrency (int): Maximum requests (or batch jobs) in flight
+            batch_size (int, optional): URLs per batch job; None scrapes URLs individually
+            poll_interval (float): Seconds between batch status checks
             **kwargs: Additional parameters for scraping
             
-        Returns:
-            list: List of scraping results
+        Yields:
+            tuple: (url, result) for each URL, in completion order; result is
+            None for URLs that could not be scraped
         """
-        results = []
-        for url in urls:
-            result = self.scrape_url(url, **kwargs)
-            if result:
-                results.append(result)
-        return results
+        if batch_size:
+            yield from self._scrape_batches(urls, concurrency, batch_size, poll_interval, **kwargs)
+        elif concurrency <= 1:
+            for url in urls:
+                yield url, self.scrape_url(url, **kwargs) or None
+        else:
+            yield from self._scrape_concurrently(urls, concurrency, **kwargs)
+        self.print_cache_stats()
+    
+    def _scrape_concurrently(self, urls, concurrency, **kwargs):
+        """scrape_url on a thread pool with at most `concurrency` calls in flight."""
+        urls = iter(urls)
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            pending = {executor.submit(self.scrape_url, url, **kwargs): url
+                       for url in islice(urls, concurrency)}
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    url = pending.pop(future)
+                    yield url, future.result() or None
+                for url in islice(urls, len(done)):
+                    pending[executor.submit(self.scrape_url, url, **kwargs)] = url
+    
+    def _scrape_batches(self, urls, concurrency, batch_size, poll_interval, **kwargs):
+        """Batch jobs via async_batch_scrape_urls, polled with check_batch_scrape_status."""
+        urls = iter(urls)
+        jobs = {}  # job id -> URLs in the batch
+        status_errors = {}  # job id -> consecutive failed status checks
+        
+        ready = []  # cache hits and failed submissions found while filling the next batch
+        
+        def submit_next():
+            batch = []
+            for url in urls:
+                result = self.cache.get(cache_key(url, kwargs)) if self.cache is not None else None
+                if result is not None:
+                    ready.append((url, result))
+                else:
+                    batch.append(url)
+                    if len(batch) == batch_size:
+                        break
+            if not batch:
+                return False
+            try:
+                job = self.app.async_batch_scrape_urls(batch, **kwargs)
+                job_id = _field(job, 'id')
+                if not job_id:
+                    raise ValueError(_field(job, 'error') or "no job id returned")
+                jobs[job_id] = batch
+                print(f"Submitted batch {job_id} ({len(batch)} URLs)")
+            except Exception as e:
+                print(f"Error submitting batch of {len(batch)} URLs: {str(e)}")
+                ready.extend((url, None) for url in batch)
+            return True
+        
+        def fill():
+            while len(jobs) < max(1, concurrency) and submit_next():
+                pass
+        
+        fill()
+        yield from ready
+        ready.clear()
+        
+        while jobs:
+            time.sleep(poll_interval)
+            for job_id in list(jobs):
+                try:
+                    status = self.app.check_batch_scrape_status(job_id)
+                    status_errors.pop(job_id, None)
+                except Exception as e:
+                    status_errors[job_id] = status_errors.get(job_id, 0) + 1
+                    print(f"Error checking batch {job_id} ({status_errors[job_id]}/{BATCH_STATUS_MAX_ERRORS}): "
+                          f"{str(e)}")
+                    if status_errors[job_id] < BATCH_STATUS_MAX_ERRORS:
+                        continue
+                    status = {'status': 'unreachable'}
+                state = _field(status, 'status')
+                if state not in ('completed', 'failed', 'cancelled', 'unreachable'):
+                    continue
+                
+                batch = jobs.pop(job_id)
+                status_errors.pop(job_id, None)
+                if state != 'completed':
+                    print(f"Batch {job_id} {state}: {len(batch)} URLs not scraped")
+                    ready.extend((url, None) for url in batch)
+                else:
+                    documents = [to_jsonable(document) for document in _field(status, 'data') or []]
+                    pairs = _match_batch(batch, documents)
+                    for url, document in pairs:
+                        if self.cache is not None:
+                            try:
+                                self.cache.put(cache_key(url, kwargs), url, document)
+                            except (OSError, TypeError, ValueError) as e:
+                                print(f"Could not cache result for {url}: {str(e)}")
+                        yield url, document
+                    returned = {url for url, _ in pairs}
+                    missing = [url for url in batch if url not in returned]
+                    if missing:
+                        print(f"Batch {job_id}: no result for {len(missing)} URLs")
+                        ready.extend((url, None) for url in missing)
+                fill()
+                yield from ready
+                ready.clear()
     
     def save_result(self, result, filename):
         """Save scraping result to a JSON file.
@@ -82,7 +279,7 @@ class FirecrawlScraper:
         
         if result:
             if output_filename is None:
-                output_filename = f"scraped_{hash(url)}.json"
+                output_filename = f"scraped_{cache_key(url, kwargs)[:16]}.json"
             self.save_result(result, output_filename)
         
         return result
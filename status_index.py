@@ -0,0 +1,80 @@
+"""
+Scrape Status Index for Phase 2
+Keeps each row's scrape_status bucket in a compact array (one byte per row)
+so run modes can jump straight to the organizations they need instead of
+scanning the status strings
+"""
+
+from typing import Dict, Iterable, List
+
+import numpy as np
+import pandas as pd
+
+# Status buckets, in the order they are reported
+STATUS_BUCKETS = ('pending', 'success', 'failed', 'error')
+
+
+def status_bucket(status) -> str:
+    """
+    Map a raw scrape_status value to its bucket.
+    
+    Args:
+        status: Value of the scrape_status column
+        
+    Returns:
+        'pending' (never scraped), 'success', 'error' ("error: ..."), or 'failed'
+        (failed_after_retries and any other non-success status)
+    """
+    if status is None or pd.isna(status) or status == '':
+        return 'pending'
+    if status == 'success':
+        return 'success'
+    if str(status).startswith('error'):
+        return 'error'
+    return 'failed'
+
+
+# Array code per bucket
+BUCKET_CODES = {bucket: code for code, bucket in enumerate(STATUS_BUCKETS)}
+
+
+class StatusIndex:
+    """Status bucket code per row (int8 array), updated as rows are scraped."""
+    
+    def __init__(self, size: int = 0):
+        """
+        Args:
+            size: Number of rows (all start as 'pending')
+        """
+        self._codes = np.zeros(size, dtype=np.int8)
+    
+    @classmethod
+    def from_series(cls, statuses: pd.Series) -> 'StatusIndex':
+        """
+        Build the index from a scrape_status column.
+        
+        Args:
+            statuses: scrape_status series indexed by row
+        """
+        index = cls(len(statuses))
+        # Classify each distinct status once, then broadcast the codes
+        codes = pd.Series(statuses.to_numpy(dtype=object)).map(
+            {status: BUCKET_CODES[status_bucket(status)] for status in pd.unique(statuses.to_numpy(dtype=object))})
+        index._codes[:] = codes.to_numpy(dtype=np.int8)
+        return index
+    
+    def update(self, row: int, status):
+        """Move a row into the bucket for its new status."""
+        if row >= len(self._codes):
+            self._codes = np.concatenate([self._codes, np.zeros(row + 1 - len(self._codes), dtype=np.int8)])
+        self._codes[row] = BUCKET_CODES[status_bucket(status)]
+    
+    def indices(self, buckets: Iterable[str]) -> List[int]:
+        """Sorted row indices in any of the given buckets."""
+        wanted = [BUCKET_CODES[bucket] for bucket in buckets]
+        return np.flatnonzero(np.isin(self._codes, wanted)).tolist()
+    
+    def counts(self) -> Dict[str, int]:
+        """Number of rows per bucket."""
+        totals = np.bincount(self._codes, minlength=len(STATUS_BUCKETS))
+        return {bucket: int(totals[code]) for bucket, code in BUCKET_CODES.items()}
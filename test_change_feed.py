@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Test script for the run-to-run change feed (change_feed.py)
+"""
+
+import json
+
+import pandas as pd
+
+from change_feed import ChangeFeed, diff_frames
+
+
+def test_diff_reports_added_removed_and_changed_fields():
+    old = pd.DataFrame({
+        'organization_url': ['https://hf.co/a', 'https://hf.co/b', 'https://hf.co/c'],
+        'organization_name': ['A', 'B', 'C'],
+        'model_count': ['1', '2', 'Null'],
+        'scrape_timestamp': ['t0', 't0', 't0'],
+    })
+    new = pd.DataFrame({
+        'organization_url': ['https://hf.co/a', 'https://hf.co/c', 'https://hf.co/d'],
+        'organization_name': ['A', 'C Corp', 'D'],
+        'model_count': [1, 'Null', 4],  # same values, different dtype than the CSV snapshot
+        'scrape_timestamp': ['t1', 't1', 't1'],
+    })
+    changes = list(diff_frames(old, new, ignore=['scrape_timestamp']))
+    assert changes == [
+        {'op': 'added', 'organization_url': 'https://hf.co/d', 'record': {'organization_name': 'D', 'model_count': '4'}},
+        {'op': 'removed', 'organization_url': 'https://hf.co/b',
+         'record': {'organization_name': 'B', 'model_count': '2'}},
+        {'op': 'modified', 'organization_url': 'https://hf.co/c', 'changes': {'organization_name': ['C', 'C Corp']}},
+    ]
+
+
+def test_publish_writes_feed_and_rotates_snapshot(tmp_path):
+    feed = ChangeFeed('phase2', feed_dir=str(tmp_path))
+    df = pd.DataFrame({'organization_url': ['https://hf.co/a'], 'location': ['Paris'],
+                       'description': [float('nan')]})
+
+    first = feed.publish(df)
+    assert (first['added'], first['removed'], first['modified']) == (1, 0, 0)
+    assert feed.publish(df) is None  # unchanged: no feed file
+
+    df.loc[0, 'location'] = 'Berlin'
+    second = feed.publish(df)
+    with open(second['path']) as f:
+        assert [json.loads(line) for line in f] == [
+            {'op': 'modified', 'organization_url': 'https://hf.co/a', 'changes': {'location': ['Paris', 'Berlin']}}]
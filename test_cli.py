@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Test script for the command line entry point (cli.py)
+"""
+
+import subprocess
+import sys
+
+import cli
+
+
+def test_importing_cli_does_not_load_scraper_dependencies():
+    code = ("import sys, cli; heavy = {'pandas', 'bs4', 'firecrawl', 'openpyxl'} & set(sys.modules); "
+            "print(','.join(sorted(heavy)))")
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True,
+                            cwd=cli.os.path.dirname(cli.__file__))
+    assert result.stdout.strip() == ''
+
+
+def test_count_rows_buckets_scrape_status(tmp_path):
+    path = tmp_path / 'details.csv'
+    path.write_text('organization_url,scrape_status\n'
+                    'https://hf.co/a,success\n'
+                    'https://hf.co/b,\n'
+                    'https://hf.co/c,error: timeout\n'
+                    'https://hf.co/d,not_found\n'
+                    'https://hf.co/e,success\n', encoding='utf-8')
+    assert cli.count_rows(str(path), 'scrape_status') == (
+        5, {'success': 2, 'pending': 1, 'error': 1, 'failed': 1})
+    assert cli.count_rows(str(path)) == (5, {})
+
+
+def test_subcommands_receive_leading_and_remaining_arguments(monkeypatch):
+    calls = []
+    monkeypatch.setitem(cli.COMMANDS, 'query', (None, 'fake', ['query'], ''))
+    monkeypatch.setattr(cli, 'fake', calls.append, raising=False)
+    cli.main(['query', 'speech', '--host', 'github.com'])
+    assert calls == [['query', 'speech', '--host', 'github.com']]
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Test script for hybrid profile extraction in huggingface_scraper (offline,
+stubbed Firecrawl client and HTTP session)
+"""
+
+import json
+import threading
+import time
+from pathlib import Path
+
+from openpyxl import load_workbook
+
+import huggingface_scraper as hf
+from extraction_cache import ExtractionCache
+
+FIXTURES = Path(__file__).parent / "benchmarks" / "fixtures"
+
+
+class StubFirecrawl:
+    """Records extract() calls and returns a canned LLM profile."""
+
+    def __init__(self):
+        self.calls = []
+
+    def extract(self, url, params):
+        self.calls.append(url)
+        return {"company_name": "LLM Name", "social_links": [{"platform": "LinkedIn",
+                                                              "url": "https://www.linkedin.com/company/llm"}]}
+
+
+class StubListingFirecrawl(StubFirecrawl):
+    """Listing pages of two orgs each, slow enough that overlap shows; LLM profiles otherwise."""
+
+    def __init__(self, delay=0.05):
+        super().__init__()
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+
+    def extract(self, url, params):
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.delay)
+            if '/organizations?p=' in url:
+                page = int(url.rsplit('=', 1)[1])
+                with self.lock:
+                    self.calls.append(url)
+                return {"organizations": [{"name": f"org{page}-{i}", "link": f"/org{page}-{i}"} for i in range(2)]}
+            with self.lock:
+                self.calls.append(url)
+            return {"company_name": url.rsplit('/', 1)[1], "social_links": []}
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+class StubResponse:
+    def __init__(self, text, status_code=200):
+        self.text = text
+        self.status_code = status_code
+
+
+class StubSession:
+    """Serves fixture HTML by URL path."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.requests = []
+
+    def get(self, url, timeout=None):
+        self.requests.append(url)
+        path = url.replace(hf.HF_BASE_URL, '')
+        if path in self.pages:
+            return StubResponse(self.pages[path])
+        return StubResponse('', 404)
+
+
+def test_hybrid_uses_llm_only_on_misses(tmp_path):
+    small_lab = (FIXTURES / "org_small-lab.html").read_text(encoding='utf-8')
+    no_name = small_lab.replace('<h1', '<h2').replace('</h1>', '</h2>').replace('og:title', 'og:other')
+    session = StubSession({'/small-lab': small_lab, '/no-name': no_name})
+    app = StubFirecrawl()
+    cache = ExtractionCache(str(tmp_path / 'cache.db'))
+
+    profile, source = hf.get_org_profile(app, '/small-lab', 'hybrid', cache, session)
+    assert source == 'local' and app.calls == []
+    assert profile['company_name'] == 'Small Lab'
+    socials = hf.extract_social_media(profile['social_links'])
+    assert socials['twitter'] == 'https://x.com/smalllab'
+    assert socials['github'] == ''  # GitLab is not a GitHub column
+    # Site footer links are not part of the profile
+    assert all('workable' not in link['url'] for link in profile['social_links'])
+
+    profile, source = hf.get_org_profile(app, '/no-name', 'hybrid', cache, session)
+    assert source == 'hybrid' and app.calls == [f"{hf.HF_BASE_URL}/no-name"]
+    assert profile['company_name'] == 'LLM Name'
+    assert {link['url'] for link in profile['social_links']} >= {'https://x.com/smalllab',
+                                                                'https://www.linkedin.com/company/llm'}
+
+
+def test_cached_profiles_are_not_fetched_again(tmp_path):
+    session = StubSession({})
+    app = StubFirecrawl()
+    cache_file = str(tmp_path / 'cache.db')
+
+    # Local mode: the failed fetch is not an LLM call
+    assert hf.get_org_profile(app, '/gone', 'local', ExtractionCache(cache_file), session) == (None, 'failed')
+    assert app.calls == []
+
+    profile, source = hf.get_org_profile(app, '/gone', 'hybrid', ExtractionCache(cache_file), session)
+    assert source == 'llm' and len(app.calls) == 1  # local fetch failed: LLM fallback
+
+    # A later run reads the cache: no HTTP request, no LLM call
+    profile_again, source = hf.get_org_profile(app, '/gone', 'hybrid', ExtractionCache(cache_file), session)
+    assert source == 'cache' and profile_again == profile
+    assert len(app.calls) == 1 and len(session.requests) == 2
+
+
+
+class EmptyFirecrawl(StubFirecrawl):
+    """LLM extraction that finds nothing."""
+
+    def extract(self, url, params):
+        self.calls.append(url)
+        return {}
+
+
+def test_cache_is_per_mode_and_skips_empty_profiles(tmp_path):
+    empty_org = (FIXTURES / "org_empty.html").read_text(encoding='utf-8')
+    small_lab = (FIXTURES / "org_small-lab.html").read_text(encoding='utf-8')
+    session = StubSession({'/empty-org': empty_org, '/small-lab': small_lab})
+    cache = ExtractionCache(str(tmp_path / 'cache.db'))
+
+    # A name but no links is a miss in hybrid mode
+    app = StubFirecrawl()
+    profile, source = hf.get_org_profile(app, '/empty-org', 'hybrid', cache, session)
+    assert source == 'hybrid' and len(app.calls) == 1
+
+    # A local result does not stand in for an LLM extraction
+    hf.get_org_profile(app, '/small-lab', 'local', cache, session)
+    profile, source = hf.get_org_profile(app, '/small-lab', 'llm', cache, session)
+    assert source == 'llm' and profile['company_name'] == 'LLM Name'
+    assert hf.get_org_profile(app, '/small-lab', 'local', cache, session)[1] == 'cache'
+
+    # Nothing usable from the LLM: not cached, asked again next time
+    app = EmptyFirecrawl()
+    for _ in range(2):
+        profile, source = hf.get_org_profile(app, '/unknown', 'llm', cache, session)
+        assert source == 'llm' and hf.is_empty_profile(profile)
+    assert len(app.calls) == 2
+
+def test_page_range_runs_concurrently_and_resumes(tmp_path):
+    output = str(tmp_path / 'orgs.xlsx')
+    checkpoint = str(tmp_path / 'pages.jsonl')
+    app = StubListingFirecrawl()
+
+    total = hf.run_page_range(app, 0, 2, mode='llm', workers=4, page_workers=2, rate=0,
+                              output_file=output, checkpoint_file=checkpoint)
+    assert total == 6 and app.max_active >= 2
+    with open(checkpoint) as f:
+        assert sorted(json.loads(line)['page'] for line in f) == [0, 1, 2]
+
+    rows = list(load_workbook(output).active.values)
+    assert list(rows[0]) == hf.RECORD_COLUMNS
+    assert [row[0] for row in rows[1:]] == [f"org{page}-{i}" for page in range(3) for i in range(2)]
+
+    # Extending the range only scrapes the new page; finished pages are replayed from the checkpoint
+    app = StubListingFirecrawl(delay=0)
+    total = hf.run_page_range(app, 1, 3, mode='llm', rate=0, output_file=output, checkpoint_file=checkpoint)
+    assert total == 6
+    assert [url for url in app.calls if 'organizations' in url] == [f"{hf.HF_BASE_URL}/organizations?p=3"]
+    assert [row[0] for row in list(load_workbook(output).active.values)[1:]][-2:] == ["org3-0", "org3-1"]
+
+
+class FlakyProfileFirecrawl(StubListingFirecrawl):
+    """Listing stub whose profile extraction fails for the given org links."""
+
+    def __init__(self, failing=()):
+        super().__init__(delay=0)
+        self.failing = set(failing)
+
+    def extract(self, url, params):
+        if url.rsplit('/', 1)[1] in self.failing:
+            with self.lock:
+                self.calls.append(url)
+            raise ConnectionError("extract failed")
+        return super().extract(url, params)
+
+
+def test_failed_profiles_are_retried_on_resume(tmp_path):
+    output = str(tmp_path / 'orgs.xlsx')
+    checkpoint = str(tmp_path / 'pages.jsonl')
+
+    total = hf.run_page_range(FlakyProfileFirecrawl(failing={'org1-0'}), 0, 1, mode='llm', rate=0,
+                              output_file=output, checkpoint_file=checkpoint)
+    assert total == 3
+    assert hf.page_checkpoint_failures(checkpoint) == {1: [{"name": "org1-0", "link": "/org1-0"}]}
+
+    # Only the failed profile is fetched again; no listing page is
+    app = FlakyProfileFirecrawl()
+    total = hf.run_page_range(app, 0, 1, mode='llm', rate=0, output_file=output, checkpoint_file=checkpoint)
+    assert total == 4 and app.calls == [f"{hf.HF_BASE_URL}/org1-0"]
+    assert hf.page_checkpoint_failures(checkpoint) == {}
+    assert sorted(row[0] for row in list(load_workbook(output).active.values)[1:]) == \
+        ["org0-0", "org0-1", "org1-0", "org1-1"]
+
+    # Nothing left to do
+    app = FlakyProfileFirecrawl()
+    assert hf.run_page_range(app, 0, 1, mode='llm', rate=0, output_file=output, checkpoint_file=checkpoint) == 4
+    assert app.calls == []
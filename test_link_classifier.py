@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+"""
+Test script for the host-table link classifier (offline)
+"""
+
+from link_classifier import LinkClassifier
+
+
+def test_links_grouped_by_host():
+    classifier = LinkClassifier(platforms={})
+    links = classifier.categorize([
+        'https://github.com/acme', 'https://www.dropbox.com/s/x', '/acme/models', 'mailto:team@acme.ai',
+        'https://discuss.huggingface.co', '//gitlab.com/acme', 'https://x.com/acme', 'https://github.com/acme',
+        'https://acme.ai/', 'http://[broken',
+    ])
+    assert links == {
+        'github': ['https://github.com/acme', 'https://gitlab.com/acme'],
+        'website': ['https://www.dropbox.com/s/x', 'https://acme.ai/'],
+        'social_media': ['https://x.com/acme'],
+    }
+
+
+def test_configured_platforms():
+    classifier = LinkClassifier(platforms={'bsky.app': ('social_media', 'bluesky'), 'acme.ai': ('ignore', 'acme')})
+    assert classifier.platform('https://bsky.app/profile/acme') == 'bluesky'
+    assert classifier.platform('https://www.linkedin.com/company/acme') == 'linkedin'
+    assert classifier.categorize(['https://docs.acme.ai/intro'])['website'] == []
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Test script for the long-format org -> link table (link_table.py)
+"""
+
+import pandas as pd
+
+from link_table import build_link_table, link_table_path
+
+
+def test_links_are_exploded_and_canonicalized():
+    details = pd.DataFrame({
+        'organization_url': ['https://huggingface.co/a', 'https://huggingface.co/b', 'https://huggingface.co/c'],
+        'github_links': ['https://github.com/a', 'Null', ''],
+        'website_links': ['https://WWW.Example.com/about/, http://a.dev:443/#top', 'Null', 'Null'],
+        'social_media_links': ['//x.com/a', 'https://www.linkedin.com/company/b/', 'mailto:c@c.com'],
+        'member_count': ['12', 'Null', 'Null'],
+        'model_count': ['3', '40', 'Null'],
+        'dataset_count': ['Null', 'Null', '1'],
+    })
+    table = build_link_table(details)
+
+    assert table['org_id'].tolist() == [0, 0, 0, 0, 1, 2]
+    assert table['link_type'].tolist() == ['github', 'social_media', 'website', 'website', 'social_media',
+                                           'social_media']
+    assert table['position'].tolist() == [0, 0, 0, 1, 0, 0]
+    assert table['canonical_url'].tolist()[:5] == ['https://github.com/a', 'https://x.com/a',
+                                                   'https://example.com/about', 'https://a.dev',
+                                                   'https://linkedin.com/company/b']
+    assert pd.isna(table['canonical_url'].iloc[5]) and pd.isna(table['host'].iloc[5])  # not a web link
+    assert table['host'].tolist()[:5] == ['github.com', 'x.com', 'example.com', 'a.dev', 'linkedin.com']
+    assert table['platform'].tolist() == ['github', 'twitter', '', '', 'linkedin', '']
+    assert str(table['model_count'].dtype) == 'Int32'
+    assert table['model_count'].tolist()[:5] == [3, 3, 3, 3, 40]
+    assert table['member_count'].isna().tolist() == [False] * 4 + [True] * 2
+
+
+def test_link_table_path():
+    assert link_table_path('output/detailed.csv') == 'output/detailed_links.csv'
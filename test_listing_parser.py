@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Test script for Phase 1 listing page parsing (HuggingFaceOrgScraper.parse_cards)
+"""
+
+from pathlib import Path
+
+import hf_org_scraper
+from hf_org_scraper import HuggingFaceOrgScraper, OrgCard
+from mock_hf_server import listing_orgs, render_listing
+
+FIXTURES = Path(__file__).parent / 'benchmarks' / 'fixtures'
+
+PAGE = """<html><body>
+<header><a href="/models">Models</a><a href="/pricing">Pricing</a><a href="/login">Log In</a></header>
+<main>
+<article><a href="/acme-ai"><img alt="Acme AI's profile picture" src="/a.png"><div><header>
+<h4>Acme AI</h4><span>company</span></header>
+<div><span>68 models</span> <span>1.2k followers</span></div></div></a></article>
+<article><a href="/tiny"><div><header><h4>Tiny Team +</h4><span>Team</span></header>
+<div><span>1 follower</span></div></div></a></article>
+<article><a href="/acme-ai"><h4>Acme AI (again)</h4><span>12 followers</span></a></article>
+<a href="/docs">Docs <span>5 followers</span></a>
+<a href="/acme-ai/models">All models</a>
+<a href="?p=1">Next</a>
+</main>
+<footer><a href="/terms-of-service">Terms</a><a href="https://github.com/huggingface">GitHub</a></footer>
+</body></html>"""
+
+
+def test_cards_carry_name_type_and_counts():
+    scraper = HuggingFaceOrgScraper()
+    cards = scraper.parse_cards(PAGE)
+    assert cards == [
+        OrgCard('Acme AI', 'https://huggingface.co/acme-ai', 'company', 68, 1200),
+        OrgCard('Tiny Team +', 'https://huggingface.co/tiny', 'team', 0, 1),
+    ]
+    assert scraper.parse_page(PAGE) == [(card.name, card.url) for card in cards]
+
+
+def test_mock_listing_round_trips():
+    cards = HuggingFaceOrgScraper().parse_cards(render_listing(3, 30))
+    expected = listing_orgs(3, 30)
+    assert [(card.url.rsplit('/', 1)[1], card.name, card.org_type) for card in cards] == \
+        [(slug, name, org_type) for slug, name, org_type, _, _ in expected]
+    assert [card.follower_count for card in cards if card.follower_count < 1000] == \
+        [followers for *_, followers in expected if followers < 1000]
+
+
+def test_cards_from_a_mock_site_keep_canonical_urls():
+    cards = HuggingFaceOrgScraper(base_url='http://127.0.0.1:8000').parse_cards(PAGE)
+    assert [card.url for card in cards] == ['https://huggingface.co/acme-ai', 'https://huggingface.co/tiny']
+
+
+def test_fixture_pages_exclude_site_chrome():
+    scraper = HuggingFaceOrgScraper()
+    for path in sorted(FIXTURES.glob('organizations_p*.html')):
+        cards = scraper.parse_cards(path.read_text(encoding='utf-8'))
+        assert len(cards) > 20
+        assert len({card.url for card in cards}) == len(cards)
+        assert all(card.name and card.url.count('/') == 3 for card in cards)
+        assert not {card.url.rsplit('/', 1)[1] for card in cards} & {'models', 'datasets', 'spaces', 'pricing'}
+
+
+def test_counts_outside_their_own_spans_are_still_read():
+    page = """<main>
+    <a href="/acme-ai"><h3>Acme AI</h3><em>Company</em><div>68 models · 1.2k followers</div></a>
+    <a href="/gpt4-fans"><div><b>GPT4 Fans</b> <i>community</i> <p>3 followers</p></div></a>
+    </main>"""
+    assert HuggingFaceOrgScraper().parse_cards(page) == [
+        OrgCard('Acme AI', 'https://huggingface.co/acme-ai', 'company', 68, 1200),
+        OrgCard('GPT4 Fans', 'https://huggingface.co/gpt4-fans', 'community', 0, 3),
+    ]
+
+
+class FakeResponse:
+    status_code = 200
+
+    def __init__(self, text):
+        self.text = text
+        self.content = text.encode()
+
+    def raise_for_status(self):
+        pass
+
+
+def test_a_page_without_cards_stops_the_run_before_the_checkpoint(tmp_path, monkeypatch):
+    monkeypatch.setattr(hf_org_scraper, 'OUTPUT_DIR', tmp_path)
+    monkeypatch.setattr(hf_org_scraper, 'OUTPUT_CSV', tmp_path / 'orgs.csv')
+    monkeypatch.setattr(hf_org_scraper, 'CHECKPOINT_FILE', tmp_path / 'checkpoint.txt')
+    monkeypatch.setattr(hf_org_scraper, 'STATS_FILE', tmp_path / 'stats.json')
+    monkeypatch.setattr(hf_org_scraper, 'DELAY_BETWEEN_PAGES', 0)
+    pages = {0: render_listing(0, 3), 1: '<html><body><main><div class="new-card-markup"></div></main></body></html>',
+             2: render_listing(2, 3)}
+
+    scraper = HuggingFaceOrgScraper()
+    scraper.session.get = lambda url, timeout=None: FakeResponse(pages[int(url.rsplit('=', 1)[1])])
+    scraper.run(start_page=0, end_page=2)
+
+    assert scraper.get_last_checkpoint() == 0
+    assert len((tmp_path / 'orgs.csv').read_text(encoding='utf-8').splitlines()) == 1 + 3
+    assert scraper.stats.counters['errors'] == 1
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Test script for parse tree teardown and the RSS watchdog (memory_watchdog.py)
+"""
+
+import gc
+import logging
+
+import memory_watchdog
+from memory_watchdog import MemoryWatchdog, parse_html
+
+PAGE = ("<html><head><title>Org</title></head><body><main><h1>Org</h1>"
+        + "".join(f'<p>para {i} <a href="https://example.com/{i}">link</a></p>' for i in range(50))
+        + "</main></body></html>")
+
+
+def test_parsed_tree_is_freed_without_the_cyclic_collector():
+    gc.collect()
+    gc.disable()
+    try:
+        with parse_html(PAGE) as soup:
+            links = [a.get('href') for a in soup.find_all('a', href=True)]
+            title = soup.find('h1').get_text(strip=True)
+        del soup
+        assert gc.collect() == 0
+    finally:
+        gc.enable()
+    assert len(links) == 50 and title == 'Org'
+
+
+def test_rss_is_logged_every_n_items(caplog):
+    watchdog = MemoryWatchdog('orgs', log_every=1000, collect_every=0, ceiling_mb=0)
+    with caplog.at_level(logging.INFO, logger='memory_watchdog'):
+        for _ in range(2500):
+            watchdog.tick()
+        watchdog.tick(600)  # Phase 1 counts a page's organizations at once
+    lines = [record.getMessage() for record in caplog.records if record.getMessage().startswith('[MEM]')]
+    assert [line.split(':')[0] for line in lines] == ['[MEM] 1000 orgs', '[MEM] 2000 orgs', '[MEM] 3100 orgs']
+
+
+def test_intake_pauses_until_rss_drops_below_the_ceiling(monkeypatch):
+    readings = iter([300e6, 300e6, 300e6, 250e6, 150e6])
+    monkeypatch.setattr(memory_watchdog, 'rss_bytes', lambda: next(readings, 150e6))
+    watchdog = MemoryWatchdog(log_every=0, collect_every=0, ceiling_mb=200, check_interval=0.01)
+    assert watchdog.wait_below_ceiling() > 0
+    assert watchdog.pauses == 1
+    assert watchdog.wait_below_ceiling() == 0.0
+
+
+def test_pause_is_bounded(monkeypatch):
+    monkeypatch.setattr(memory_watchdog, 'rss_bytes', lambda: 300e6)
+    watchdog = MemoryWatchdog(log_every=0, collect_every=0, ceiling_mb=200, max_pause=0.05, check_interval=0.01)
+    assert 0.05 <= watchdog.wait_below_ceiling() < 1
+
+
+def test_unreadable_rss_resumes_intake(monkeypatch):
+    watchdog = MemoryWatchdog(log_every=0, collect_every=0, ceiling_mb=200, check_interval=0.01)
+    # RSS becomes unreadable after the first check, and again while paused
+    for readings in ([300e6, None], [300e6, 300e6, None]):
+        readings = iter(readings)
+        monkeypatch.setattr(memory_watchdog, 'rss_bytes', lambda: next(readings))
+        assert watchdog.wait_below_ceiling() < 1
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Test script for the mock HuggingFace server's fault injection, driven by the
+Phase 2 scraper over real HTTP (mock_hf_server.py)
+"""
+
+import json
+import random
+import time
+
+import pandas as pd
+import pytest
+import requests
+
+from mock_hf_server import LatencyModel, MockConfig, start_server
+
+
+@pytest.fixture
+def server():
+    servers = []
+
+    def start(**options):
+        servers.append(start_server(MockConfig(pages=2, per_page=5, seed=7, **options)))
+        return servers[-1]
+
+    yield start
+    for started in servers:
+        started.shutdown()
+        started.server_close()
+
+
+def test_latency_specs():
+    rng = random.Random(1)
+    assert LatencyModel('fixed:150').sample(rng) == 0.15
+    assert all(0.01 <= LatencyModel('uniform:10:20').sample(rng) <= 0.02 for _ in range(100))
+    with pytest.raises(ValueError):
+        LatencyModel('gaussian:10')
+
+
+def test_injected_latency_delays_responses(server):
+    mock = server(latency='fixed:100')
+    started = time.perf_counter()
+    assert requests.get(f"{mock.base_url}/some-org", timeout=5).status_code == 200
+    assert time.perf_counter() - started >= 0.1
+
+
+def test_phase2_retries_injected_429s_and_5xx(server, tmp_path, monkeypatch):
+    from phase2_detail_scraper import Phase2OrganizationScraper
+    from runtime_settings import DEFAULT_SETTINGS
+
+    # One fetch thread: the seeded fault sequence is the same on every run
+    mock = server(rate_429=0.3, rate_5xx=0.2, latency='uniform:1:5')
+    monkeypatch.chdir(tmp_path)
+    pd.DataFrame({'organization_name': [f'org{i}' for i in range(12)],
+                  'organization_url': [f'https://huggingface.co/org-{i}' for i in range(12)],
+                  'page_number': 0}).to_csv('orgs.csv', index=False)
+    settings = DEFAULT_SETTINGS._replace(concurrency=1, request_delay=0, max_retries=12, retry_delays=(0.01,))
+    scraper = Phase2OrganizationScraper('orgs.csv', 'details.csv', 'output/checkpoint.json', link_table=False,
+                                        base_url=mock.base_url, settings=settings)
+    scraper.run_phase2_scraping()
+
+    served = json.loads(requests.get(f"{mock.base_url}/__stats", timeout=5).text)
+    assert served['429'] > 0 and served.get('500', 0) + served.get('502', 0) + served.get('503', 0) > 0
+    assert scraper.status_index.counts()['success'] == 12
+    assert served['200'] == 12
+    assert scraper.stats.counters['retries'] == sum(served.values()) - 12
+    assert scraper.stats.counters['rate_limited'] == served['429']
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Test script for the SQLite full-text/lookup index over Phase 2 output (org_index.py)
+"""
+
+import pandas as pd
+
+from org_index import OrgIndex, build_index, fts_query
+
+
+def test_index_build_and_lookups(tmp_path):
+    csv_path = tmp_path / 'detailed.csv'
+    pd.DataFrame({
+        'organization_name': ['Speech Lab', 'Vision Co', 'Hugging Face'],
+        'organization_url': ['https://huggingface.co/speech', 'https://huggingface.co/vision',
+                             'https://huggingface.co/huggingface'],
+        'page_number': [0, 0, 1],
+        'github_links': ['https://github.com/speech', 'Null', 'https://github.com/huggingface'],
+        'website_links': ['Null', 'https://www.vision.co/', 'Null'],
+        'social_media_links': ['Null', 'Null', 'https://twitter.com/huggingface'],
+        'location': ['Paris', 'Null', 'NYC'],
+        'description': ['Open speech recognition models', 'Null', 'The AI community building the future'],
+        'member_count': ['12', 'Null', '300'],
+        'model_count': ['3', 'Null', '1000'],
+        'dataset_count': ['Null', 'Null', '50'],
+        'last_updated': ['2025-12-13'] * 3,
+        'scrape_status': ['success', 'error: timeout', 'success'],
+        'scrape_timestamp': ['2025-12-13T10:00:00'] * 3,
+    }).to_csv(csv_path, index=False)
+    db_path = str(tmp_path / 'orgs.db')
+
+    assert build_index(str(csv_path), db_path) == {'orgs': 3, 'links': 4}
+    index = OrgIndex(db_path)
+
+    assert [row['organization_name'] for row in index.query('speech recog')] == ['Speech Lab']
+    assert [row['organization_name'] for row in index.query('hugging')] == ['Hugging Face']
+    assert [row['organization_name'] for row in index.query(host='github.com')] == ['Speech Lab', 'Hugging Face']
+    assert [row['organization_name'] for row in index.query(host='www.vision.co')] == ['Vision Co']
+    assert [row['organization_name'] for row in index.query(status='error')] == ['Vision Co']
+    assert index.query('models', host='github.com', status='success')[0]['model_count'] == 3
+    row, = index.query(url='https://huggingface.co/vision')
+    assert row['description'] is None and row['member_count'] is None
+    assert [link['url'] for link in index.links(row['org_id'])] == ['https://www.vision.co/']
+    index.close()
+
+
+def test_fts_query_quotes_words():
+    assert fts_query('hugging "fa') == '"hugging" """fa"*'
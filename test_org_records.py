@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Test script for the compact Phase 2 checkpoint records and status index (offline)
+"""
+
+import json
+import sys
+
+import pandas as pd
+
+from org_records import CheckpointRecords, OrgRecord, checkpoint_json_default
+from status_index import StatusIndex
+
+
+def test_rescrape_replaces_record_and_round_trips():
+    """A row scraped twice keeps only its latest record, and the JSON form is unchanged"""
+    records = CheckpointRecords([{'index': 3, 'scrape_status': 'failed_after_retries', 'location': 'Null'}])
+    records.add(OrgRecord(0, scrape_status='success', location='Paris'))
+    records.add(OrgRecord(3, scrape_status='success', location='Null'))
+
+    assert [(record.index, record.scrape_status) for record in records] == [(3, 'success'), (0, 'success')]
+
+    # Repeated values built at runtime share one interned string
+    built = ''.join(['Nu', 'll'])
+    assert OrgRecord(5, location=built).location is sys.intern('Null')
+
+    data = json.loads(json.dumps({'processed_organizations': records}, default=checkpoint_json_default))
+    restored = CheckpointRecords(data['processed_organizations'])
+    assert [record.to_dict() for record in restored] == [record.to_dict() for record in records]
+    assert data['processed_organizations'][0]['index'] == 3
+
+
+def test_status_index_buckets():
+    index = StatusIndex.from_series(pd.Series(['success', None, 'error: timeout', 'failed_after_retries', '']))
+    assert index.counts() == {'pending': 2, 'success': 1, 'failed': 1, 'error': 1}
+    assert index.indices(['pending', 'error']) == [1, 2, 4]
+
+    index.update(1, 'success')
+    assert index.indices(['success']) == [0, 1]
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Test script for the background persistence writer (offline)
+"""
+
+import os
+
+import pytest
+
+from persistence_writer import PersistenceWriter, durable_open
+
+
+def test_results_are_group_committed():
+    """Results are applied in order and committed per batch, plus once at close"""
+    applied, commits = [], []
+    writer = PersistenceWriter(applied.append, lambda: commits.append(len(applied)), batch_size=4, interval=60)
+    with writer:
+        for item in range(10):
+            writer.submit(item)
+    assert applied == list(range(10))
+    assert commits == [4, 8, 10]
+
+
+def test_empty_run_still_commits_once():
+    commits = []
+    with PersistenceWriter(lambda item: None, lambda: commits.append(True)):
+        pass
+    assert commits == [True]
+
+
+@pytest.mark.parametrize('durability', ['atomic', 'fsync'])
+def test_failed_write_keeps_previous_file(tmp_path, durability):
+    path = tmp_path / 'checkpoint.json'
+    with durable_open(str(path), durability) as f:
+        f.write('old')
+
+    with pytest.raises(RuntimeError):
+        with durable_open(str(path), durability) as f:
+            f.write('partial')
+            raise RuntimeError('disk full')
+
+    assert path.read_text() == 'old'
+    assert os.listdir(tmp_path) == ['checkpoint.json']
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Test script for hash-sharded Phase 2 runs and the shard merge (offline)
+"""
+
+import pandas as pd
+import pytest
+
+from phase2_shards import merge_shards, parse_shard, select_shard, shard_path
+
+
+def make_input(tmp_path, count=50):
+    """Write a Phase 1 style CSV with one duplicated URL"""
+    urls = [f'https://huggingface.co/org-{i}' for i in range(count)] + ['https://huggingface.co/org-7']
+    df = pd.DataFrame({
+        'organization_name': [url.rsplit('/', 1)[1] for url in urls],
+        'organization_url': urls,
+        'page_number': 0,
+    })
+    path = tmp_path / 'orgs.csv'
+    df.to_csv(path, index=False)
+    return df, str(path)
+
+
+def write_shard_outputs(df, output_csv, num_shards):
+    for shard_index in range(num_shards):
+        shard_df = select_shard(df, (shard_index, num_shards)).copy()
+        shard_df['scrape_status'] = 'success'
+        shard_df.to_csv(shard_path(output_csv, (shard_index, num_shards)), index=False)
+
+
+def test_shards_are_disjoint_and_complete(tmp_path):
+    df, _ = make_input(tmp_path)
+    sizes = [len(select_shard(df, (i, 4))) for i in range(4)]
+    assert sum(sizes) == len(df)
+    assert all(size > 0 for size in sizes)
+
+
+def test_merge_restores_input_order(tmp_path):
+    df, input_csv = make_input(tmp_path)
+    output_csv = str(tmp_path / 'detailed.csv')
+    write_shard_outputs(df, output_csv, 3)
+    
+    merged = merge_shards(3, input_csv, output_csv)
+    assert merged['organization_url'].tolist() == df['organization_url'].tolist()
+    assert pd.read_csv(output_csv)['organization_url'].tolist() == df['organization_url'].tolist()
+
+
+def test_merge_detects_missing_and_duplicated(tmp_path):
+    df, input_csv = make_input(tmp_path)
+    output_csv = str(tmp_path / 'detailed.csv')
+    write_shard_outputs(df, output_csv, 2)
+    
+    path = shard_path(output_csv, (0, 2))
+    shard_df = pd.read_csv(path)
+    pd.concat([shard_df.iloc[1:], shard_df.iloc[[2]]]).to_csv(path, index=False)
+    
+    with pytest.raises(ValueError, match='1 missing.*1 duplicated'):
+        merge_shards(2, input_csv, output_csv)
+
+
+def test_parse_shard():
+    assert parse_shard('1/4') == (1, 4)
+    with pytest.raises(ValueError):
+        parse_shard('4/4')
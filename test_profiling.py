@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+Test script for the cProfile/tracemalloc wrapper (profiling.py)
+"""
+
+import os
+import pstats
+
+from profiling import ScrapeProfiler
+
+
+def build_rows(n):
+    return [{'organization_name': f'org{i}', 'links': [f'https://example.com/{i}/{j}' for j in range(5)]}
+            for i in range(n)]
+
+
+def test_profiled_block_writes_cpu_and_allocation_reports(tmp_path):
+    with ScrapeProfiler('unit', output_dir=str(tmp_path), top=10) as profiler:
+        profiler.snapshot('start')
+        rows = build_rows(2000)
+    assert len(rows) == 2000
+
+    written = {name[len(os.path.basename(profiler.prefix)):]: tmp_path / name for name in os.listdir(tmp_path)}
+    assert set(written) == {'.prof', '_cpu.txt', '_alloc_start.txt', '_alloc_end.txt', '_alloc_diff.txt'}
+    assert all(path.stat().st_size > 0 for path in written.values())
+
+    assert 'build_rows' in written['_cpu.txt'].read_text(encoding='utf-8')
+    assert any(function == 'build_rows' for _, _, function in pstats.Stats(str(written['.prof'])).stats)
+    assert written['_alloc_end.txt'].read_text(encoding='utf-8').startswith("Snapshot 'end'")
+    assert 'test_profiling.py' in written['_alloc_diff.txt'].read_text(encoding='utf-8')
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Test script for the Phase 2 stale refresh scheduler (offline)
+"""
+
+from datetime import datetime
+
+import pandas as pd
+
+from refresh_scheduler import build_refresh_queue
+
+
+def test_refresh_queue_order():
+    """Never-scraped rows first, then the most overdue; fresh rows are left out"""
+    df = pd.DataFrame({
+        'scrape_timestamp': ['2026-10-17T00:00:00', '2026-09-01T00:00:00', None, '2026-09-01T00:00:00'],
+        'model_count': ['Null', 'Null', 'Null', '1000'],
+    })
+    queue = build_refresh_queue(df, ttl_days=30, activity_weight=1.0, now=datetime(2026, 10, 18))
+    
+    order = [queue.pop()[1] for _ in range(len(queue))]
+    assert order == [2, 3, 1]
+
+
+def test_activity_weight_disabled():
+    """With weight 0 the model count does not change the TTL"""
+    df = pd.DataFrame({
+        'scrape_timestamp': ['2026-10-08T00:00:00', '2026-10-08T00:00:00'],
+        'model_count': ['Null', '1000'],
+    })
+    queue = build_refresh_queue(df, ttl_days=30, activity_weight=0, now=datetime(2026, 10, 18))
+    assert len(queue) == 0
+
+
+if __name__ == "__main__":
+    test_refresh_queue_order()
+    test_activity_weight_disabled()
+    print("All refresh scheduler tests passed")
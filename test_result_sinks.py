@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Test script for the background result sinks (result_sinks.py)
+"""
+
+import sqlite3
+import threading
+import time
+
+import pandas as pd
+
+from result_sinks import CsvSink, ResultSink, SinkWorker, SqliteSink
+
+
+class SlowSink(ResultSink):
+    """Local stand-in for a remote sheet: every upload takes `latency` seconds."""
+
+    name = 'slow'
+
+    def __init__(self, latency=0.0, failures=0):
+        self.latency = latency
+        self.failures = failures
+        self.batches = []
+        self.lock = threading.Lock()
+
+    def write(self, rows):
+        time.sleep(self.latency)
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("sheet unavailable")
+        with self.lock:
+            self.batches.append([dict(row) for row in rows])
+
+    def uploaded(self):
+        return [row for batch in self.batches for row in batch]
+
+
+def result(i, status='success', timestamp='t0'):
+    return {'organization_name': f'org{i}', 'organization_url': f'https://hf.co/org{i}',
+            'scrape_status': status, 'scrape_timestamp': timestamp}
+
+
+def test_slow_sink_does_not_block_submit():
+    sink = SlowSink(latency=0.05)
+    worker = SinkWorker(sink, batch_size=10, interval=60, max_pending=1000).start()
+    started = time.perf_counter()
+    for i in range(100):
+        worker.submit(result(i))
+    assert time.perf_counter() - started < 0.1
+    worker.close()
+
+    assert sorted(row['organization_name'] for row in sink.uploaded()) == sorted(f'org{i}' for i in range(100))
+    assert max(len(batch) for batch in sink.batches) <= 10
+
+
+def test_unchanged_results_are_not_uploaded_again():
+    sink = SlowSink()
+    worker = SinkWorker(sink, batch_size=2, interval=0.05).start()
+    worker.submit(result(1))
+    worker.submit(result(2))
+    time.sleep(0.2)
+    worker.submit(result(1, timestamp='t1'))        # only the timestamp changed
+    worker.submit(result(2, status='error: 500'))   # a real change
+    worker.close()
+
+    assert [row['organization_name'] for row in sink.uploaded()] == ['org1', 'org2', 'org2']
+    assert worker.skipped == 1
+
+
+def test_pending_results_are_coalesced_per_organization():
+    sink = SlowSink()
+    worker = SinkWorker(sink, batch_size=10, interval=60)
+    worker.submit(result(1, status='error: 500'))
+    worker.submit(result(1, status='success'))
+    worker.start().close()
+    assert sink.uploaded() == [result(1, status='success')]
+
+
+def test_backpressure_waits_for_the_sink_and_loses_nothing():
+    sink = SlowSink(latency=0.05)
+    worker = SinkWorker(sink, batch_size=5, interval=60, max_pending=5).start()
+    started = time.perf_counter()
+    for i in range(30):
+        worker.submit(result(i))
+    assert time.perf_counter() - started >= 0.1  # submit had to wait for uploads
+    worker.close()
+    assert len(sink.uploaded()) == 30
+
+
+def test_failed_upload_is_retried():
+    sink = SlowSink(failures=1)
+    worker = SinkWorker(sink, batch_size=3, interval=60, retry_delay=0).start()
+    for i in range(3):
+        worker.submit(result(i))
+    time.sleep(0.1)
+    worker.close()
+    assert len(sink.uploaded()) == 3
+    assert worker.failures == 1
+
+
+def test_csv_and_sqlite_sinks(tmp_path):
+    csv_sink = CsvSink(str(tmp_path / 'results.csv'))
+    csv_sink.write([result(1), result(2)])
+    csv_sink.write([result(1, status='error: 500')])
+    log = pd.read_csv(tmp_path / 'results.csv', dtype=str)
+    assert log['scrape_status'].tolist() == ['success', 'success', 'error: 500']
+
+    db_sink = SqliteSink(str(tmp_path / 'results.db'))
+    db_sink.open()
+    db_sink.write([result(1), result(2)])
+    db_sink.write([result(1, status='error: 500')])
+    db_sink.close()
+    rows = sqlite3.connect(tmp_path / 'results.db').execute(
+        "SELECT organization_name, scrape_status FROM results ORDER BY organization_name").fetchall()
+    assert rows == [('org1', 'error: 500'), ('org2', 'success')]
+
+
+class FakeResponse:
+    status_code = 200
+    text = '<html><body><h1>Org</h1></body></html>'
+    content = text.encode()
+
+
+def test_phase2_streams_every_result_to_its_sinks(tmp_path, monkeypatch):
+    from phase2_detail_scraper import Phase2OrganizationScraper
+    from runtime_settings import DEFAULT_SETTINGS
+
+    monkeypatch.chdir(tmp_path)
+    pd.DataFrame({'organization_name': [f'org{i}' for i in range(8)],
+                  'organization_url': [f'https://huggingface.co/org{i}' for i in range(8)],
+                  'page_number': 0}).to_csv('orgs.csv', index=False)
+    sink = SlowSink(latency=0.05)
+    scraper = Phase2OrganizationScraper('orgs.csv', 'details.csv', 'checkpoint.json', link_table=False,
+                                        settings=DEFAULT_SETTINGS._replace(request_delay=0), sinks=[sink])
+    scraper.session.get = lambda url, timeout=None: FakeResponse()
+    scraper.run_phase2_scraping()
+
+    uploaded = sink.uploaded()
+    assert sorted(row['organization_url'] for row in uploaded) == [f'https://huggingface.co/org{i}' for i in range(8)]
+    assert {row['scrape_status'] for row in uploaded} == {'success'}
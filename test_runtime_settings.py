@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Test script for runtime-adjustable scrape settings (runtime_settings.py)
+"""
+
+import json
+import threading
+import time
+
+import pandas as pd
+
+from runtime_settings import DEFAULT_SETTINGS, RuntimeSettings, validate_settings
+
+
+def write_control(path, values):
+    path.write_text(json.dumps(values), encoding='utf-8')
+
+
+def test_control_file_overrides_defaults_until_removed(tmp_path):
+    control = tmp_path / 'control.json'
+    runtime = RuntimeSettings(str(control), poll_interval=0)
+    assert runtime.current == DEFAULT_SETTINGS
+
+    seen = []
+    runtime.on_change(seen.append)
+    write_control(control, {'concurrency': 4, 'retry_delays': [1, 2]})
+    runtime.request_reload()
+    assert runtime.check()
+    assert runtime.current == DEFAULT_SETTINGS._replace(concurrency=4, retry_delays=(1.0, 2.0))
+    assert seen[-1] is runtime.current
+
+    # An invalid file keeps the last good settings
+    write_control(control, {'concurrency': 0})
+    runtime.request_reload()
+    assert not runtime.check()
+    assert runtime.current.concurrency == 4
+
+    control.unlink()
+    assert runtime.check()
+    assert runtime.current == DEFAULT_SETTINGS
+
+
+def test_validate_rejects_unknown_and_out_of_range_values():
+    for values in ({'rate': 2}, {'concurrency': 'many'}, {'request_timeout': 0}, {'retry_delays': []}):
+        try:
+            validate_settings(values)
+        except ValueError:
+            continue
+        raise AssertionError(f"accepted {values}")
+
+
+class FakeResponse:
+    status_code = 200
+    text = '<html><body><h1>Org</h1><a href="https://github.com/org">GitHub</a></body></html>'
+    content = text.encode()
+
+
+class ConcurrencyTrackingSession:
+    """Fake session that raises the control file's concurrency after a few requests."""
+
+    def __init__(self, on_request):
+        self.on_request = on_request
+        self.lock = threading.Lock()
+        self.active = self.peak_after_change = self.requests = 0
+
+    def get(self, url, timeout=None):
+        with self.lock:
+            self.requests += 1
+            self.active += 1
+            requests = self.requests
+        self.on_request(requests)
+        time.sleep(0.05)
+        with self.lock:
+            if requests > 3:
+                self.peak_after_change = max(self.peak_after_change, self.active)
+            self.active -= 1
+        return FakeResponse()
+
+
+def test_concurrency_change_applies_mid_run(tmp_path, monkeypatch):
+    from phase2_detail_scraper import Phase2OrganizationScraper
+
+    monkeypatch.chdir(tmp_path)
+    pd.DataFrame({'organization_name': [f'org{i}' for i in range(16)],
+                  'organization_url': [f'https://huggingface.co/org{i}' for i in range(16)],
+                  'page_number': 0}).to_csv('orgs.csv', index=False)
+    control = tmp_path / 'control.json'
+    scraper = Phase2OrganizationScraper('orgs.csv', 'details.csv', 'checkpoint.json', link_table=False,
+                                        settings=DEFAULT_SETTINGS._replace(request_delay=0),
+                                        control_file=str(control))
+
+    def raise_concurrency(requests):
+        if requests == 3:
+            write_control(control, {'concurrency': 4, 'request_delay': 0})
+            scraper.runtime.request_reload()
+
+    session = ConcurrencyTrackingSession(raise_concurrency)
+    scraper.session = session
+    scraper.run_phase2_scraping()
+
+    assert session.requests == 16
+    assert scraper.settings.concurrency == 4
+    assert session.peak_after_change > 1
+    assert scraper.status_index.counts()['success'] == 16
+
+
+class Interrupted(Exception):
+    pass
+
+
+class SlowFirstRowSession:
+    """Fake session: org0 is slow and then dies (a crash mid-request); every other org succeeds."""
+
+    def __init__(self, fail_first=True):
+        self.fail_first = fail_first
+        self.urls = []
+
+    def get(self, url, timeout=None):
+        self.urls.append(url)
+        if url.endswith('/org0') and self.fail_first:
+            time.sleep(0.2)
+            raise Interrupted(url)
+        return FakeResponse()
+
+
+def test_rows_in_flight_at_an_interrupt_are_scraped_on_resume(tmp_path, monkeypatch):
+    from phase2_detail_scraper import Phase2OrganizationScraper
+
+    monkeypatch.chdir(tmp_path)
+    pd.DataFrame({'organization_name': [f'org{i}' for i in range(16)],
+                  'organization_url': [f'https://huggingface.co/org{i}' for i in range(16)],
+                  'page_number': 0}).to_csv('orgs.csv', index=False)
+    settings = DEFAULT_SETTINGS._replace(concurrency=4, request_delay=0)
+
+    def make_scraper():
+        return Phase2OrganizationScraper('orgs.csv', 'details.csv', 'output/checkpoint.json', link_table=False,
+                                         settings=settings)
+
+    scraper = make_scraper()
+    scraper.session = SlowFirstRowSession()
+    try:
+        scraper.run_phase2_scraping()
+    except Interrupted:
+        pass
+    else:
+        raise AssertionError("the first run was not interrupted")
+    # Rows after org0 finished first, but org0 never did
+    assert scraper.status_index.counts()['success'] == 15
+    assert scraper.checkpoint_data['last_processed_index'] == 0
+
+    resumed = make_scraper()
+    resumed.session = SlowFirstRowSession(fail_first=False)
+    resumed.run_phase2_scraping()
+    assert resumed.session.urls == ['https://huggingface.co/org0']
+    assert resumed.status_index.counts()['success'] == 16
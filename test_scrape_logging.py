@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Test script for the JSON-lines event log (offline)
+"""
+
+import json
+import logging
+import threading
+
+from scrape_logging import EventLog
+
+
+def test_events_written_and_successes_sampled(tmp_path, caplog):
+    """Every event reaches the file; only a sample of successes reaches the logger"""
+    path = tmp_path / 'events.jsonl'
+    events = EventLog(str(path), logging.getLogger('test_events'), success_sample_rate=0.25)
+
+    with caplog.at_level(logging.INFO, logger='test_events'):
+        for row in range(20):
+            events.record({'row': row, 'status': 'success'}, True, f"[OK] row {row}")
+        events.record({'row': 20, 'status': 'failed'}, False, "[ERROR] row 20")
+    events.close()
+
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [event['row'] for event in lines] == list(range(21))
+    assert all('ts' in event for event in lines)
+
+    messages = [record.getMessage() for record in caplog.records]
+    assert len([message for message in messages if message.startswith('[OK]')]) == 5
+    assert "[ERROR] row 20" in messages
+
+
+def test_sampling_is_exact_across_fetch_threads(tmp_path, caplog):
+    """Concurrent record() calls share one sampling credit"""
+    events = EventLog(str(tmp_path / 'events.jsonl'), logging.getLogger('test_events'), success_sample_rate=0.5)
+
+    def record_many():
+        for row in range(1000):
+            events.record({'row': row}, True, "[OK]")
+
+    with caplog.at_level(logging.INFO, logger='test_events'):
+        threads = [threading.Thread(target=record_many) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    events.close()
+
+    assert len([record for record in caplog.records if record.getMessage() == '[OK]']) == 4000
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Test script for latency percentiles, throughput/ETA and duration formatting (scrape_stats.py)
+"""
+
+import pytest
+
+import scrape_stats
+from scrape_stats import LatencyHistogram, ScrapeStats, format_seconds
+
+
+def test_percentiles_of_known_latencies():
+    histogram = LatencyHistogram()
+    for ms in range(1, 101):  # 1ms .. 100ms
+        histogram.record(ms / 1000)
+
+    # Buckets are ~12% wide, so estimates land within one bucket of the exact value
+    assert histogram.percentile(50) == pytest.approx(0.050, rel=0.12)
+    assert histogram.percentile(90) == pytest.approx(0.090, rel=0.12)
+    assert histogram.percentile(99) == pytest.approx(0.099, rel=0.12)
+    assert histogram.percentile(100) == 0.100
+    summary = histogram.summary()
+    assert summary['count'] == 100 and summary['mean'] == pytest.approx(0.0505)
+    assert LatencyHistogram().percentile(50) == 0.0
+
+
+def test_percentile_is_capped_at_the_slowest_observation():
+    histogram = LatencyHistogram()
+    for seconds in (0.2, 0.2, 0.2, 5000.0):  # 5000s is past the last bucket bound
+        histogram.record(seconds)
+    assert histogram.percentile(50) <= 0.2
+    assert histogram.percentile(99) == 5000.0
+
+
+class Clock:
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def test_eta_uses_the_recent_rate(monkeypatch):
+    clock = Clock(1000.0)
+    monkeypatch.setattr(scrape_stats.time, 'time', clock)
+    stats = ScrapeStats('orgs')
+
+    # Slow start: 1 org in the first 100s, then 1 org per second
+    clock.now += 100
+    stats.item_done()
+    for _ in range(10):
+        clock.now += 1
+        stats.item_done()
+
+    snapshot = stats.snapshot(remaining=30)
+    assert snapshot['completed'] == 11
+    assert snapshot['rate_per_second'] == pytest.approx(11 / 110)
+    assert snapshot['recent_rate_per_second'] == pytest.approx(10 / 10)
+    assert snapshot['eta_seconds'] == pytest.approx(30)
+    assert 'ETA 30.0s (30 remaining)' in stats.format_line(snapshot)
+
+
+def test_eta_falls_back_to_the_run_average(monkeypatch):
+    clock = Clock(1000.0)
+    monkeypatch.setattr(scrape_stats.time, 'time', clock)
+    stats = ScrapeStats('pages')
+    assert stats.snapshot(remaining=5)['eta_seconds'] is None  # nothing done yet
+
+    clock.now += 20
+    stats.item_done()
+    snapshot = stats.snapshot(remaining=5)
+    assert snapshot['recent_rate_per_second'] is None
+    assert snapshot['eta_seconds'] == pytest.approx(100)
+
+
+@pytest.mark.parametrize('seconds, text', [
+    (0.85, '850ms'), (2.34, '2.3s'), (252, '4m12s'), (3 * 3600 + 5 * 60, '3h05m'),
+    (52 * 3600, '2d04h'),
+])
+def test_format_seconds(seconds, text):
+    assert format_seconds(seconds) == text
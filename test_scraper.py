@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Test script for concurrent and batched scraping and the result cache in
+src.scraper (offline, stubbed Firecrawl client with configurable latency)
+"""
+
+import os
+import threading
+import time
+
+from src.result_cache import ResultCache, cache_key
+from src.scraper import BATCH_STATUS_MAX_ERRORS, FirecrawlScraper, _match_batch
+
+
+class StubFirecrawl:
+    """scrape_url and batch job endpoints that take `latency` seconds per call."""
+
+    def __init__(self, latency=0.05, fail=()):
+        self.latency = latency
+        self.fail = set(fail)
+        self.lock = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+        self.batches = {}
+        self.polls = 0
+
+    def scrape_url(self, url, **kwargs):
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.latency)
+            if url in self.fail:
+                raise RuntimeError("boom")
+            return {"markdown": f"content of {url}", "metadata": {"sourceURL": url}}
+        finally:
+            with self.lock:
+                self.active -= 1
+
+    def async_batch_scrape_urls(self, urls, **kwargs):
+        job_id = f"job{len(self.batches)}"
+        self.batches[job_id] = (list(urls), time.monotonic() + self.latency)
+        return {"success": True, "id": job_id}
+
+    def check_batch_scrape_status(self, job_id):
+        self.polls += 1
+        urls, ready_at = self.batches[job_id]
+        if time.monotonic() < ready_at:
+            return {"status": "scraping", "data": []}
+        return {"status": "completed",
+                "data": [{"markdown": f"content of {url}", "metadata": {"sourceURL": url}}
+                         for url in urls if url not in self.fail]}
+
+
+def make_scraper(tmp_path, monkeypatch, app):
+    monkeypatch.chdir(tmp_path)
+    return FirecrawlScraper("test-key", app=app)
+
+
+def test_concurrent_scraping_is_bounded_and_streams(tmp_path, monkeypatch):
+    app = StubFirecrawl(latency=0.05, fail={"https://example.com/3"})
+    scraper = make_scraper(tmp_path, monkeypatch, app)
+    urls = [f"https://example.com/{i}" for i in range(20)]
+
+    started = time.monotonic()
+    results = scraper.scrape_urls(urls, concurrency=5)
+    first_url, first = next(results)
+    assert first is None or first["metadata"]["sourceURL"] == first_url
+    results = dict([(first_url, first), *results])
+    elapsed = time.monotonic() - started
+
+    assert set(results) == set(urls)
+    assert {url for url, result in results.items() if result is None} == app.fail
+    assert app.max_active == 5
+    assert elapsed < 20 * app.latency / 2  # well under the serial time
+
+
+def test_serial_mode_keeps_input_order(tmp_path, monkeypatch):
+    app = StubFirecrawl(latency=0)
+    scraper = make_scraper(tmp_path, monkeypatch, app)
+    urls = [f"https://example.com/{i}" for i in range(5)]
+    assert [url for url, _ in scraper.scrape_urls(urls)] == urls
+    assert app.max_active == 1
+
+
+def test_batch_jobs_are_polled_until_complete(tmp_path, monkeypatch):
+    app = StubFirecrawl(latency=0.05, fail={"https://example.com/7"})
+    scraper = make_scraper(tmp_path, monkeypatch, app)
+    urls = [f"https://example.com/{i}" for i in range(10)]
+
+    results = dict(scraper.scrape_urls(urls, concurrency=2, batch_size=4, poll_interval=0.01))
+    assert set(results) == set(urls)
+    assert {url for url, result in results.items() if result is None} == app.fail
+    assert [len(batch) for batch, _ in app.batches.values()] == [4, 4, 2]
+    assert app.polls > len(app.batches)  # jobs were polled while still running
+
+
+
+def test_batch_results_map_to_submitted_urls(tmp_path, monkeypatch):
+    app = StubFirecrawl(latency=0, fail={"https://example.com/1"})
+    status = app.check_batch_scrape_status
+
+    def redirected(job_id):
+        result = status(job_id)
+        for document in result["data"]:
+            if document["metadata"]["sourceURL"] == "https://example.com/2":
+                document["metadata"]["sourceURL"] = "https://www.example.com/2/"
+        return result
+
+    app.check_batch_scrape_status = redirected
+    scraper = make_scraper(tmp_path, monkeypatch, app)
+    put = scraper.cache.put
+
+    def flaky_put(key, url, result):
+        if url == "https://example.com/0":
+            raise OSError("disk full")
+        put(key, url, result)
+
+    scraper.cache.put = flaky_put
+    urls = [f"https://example.com/{i}" for i in range(4)]
+    results = dict(scraper.scrape_urls(urls, batch_size=4, poll_interval=0.01))
+    assert results["https://example.com/1"] is None
+    assert sorted(url for url, result in results.items() if result) == \
+        ["https://example.com/0", "https://example.com/2", "https://example.com/3"]
+    assert results["https://example.com/2"]["markdown"] == "content of https://example.com/2"
+
+    # The redirected URL was cached under the submitted URL; the failed cache write only skipped its own URL
+    assert scraper.scrape_url("https://example.com/2") == results["https://example.com/2"]
+    assert scraper.cache.get(cache_key("https://example.com/3", {})) is not None
+    assert scraper.cache.get(cache_key("https://example.com/0", {})) is None
+
+
+def test_reordered_batch_documents_match_their_own_urls():
+    doc = lambda url: {"markdown": f"content of {url}", "metadata": {"sourceURL": url}}
+    batch = ["https://a.com/1", "https://a.com/2", "https://a.com/3"]
+    # Same count as the batch, returned out of order
+    assert _match_batch(batch, [doc("https://a.com/2"), doc("https://a.com/3"), doc("https://a.com/1")]) == \
+        [("https://a.com/2", doc("https://a.com/2")), ("https://a.com/3", doc("https://a.com/3")),
+         ("https://a.com/1", doc("https://a.com/1"))]
+    # Leftover documents (no usable URL) take the leftover URLs by position
+    anonymous = {"markdown": "redirected", "metadata": {"sourceURL": "https://elsewhere.com/"}}
+    assert _match_batch(batch, [doc("https://a.com/3"), anonymous, doc("https://a.com/1")]) == \
+        [("https://a.com/3", doc("https://a.com/3")), ("https://a.com/2", anonymous),
+         ("https://a.com/1", doc("https://a.com/1"))]
+
+
+def test_failed_batches_yield_none_for_each_url(tmp_path, monkeypatch):
+    app = StubFirecrawl(latency=0)
+    submit = app.async_batch_scrape_urls
+
+    def submit_or_fail(urls, **kwargs):
+        if "https://example.com/0" in urls:
+            raise ConnectionError("submit failed")
+        return submit(urls, **kwargs)
+
+    def unreachable(job_id):
+        app.polls += 1
+        raise ConnectionError("status endpoint down")
+
+    app.async_batch_scrape_urls = submit_or_fail
+    app.check_batch_scrape_status = unreachable
+    scraper = make_scraper(tmp_path, monkeypatch, app)
+    urls = [f"https://example.com/{i}" for i in range(4)]
+
+    # Terminates although every status check fails; every URL is reported
+    results = list(scraper.scrape_urls(urls, concurrency=2, batch_size=2, poll_interval=0.001))
+    assert sorted(results) == [(url, None) for url in urls]
+    assert app.polls == BATCH_STATUS_MAX_ERRORS
+
+def test_results_are_cached_under_a_stable_key(tmp_path, monkeypatch):
+    app = StubFirecrawl(latency=0)
+    calls = []
+    scrape = app.scrape_url
+    app.scrape_url = lambda url, **kwargs: calls.append(url) or scrape(url, **kwargs)
+
+    scraper = make_scraper(tmp_path, monkeypatch, app)
+    first = scraper.scrape_and_save("https://example.com/a", formats=["markdown"])
+    # A new scraper (as in a later run) finds the saved result; other options are a different entry
+    scraper = make_scraper(tmp_path, monkeypatch, app)
+    assert scraper.scrape_url("https://example.com/a", formats=["markdown"]) == first
+    scraper.scrape_url("https://example.com/a", formats=["html"])
+    assert calls == ["https://example.com/a"] * 2
+    assert scraper.cache_stats()["hit_rate"] == 0.5
+
+    key = cache_key("https://example.com/a", {"formats": ["markdown"]})
+    assert key == cache_key(" https://example.com/a", {"formats": ["markdown"]})
+    assert (tmp_path / "output" / f"scraped_{key[:16]}.json").exists()
+
+
+def test_cache_ttl_and_size_eviction(tmp_path):
+    cache = ResultCache(tmp_path / "cache", ttl=60, max_bytes=2000)
+    cache.put("old", "https://example.com/old", {"markdown": "x" * 500})
+    os.utime(tmp_path / "cache" / "old.json", (0, 0))  # least recently used
+    for i in range(3):
+        cache.put(f"k{i}", f"https://example.com/{i}", {"markdown": "x" * 500})
+    assert cache.get("old") is None and cache.evictions >= 1
+    assert cache.get("k2") == {"markdown": "x" * 500}
+
+    cache.ttl = 1e-9
+    assert cache.get("k2") is None and "k2" not in {p.stem for p in (tmp_path / "cache").iterdir()}
+
+
+def test_malformed_cache_entries_are_misses(tmp_path):
+    cache = ResultCache(tmp_path / "cache", ttl=60)
+    (tmp_path / "cache" / "truncated.json").write_text('{"url": "https://exa', encoding="utf-8")
+    (tmp_path / "cache" / "no_time.json").write_text('{"url": "https://example.com", "result": {}}', encoding="utf-8")
+    (tmp_path / "cache" / "a_list.json").write_text('[1, 2]', encoding="utf-8")
+    assert [cache.get(key) for key in ("truncated", "no_time", "a_list")] == [None, None, None]
+    assert cache.misses == 3 and cache.hits == 0
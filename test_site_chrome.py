@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""
+Test script for the site chrome link filter (offline)
+"""
+
+from site_chrome import ChromeFilter
+
+
+def test_learns_links_on_nearly_every_page():
+    chrome = ChromeFilter(threshold=0.6, min_pages=20, halflife=100)
+    for page in range(40):
+        links = ['https://apply.workable.com/huggingface/', f'https://org-{page}.example.com']
+        if page % 2:
+            links.append('https://status.huggingface.co/')  # every other page: below the threshold
+        chrome.observe(links)
+    assert chrome.chrome == {'https://apply.workable.com/huggingface/'}
+
+
+def test_forgets_links_that_stop_appearing():
+    chrome = ChromeFilter(threshold=0.6, min_pages=20, halflife=20)
+    for page in range(40):
+        chrome.observe(['https://old-banner.example.com'])
+    assert 'https://old-banner.example.com' in chrome.chrome
+
+    for page in range(200):
+        chrome.observe([f'https://org-{page}.example.com'])
+    assert not chrome.chrome
+    assert len(chrome) < 100  # one-off links are pruned
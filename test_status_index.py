@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Test script for the Phase 2 status index and --only-status retry mode (offline)
+"""
+
+import json
+
+import pandas as pd
+
+from status_index import StatusIndex, status_bucket
+
+STATUSES = ['success', 'failed_after_retries', None, 'error: timeout', 'success', '', 'error: 500']
+
+
+def test_index_buckets_a_scrape_status_column():
+    index = StatusIndex.from_series(pd.Series(STATUSES))
+    assert [status_bucket(status) for status in STATUSES] == \
+        ['success', 'failed', 'pending', 'error', 'success', 'pending', 'error']
+    assert index.counts() == {'pending': 2, 'success': 2, 'failed': 1, 'error': 2}
+    assert index.indices(['failed', 'error']) == [1, 3, 6]
+
+    index.update(3, 'success')
+    index.update(8, 'error: 404')  # rows past the end grow the index
+    assert index.indices(['failed', 'error']) == [1, 6, 8]
+    assert index.indices(['pending']) == [2, 5, 7]
+
+
+class FakeResponse:
+    status_code = 200
+    text = '<html><body><h1>Org</h1></body></html>'
+    content = text.encode()
+
+
+class RecordingSession:
+    def __init__(self):
+        self.urls = []
+
+    def get(self, url, timeout=None):
+        self.urls.append(url)
+        return FakeResponse()
+
+
+def test_only_status_scrapes_failed_and_error_rows(tmp_path, monkeypatch):
+    from phase2_detail_scraper import Phase2OrganizationScraper
+
+    monkeypatch.chdir(tmp_path)
+    pd.DataFrame({'organization_name': [f'org{i}' for i in range(len(STATUSES))],
+                  'organization_url': [f'https://huggingface.co/org{i}' for i in range(len(STATUSES))],
+                  'page_number': 0, 'scrape_status': STATUSES}).to_csv('orgs.csv', index=False)
+    (tmp_path / 'output').mkdir()
+    (tmp_path / 'output' / 'checkpoint.json').write_text(
+        json.dumps({'last_processed_index': 4, 'processed_organizations': []}), encoding='utf-8')
+
+    scraper = Phase2OrganizationScraper('orgs.csv', 'details.csv', 'output/checkpoint.json', link_table=False)
+    scraper.session = RecordingSession()
+    scraper.throttle.set_rate(0)
+    scraper.run_only_status(['failed', 'error'])
+
+    assert scraper.session.urls == [f'https://huggingface.co/org{i}' for i in (1, 3, 6)]
+    assert scraper.status_index.counts() == {'pending': 2, 'success': 5, 'failed': 0, 'error': 0}
+    assert scraper.checkpoint_data['last_processed_index'] == 4
+    with open('output/checkpoint.json', encoding='utf-8') as f:
+        assert json.load(f)['last_processed_index'] == 4
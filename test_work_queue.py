@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Test script for the lease-based SQLite work queue (offline)
+"""
+
+import time
+
+from work_queue import WorkQueue
+
+
+def test_expired_lease_returns_to_queue(tmp_path):
+    """A task leased by a worker that died is picked up by another worker"""
+    db_path = str(tmp_path / 'queue.db')
+    worker_a, worker_b = WorkQueue(db_path), WorkQueue(db_path)
+    worker_a.enqueue('pages', [(page, {'page': page}) for page in range(4)])
+    
+    leased_a = worker_a.lease('pages', 'a', batch_size=2, lease_seconds=0.05)
+    leased_b = worker_b.lease('pages', 'b', batch_size=10, lease_seconds=60)
+    assert [task.key for task in leased_a] == ['0', '1']
+    assert [task.key for task in leased_b] == ['2', '3']
+    
+    time.sleep(0.1)
+    reclaimed = worker_b.lease('pages', 'b', batch_size=10, lease_seconds=60)
+    assert [task.key for task in reclaimed] == ['0', '1']
+    assert reclaimed[0].attempts == 2
+
+
+def test_completion_is_recorded_once(tmp_path):
+    queue = WorkQueue(str(tmp_path / 'queue.db'))
+    queue.enqueue('orgs', [('7', {'index': 7})])
+    assert queue.enqueue('orgs', [('7', {'index': 7})]) == 0
+    
+    queue.lease('orgs', 'a', batch_size=1, lease_seconds=60)
+    assert queue.complete('orgs', '7', {'scrape_status': 'success'})
+    assert not queue.complete('orgs', '7', {'scrape_status': 'success'})
+    assert list(queue.results('orgs')) == [('7', {'index': 7}, {'scrape_status': 'success'})]
+    assert queue.stats('orgs')['done'] == 1
+
+
+def test_fail_retries_until_max_attempts(tmp_path):
+    queue = WorkQueue(str(tmp_path / 'queue.db'))
+    queue.enqueue('pages', [('0', {'page': 0})])
+    
+    queue.lease('pages', 'a', batch_size=1, lease_seconds=60)
+    assert queue.fail('pages', '0', 'timeout', max_attempts=2)
+    queue.lease('pages', 'a', batch_size=1, lease_seconds=60)
+    assert not queue.fail('pages', '0', 'timeout', max_attempts=2)
+    assert queue.stats('pages')['failed'] == 1
+
+
+def test_expired_lease_fails_after_max_attempts(tmp_path):
+    """A task whose worker dies on every attempt is failed instead of re-leased forever"""
+    queue = WorkQueue(str(tmp_path / 'queue.db'))
+    queue.enqueue('orgs', [('0', {'index': 0}), ('1', {'index': 1})])
+    
+    assert len(queue.lease('orgs', 'a', batch_size=1, lease_seconds=0.01, max_attempts=2)) == 1
+    time.sleep(0.05)
+    reclaimed = queue.lease('orgs', 'b', batch_size=1, lease_seconds=0.01, max_attempts=2)
+    assert [(task.key, task.attempts) for task in reclaimed] == [('0', 2)]
+    time.sleep(0.05)
+    
+    assert [task.key for task in queue.lease('orgs', 'c', batch_size=10, lease_seconds=60, max_attempts=2)] == ['1']
+    assert queue.stats('orgs')['failed'] == 1
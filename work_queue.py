@@ -0,0 +1,206 @@
+"""
+Lease-Based Work Queue
+SQLite (WAL mode) task queue shared by any number of scraper processes.
+Workers lease batches of tasks with an expiry, renew while working and record
+completions; leases that expire (worker killed or stuck) go back to the queue
+automatically, so workers can be added or removed mid-run.
+"""
+
+import json
+import os
+import socket
+import sqlite3
+import time
+from collections import namedtuple
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+Task = namedtuple('Task', ['key', 'payload', 'attempts'])
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    queue TEXT NOT NULL,
+    task_key TEXT NOT NULL,
+    payload TEXT,
+    status TEXT NOT NULL DEFAULT 'pending',
+    lease_owner TEXT,
+    lease_expires REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    result TEXT,
+    error TEXT,
+    updated_at REAL,
+    PRIMARY KEY (queue, task_key)
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks (queue, status, lease_expires);
+"""
+
+
+def default_worker_id() -> str:
+    """Worker id that is unique per host and process."""
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+class WorkQueue:
+    """SQLite-backed queue of named task lists (e.g. 'pages', 'orgs')."""
+    
+    def __init__(self, db_path: str, busy_timeout: float = 30.0):
+        """
+        Open (and create if needed) the queue database.
+        
+        Args:
+            db_path: Path to the SQLite file (may be on a shared filesystem)
+            busy_timeout: Seconds to wait for a lock held by another worker
+        """
+        self.db_path = db_path
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        # Autocommit mode; write transactions are opened explicitly with BEGIN IMMEDIATE
+        self.conn = sqlite3.connect(db_path, timeout=busy_timeout, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+    
+    def close(self):
+        """Close the database connection."""
+        self.conn.close()
+    
+    @contextmanager
+    def _transaction(self):
+        """Write transaction that takes the database lock up front."""
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield self.conn
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+        self.conn.execute("COMMIT")
+    
+    def enqueue(self, queue: str, items: Iterable[Tuple[str, Dict]]) -> int:
+        """
+        Add tasks to a queue; keys that already exist are left untouched.
+        
+        Args:
+            queue: Queue name
+            items: Iterable of (task_key, payload dict)
+            
+        Returns:
+            Number of new tasks added
+        """
+        now = time.time()
+        rows = [(queue, str(key), json.dumps(payload), now) for key, payload in items]
+        with self._transaction() as conn:
+            before = conn.total_changes
+            conn.executemany(
+                "INSERT OR IGNORE INTO tasks (queue, task_key, payload, updated_at) VALUES (?, ?, ?, ?)", rows)
+            return conn.total_changes - before
+    
+    def lease(self, queue: str, worker_id: str, batch_size: int, lease_seconds: float,
+              max_attempts: Optional[int] = None) -> List[Task]:
+        """
+        Lease up to batch_size tasks: pending ones first, then ones whose lease expired.
+        
+        Args:
+            queue: Queue name
+            worker_id: Id of the leasing worker
+            batch_size: Maximum number of tasks to lease
+            lease_seconds: Lease duration; renew() before it runs out
+            max_attempts: Expired leases that already used this many attempts are marked
+                          'failed' instead of being leased again (None: no limit)
+            
+        Returns:
+            Leased tasks in enqueue order (empty when nothing is available)
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            if max_attempts is not None:
+                # A task that keeps killing or stalling its worker must not be reclaimed forever
+                conn.execute(
+                    "UPDATE tasks SET status = 'failed', error = 'lease expired', lease_owner = NULL, "
+                    "lease_expires = NULL, updated_at = ? WHERE queue = ? AND status = 'leased' "
+                    "AND lease_expires < ? AND attempts >= ?", (now, queue, now, max_attempts))
+            rows = conn.execute(
+                "SELECT task_key, payload, attempts FROM tasks "
+                "WHERE queue = ? AND (status = 'pending' OR (status = 'leased' AND lease_expires < ?)) "
+                "ORDER BY rowid LIMIT ?", (queue, now, batch_size)).fetchall()
+            conn.executemany(
+                "UPDATE tasks SET status = 'leased', lease_owner = ?, lease_expires = ?, "
+                "attempts = attempts + 1, updated_at = ? WHERE queue = ? AND task_key = ?",
+                [(worker_id, now + lease_seconds, now, queue, key) for key, _, _ in rows])
+        return [Task(key, json.loads(payload), attempts + 1) for key, payload, attempts in rows]
+    
+    def renew(self, queue: str, worker_id: str, keys: List[str], lease_seconds: float):
+        """Extend this worker's leases on the given tasks."""
+        if not keys:
+            return
+        now = time.time()
+        with self._transaction() as conn:
+            conn.execute(
+                f"UPDATE tasks SET lease_expires = ?, updated_at = ? WHERE queue = ? AND lease_owner = ? "
+                f"AND status = 'leased' AND task_key IN ({','.join('?' * len(keys))})",
+                (now + lease_seconds, now, queue, worker_id, *[str(key) for key in keys]))
+    
+    def complete(self, queue: str, key: str, result: Optional[Dict] = None) -> bool:
+        """
+        Record a finished task with its result.
+        
+        A task whose lease expired and was re-leased is still accepted from the
+        first worker to finish; later completions of the same task are ignored.
+        
+        Returns:
+            True if this call completed the task, False if it was already done
+        """
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE tasks SET status = 'done', result = ?, error = NULL, lease_owner = NULL, "
+                "lease_expires = NULL, updated_at = ? WHERE queue = ? AND task_key = ? AND status != 'done'",
+                (json.dumps(result), time.time(), queue, str(key)))
+            return cursor.rowcount == 1
+    
+    def fail(self, queue: str, key: str, error: str, max_attempts: int) -> bool:
+        """
+        Record a failed attempt; the task is retried until max_attempts is reached.
+        
+        Returns:
+            True if the task will be retried, False if it is now permanently failed (or already done)
+        """
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE tasks SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, "
+                "error = ?, lease_owner = NULL, lease_expires = NULL, updated_at = ? "
+                "WHERE queue = ? AND task_key = ? AND status = 'leased'",
+                (max_attempts, error, time.time(), queue, str(key)))
+            row = conn.execute("SELECT status FROM tasks WHERE queue = ? AND task_key = ?",
+                               (queue, str(key))).fetchone()
+        return row is not None and row[0] == 'pending'
+    
+    def release(self, queue: str, worker_id: str) -> int:
+        """Return all of this worker's leased tasks to the queue (graceful shutdown)."""
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE tasks SET status = 'pending', attempts = MAX(attempts - 1, 0), lease_owner = NULL, "
+                "lease_expires = NULL, updated_at = ? WHERE queue = ? AND lease_owner = ? AND status = 'leased'",
+                (time.time(), queue, worker_id))
+            return cursor.rowcount
+    
+    def queues(self) -> List[str]:
+        """Names of the queues that have tasks."""
+        return [row[0] for row in self.conn.execute("SELECT DISTINCT queue FROM tasks ORDER BY queue")]
+    
+    def stats(self, queue: str) -> Dict[str, int]:
+        """Task counts per status; expired leases are reported as 'expired'."""
+        counts = {'pending': 0, 'leased': 0, 'expired': 0, 'done': 0, 'failed': 0}
+        rows = self.conn.execute(
+            "SELECT CASE WHEN status = 'leased' AND lease_expires < ? THEN 'expired' ELSE status END, COUNT(*) "
+            "FROM tasks WHERE queue = ? GROUP BY 1", (time.time(), queue)).fetchall()
+        counts.update(dict(rows))
+        return counts
+    
+    def results(self, queue: str) -> Iterator[Tuple[str, Dict, Optional[Dict]]]:
+        """Iterate (task_key, payload, result) of completed tasks in enqueue order."""
+        cursor = self.conn.execute(
+            "SELECT task_key, payload, result FROM tasks WHERE queue = ? AND status = 'done' ORDER BY rowid",
+            (queue,))
+        for key, payload, result in cursor:
+            yield key, json.loads(payload), json.loads(result) if result is not None else None